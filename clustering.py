@@ -7,7 +7,6 @@ from scipy.spatial.distance import cosine as cosine_dist
 from sklearn.metrics.pairwise import euclidean_distances
 from sklearn.metrics import pairwise
 import sklearn.preprocessing as preprocessing
-from sklearn.metrics import silhouette_score
 from sklearn.metrics import silhouette_samples
 
 from keras.layers.convolutional import MaxPooling2D
@@ -25,7 +24,7 @@ import numpy as np
 import warnings
 import csv
 from multiprocessing import Pool
-from multiprocessing import cpu_count
+from helpers.parallel import get_n_jobs
 from functools import partial
 import collections
 import operator
@@ -38,6 +37,19 @@ from helpers.mathhelper import plot_samples
 from helpers.mathhelper import subtract_mean
 from helpers.mathhelper import get_freq_percents
 from helpers.mathhelper import convert_onehot_to_index
+from streaming_kmeans import StreamingKMeans
+from streaming_kmeans import open_vecs_memmap
+from streaming_kmeans import iter_blocks
+from helpers.warm_start import load_warm_centers
+from helpers.warm_start import save_warm_centers
+from helpers.convergence import ConvergenceMonitor
+from helpers.convergence import fit_stepwise
+from helpers.convergence import fit_minibatch
+from helpers.convergence import needs_monitor
+from helpers.cluster_quality import QualityScorer
+from helpers.k_selection import select_k
+from helpers.k_selection import is_k_range
+from helpers.profiler import PROFILER as prof
 #from custom_kmeans.k_means_ import KMeans
 from sklearn.cluster import KMeans
 from spherecluster import SphericalKMeans
@@ -48,13 +60,27 @@ import matplotlib.pyplot as plt
 import matplotlib.cm as cm
 
 
-def kmeans(input_data, k, batch_size, metric='sp', pre_txt=''):
+def kmeans(input_data, k, batch_size, metric='sp', pre_txt='', init=None,
+        monitor=None, scorer=None, k_criterion='silhouette', random_state=None):
     """
     The actual method to perform k-means.
 
-    :param k: The number of clusters
+    :param k: The number of clusters. For 'sp' this can also be a list or
+    range of candidates. The candidates are fitted in parallel, the best one
+    according to k_criterion is returned and the scoring table of all of them
+    is kept as k_selection_ on the returned predictor.
     :param batch_size: The batch_size used for MiniBatchKMeans
     :param metric: The distance metric to use.
+    :param init: Optional array of k initial centers to warm start from. A
+    single run is then done from these centers instead of several from
+    k-means++ seeds.
+    :param monitor: Optional ConvergenceMonitor. It records every iteration
+    and stops the clustering early according to its settings.
+    :param scorer: The QualityScorer used to log the quality of the
+    clustering. Defaults to the sampled silhouette computed in line.
+    :param k_criterion: How the candidate ks are compared, see select_k.
+    :param random_state: The seed of the clustering. None for unseeded, except
+    for MiniBatchKMeans which then keeps its fixed seed.
 
     :returns: The cluster centers.
     """
@@ -62,28 +88,57 @@ def kmeans(input_data, k, batch_size, metric='sp', pre_txt=''):
     ph.disp(pre_txt + 'Performing %s kmeans on %i vectors %s' % (metric, len(input_data), input_data.shape), ph.OKBLUE)
 
     # Check that there are actually enough samples to perform k-means
-    if (k > len(input_data) or batch_size > len(input_data)):
+    if (np.max(k) > len(input_data) or batch_size > len(input_data)):
         ph.disp('Too few samples for k-means. ' +
-                'There are only %i samples while k is %i and batch size is %i' %
-                (len(input_data), k, batch_size), ph.FAIL)
+                'There are only %i samples while k is %s and batch size is %i' %
+                (len(input_data), str(k), batch_size), ph.FAIL)
         raise ValueError()
 
+    if is_k_range(k) and metric != 'sp':
+        raise ValueError('Selecting k is only supported for sp, not %s' % metric)
+
     # For the context of this problem only the spherical k-means methods make sense.
     # However, the von mises fisher mixture method is not converging.
     # Therefore, I recommend always using SphericalKMeans
 
+    if init is not None:
+        init = preprocessing.normalize(np.array(init, dtype=input_data.dtype))
+
+    # The time budget covers the whole call.
+    if monitor is not None:
+        monitor.start()
+
+    if scorer is None:
+        scorer = QualityScorer()
+
     if metric == 'km':
-        km = KMeans(n_clusters=k, n_init=10, n_jobs = -1)
+        if init is None:
+            km = KMeans(n_clusters=k, n_init=10, n_jobs = get_n_jobs(),
+                    random_state=random_state)
+        else:
+            km = KMeans(n_clusters=k, init=init, n_init=1, n_jobs = get_n_jobs(),
+                    random_state=random_state)
 
         # Ignore the excessive warnings that sklearn displays
         with warnings.catch_warnings():
             warnings.simplefilter("ignore")
-            km.fit(input_data)
+            if monitor is None:
+                km.fit(input_data)
+            else:
+                fit_stepwise(km, input_data, monitor)
         return km.cluster_centers_, km.labels_
 
     elif metric == 'sp':
         # Spherical clustering.
 
+        if is_k_range(k):
+            input_data = preprocessing.normalize(input_data)
+            skm, k_table = select_k(input_data, k, criterion=k_criterion,
+                    random_state=0 if random_state is None else random_state,
+                    pre_txt=pre_txt)
+            skm.k_selection_ = k_table
+            return skm.cluster_centers_, skm.labels_, skm
+
         all_search_data = []
         min_index = -1
         min_cluster_centers = []
@@ -95,37 +150,51 @@ def kmeans(input_data, k, batch_size, metric='sp', pre_txt=''):
             search_k = int(search_k)
             try:
                 input_data = preprocessing.normalize(input_data)
-                skm = SphericalKMeans(n_clusters=search_k, n_jobs=-1)
-                skm.fit(input_data)
+                if init is None:
+                    skm = SphericalKMeans(n_clusters=search_k, n_jobs=get_n_jobs(),
+                            random_state=random_state)
+                else:
+                    skm = SphericalKMeans(n_clusters=search_k, init=init,
+                            n_init=1, n_jobs=get_n_jobs(), random_state=random_state)
+
+                if monitor is None:
+                    skm.fit(input_data)
+                else:
+                    # SphericalKMeans has no hook into its iterations.
+                    fit_stepwise(skm, input_data, monitor)
             except:
                 continue
             labels = skm.labels_
 
+            # Without an in line score the search ks cannot be compared and
+            # the first one is kept.
+            cluster_score = 0.0
             if np.amin(labels) == np.amax(labels):
-                cluster_score = 0.0
                 ph.disp('All samples belong to cluster ' +
                         str(np.amin(labels)))
             else:
-                cluster_score = silhouette_score(input_data, labels, metric = 'cosine',
-                        sample_size=5000)
-
-            all_var = []
-            for i in range(search_k):
-                this_cluster = []
-                for j, point in enumerate(input_data):
-                    if labels[j] == i:
-                        this_cluster.append(point)
-
-                if len(this_cluster) > 0.0:
-                    this_cluster_var = np.var(this_cluster)
-                    all_var.append(this_cluster_var)
-                else:
-                    all_var.append(0.0)
-
-            avg_var = np.mean(all_var)
-
-            ph.disp(pre_txt + '|   search k at %i got %.6f, %.4f' % (search_k, avg_var,
-                cluster_score))
+                quality = scorer.score(input_data, labels, skm.cluster_centers_,
+                        metric='cosine', pre_txt=pre_txt)
+                if quality is not None and quality.score is not None:
+                    cluster_score = quality.score
+
+            # The variance over all entries of each cluster from per cluster
+            # sums instead of gathering the members of every cluster. Only
+            # computed for display.
+            if ph.is_enabled(ph.DEBUG):
+                n_features = input_data.shape[1]
+                counts = np.bincount(labels, minlength=search_k) * n_features
+                sums = np.bincount(labels, weights=input_data.sum(axis=1),
+                        minlength=search_k)
+                sq_sums = np.bincount(labels, weights=np.einsum('ij,ij->i',
+                    input_data, input_data), minlength=search_k)
+                non_empty = counts > 0
+                all_var = np.zeros(search_k)
+                all_var[non_empty] = (sq_sums[non_empty] / counts[non_empty] -
+                        (sums[non_empty] / counts[non_empty]) ** 2)
+
+                ph.debug(pre_txt + '|   search k at %i got %.6f', search_k,
+                        np.mean(all_var))
 
             if min_index == -1 or cluster_score > all_search_data[min_index][0]:
                 min_index = cur_index
@@ -133,40 +202,70 @@ def kmeans(input_data, k, batch_size, metric='sp', pre_txt=''):
                 min_labels = labels
                 min_predictor = skm
 
-            all_search_data.append((cluster_score, avg_var))
+            all_search_data.append((cluster_score, None))
 
             cur_index += 1
 
         return min_cluster_centers, min_labels, skm
 
+    elif metric == 'esp':
+        # Spherical clustering with the Elkan bounds of the custom k-means
+        # engine. Imported here as it requires the Cython extensions in
+        # custom_kmeans to be built.
+        from custom_kmeans.k_means_ import KMeans as CustomKMeans
+
+        # k-means|| seeding takes a few passes over the data instead of k.
+        if init is None:
+            # A monitored run is a single run so the history and the time
+            # budget are about one clustering.
+            skm = CustomKMeans(n_clusters=k, init='k-means||',
+                    n_init=10 if monitor is None else 1,
+                    algorithm='spherical', n_jobs=get_n_jobs(), random_state=random_state)
+        else:
+            skm = CustomKMeans(n_clusters=k, init=init, n_init=1,
+                    algorithm='spherical', n_jobs=get_n_jobs(), random_state=random_state)
+        skm.fit(input_data, monitor=monitor)
+        return skm.cluster_centers_, skm.labels_, skm
+
+    elif metric == 'ooc':
+        # Out-of-core spherical clustering. The input is read block by block so
+        # it can be a memory map larger than the available memory.
+        skm = StreamingKMeans(n_clusters=k, spherical=True, init=init,
+                random_state=random_state)
+        skm.fit(input_data, monitor=monitor)
+        return skm.cluster_centers_, skm.labels_, skm
+
     elif metric == 'vmfmh':
         # VonMisesFisherMixtureHard
         # I have not been able to get this method to converge.
-        vmf_hard = VonMisesFisherMixture(n_clusters=k, n_jobs=-1,posterior_type='hard')
+        vmf_hard = VonMisesFisherMixture(n_clusters=k, n_jobs=get_n_jobs(),posterior_type='hard')
         vmf_hard.fit(input_data)
         return vmf_hard.cluster_centers_
 
     elif metric == 'mbk':
         # Set the random seed.
-        mbk = MiniBatchKMeans(init='k-means++',
+        mbk = MiniBatchKMeans(init='k-means++' if init is None else init,
+                                n_init=3 if init is None else 1,
                                 n_clusters=k,
                                 batch_size=batch_size,
                                 max_no_improvement=10,
                                 reassignment_ratio=0.01,
-                                random_state=42,
+                                random_state=42 if random_state is None else random_state,
                                 verbose=False)
 
         # Ignore warnings that sklearn displays
         # for some reason
         with warnings.catch_warnings():
             warnings.simplefilter("ignore")
-            mbk.fit(input_data)
+            if monitor is None:
+                mbk.fit(input_data)
+            else:
+                fit_minibatch(mbk, input_data, batch_size, monitor,
+                        random_state=42 if random_state is None else random_state)
 
         labels = mbk.labels_
-        cluster_score = silhouette_score(input_data, labels, metric = 'euclidean',
-                sample_size=5000)
-
-        ph.disp('Got a euclidean ss of %.2f' % (cluster_score))
+        scorer.score(input_data, labels, mbk.cluster_centers_,
+                metric='euclidean', pre_txt=pre_txt)
 
         return mbk.cluster_centers_, labels
 
@@ -227,12 +326,15 @@ def get_image_patches(input_img, input_shape, stride, filter_shape):
     return contiguous_patches
 
 
-def build_patch_vecs(data_set_x, input_shape, stride, filter_shape):
+def build_patch_vecs(data_set_x, input_shape, stride, filter_shape, pool=None):
     """
     Extracts the image patches for each image. See get_image_patches for more detail.
     This is really more of a wrapper method to print debug statements and act
     across the entire data set rather than just one image.
 
+    :param pool: The process pool to extract the patches with. By default a
+    pool is created for the call.
+
     :returns: An array of image patches.
     The array dimensions will be (# samples, filter_shape[0], filter_shape[1])
     """
@@ -250,8 +352,11 @@ def build_patch_vecs(data_set_x, input_shape, stride, filter_shape):
     # Use concurrent patch extraction.
     # Much faster than the synchronous equivelent.
 
-    with Pool(processes=cpu_count()) as p:
-        patch_vecs = p.map(transform_f, data_set_x)
+    if pool is None:
+        with Pool(processes=get_n_jobs()) as p:
+            patch_vecs = p.map(transform_f, data_set_x)
+    else:
+        patch_vecs = pool.map(transform_f, data_set_x)
 
     patch_vecs = np.array(patch_vecs)
     ph.disp('----Patch vecs shape ' + str(patch_vecs.shape))
@@ -265,6 +370,78 @@ def build_patch_vecs(data_set_x, input_shape, stride, filter_shape):
     return patch_vecs
 
 
+def build_patch_vecs_memmap(data_set_x, input_shape, stride, filter_shape,
+        filename, chunksize=64):
+    """
+    Out-of-core variant of build_patch_vecs. The patches of each image are
+    normalized and written straight into a memory mapped file so the patch
+    vectors of the full data set never have to be held in memory at once.
+
+    :returns: A read only memory map of shape
+    (# patches, # flattened filter size dimension)
+    """
+
+    first_patches = get_image_patches(data_set_x[0], input_shape, stride,
+            filter_shape)
+    patches_per_img = first_patches.shape[0]
+    vec_dim = first_patches.shape[1] * first_patches.shape[2]
+    shape = (len(data_set_x) * patches_per_img, vec_dim)
+
+    ph.disp('----Filter shape is ' + str(filter_shape))
+    ph.disp('----Stride is ' + str(stride))
+    ph.disp('----Writing patch vecs of shape %s to %s' % (str(shape), filename))
+
+    cluster_vecs = open_vecs_memmap(filename, shape=shape)
+
+    transform_f = partial(get_image_patches, input_shape=input_shape,
+            stride=stride, filter_shape=filter_shape)
+
+    with Pool(processes=get_n_jobs()) as p:
+        for i, patches in enumerate(p.imap(transform_f, data_set_x,
+                chunksize=chunksize)):
+            patches = patches.reshape(patches_per_img, vec_dim)
+            cluster_vecs[i * patches_per_img:(i + 1) * patches_per_img] = \
+                    preprocessing.normalize(patches, norm='l2')
+
+    cluster_vecs.flush()
+    del cluster_vecs
+
+    return open_vecs_memmap(filename)
+
+
+@prof.timed('extract')
+def build_cluster_vecs_memmap(train_set_x, input_shape, stride, filter_shape,
+        convolute, filename):
+    """
+    Out-of-core variant of build_cluster_vecs followed by pre_process_clusters.
+
+    :returns: A read only memory map with one pre processed cluster vector per row.
+    """
+    ph.disp('- Building centroids out-of-core')
+
+    if convolute:
+        ph.disp('--Building patch vecs from %i vectors' % len(train_set_x))
+        cluster_vecs = build_patch_vecs_memmap(train_set_x, input_shape, stride,
+                filter_shape, filename)
+        prof.count('cluster_vecs', len(cluster_vecs))
+        return cluster_vecs
+
+    n_samples = len(train_set_x)
+    vec_dim = int(np.prod(input_shape))
+
+    cluster_vecs = open_vecs_memmap(filename, shape=(n_samples, vec_dim))
+    for block in iter_blocks(n_samples):
+        block_data = np.array(train_set_x[block], dtype='float32')
+        block_data = block_data.reshape(-1, vec_dim)
+        cluster_vecs[block] = preprocessing.normalize(block_data, norm='l2')
+
+    cluster_vecs.flush()
+    del cluster_vecs
+    prof.count('cluster_vecs', n_samples)
+
+    return open_vecs_memmap(filename)
+
+
 def save_centroids(centroids, filename):
     """
     Helper method to save a set of anchor vectors to a filename in CSV format.
@@ -329,14 +506,16 @@ def save_raw_image_patches(cluster_vecs, raw_save_loc):
         pickle.dump(cluster_vecs, f)
 
 
+@prof.timed('extract')
 def build_cluster_vecs(train_set_x, input_shape, stride, filter_shape,
-        convolute):
+        convolute, pool=None):
     ph.disp('- Building centroids')
 
     # Do we need to build the image patches because we are in a convolution layer?
     if convolute:
         ph.disp('--Building patch vecs from %i vectors' % len(train_set_x))
-        cluster_vecs = build_patch_vecs(train_set_x, input_shape, stride, filter_shape)
+        cluster_vecs = build_patch_vecs(train_set_x, input_shape, stride, filter_shape,
+                pool=pool)
     else:
         # Flatten the input.
         train_set_x = np.array(train_set_x)
@@ -351,7 +530,28 @@ def build_cluster_vecs(train_set_x, input_shape, stride, filter_shape,
         # Wrap in another dimension.
         cluster_vecs = train_set_x.reshape(1, sp[0], int(input_shape_prod))
 
-    return np.array(cluster_vecs, dtype='float32')
+    cluster_vecs = np.array(cluster_vecs, dtype='float32')
+    prof.count('cluster_vecs', cluster_vecs.shape[1])
+    return cluster_vecs
+
+
+def build_layer_cluster_vecs(train_set_x, input_shape, stride, filter_shape,
+        convolute, pool=None):
+    """
+    Build the pre processed cluster vectors of a layer with one vector per
+    row. The same transformation construct_centroids applies before the
+    samples are filtered.
+
+    The rows of each sample follow each other so the cluster vectors of
+    consecutive chunks of samples can be concatenated.
+    """
+    cluster_vecs = build_cluster_vecs(train_set_x, input_shape, stride,
+            filter_shape, convolute, pool=pool)
+
+    cvs = cluster_vecs.shape
+    cluster_vecs = cluster_vecs.reshape(cvs[1], cvs[0] * cvs[2])
+
+    return pre_process_clusters(cluster_vecs, convolute)
 
 
 def post_process_centroids(centroids):
@@ -408,7 +608,7 @@ def post_sort_process_clusters(cluster_vecs):
 
 def recur_apply_kmeans(layer_cluster_vecs, k, batch_size, min_cluster_samples,
         max_std, can_recur, all_train_y, all_train_x, mappings, cur_layer,
-        model, right, wrong, branch_depth = 0):
+        model, right, wrong, branch_depth = 0, warm_start_loc=''):
 
     if branch_depth == 1:
         can_recur = False
@@ -430,8 +630,48 @@ def recur_apply_kmeans(layer_cluster_vecs, k, batch_size, min_cluster_samples,
     pre_txt = '---' * branch_depth
     ph.disp('')
     ph.disp(pre_txt + 'At branch depth %i' % branch_depth)
-    layer_centroids, labels, predictor = kmeans(layer_cluster_vecs, k, batch_size, pre_txt = pre_txt)
-    model.set_predictor(predictor)
+    # Memory mapped vectors are too large to cluster in memory.
+    metric = 'ooc' if isinstance(layer_cluster_vecs, np.memmap) else 'sp'
+
+    # There is no single k to warm start when k is selected.
+    init = None
+    if warm_start_loc != '' and not is_k_range(k):
+        init = load_warm_centers(warm_start_loc, k, layer_cluster_vecs.shape[1])
+
+    monitor = ConvergenceMonitor(max_iter=model.hyperparams.cluster_max_iter,
+            tol=model.hyperparams.cluster_tol,
+            time_budget=model.hyperparams.cluster_time_budget)
+    # The native fit is much faster, the monitor only follows the run when
+    # its stopping rule is needed.
+    use_monitor = needs_monitor(model.hyperparams.cluster_max_iter,
+            model.hyperparams.cluster_tol, model.hyperparams.cluster_time_budget)
+    scorer = QualityScorer(mode=model.hyperparams.cluster_quality,
+            method=model.hyperparams.cluster_quality_method)
+
+    layer_centroids, labels, predictor = kmeans(layer_cluster_vecs, k,
+            batch_size, metric=metric, pre_txt = pre_txt, init=init,
+            monitor=monitor if use_monitor else None, scorer=scorer,
+            k_criterion=model.hyperparams.k_criterion,
+            random_state=model.hyperparams.random_state)
+
+    if not use_monitor:
+        monitor.record_fit(predictor)
+
+    ph.disp(pre_txt + monitor.summary())
+    if branch_depth == 0:
+        model.set_convergence(cur_layer, monitor)
+
+    k_table = getattr(predictor, 'k_selection_', None)
+    if k_table is not None:
+        k = len(layer_centroids)
+        if branch_depth == 0:
+            model.set_k_selection(cur_layer, k_table)
+
+    # The raw centers, before any post processing, seed the next run.
+    if warm_start_loc != '':
+        save_warm_centers(warm_start_loc, layer_centroids, labels)
+    # Only the top level clustering gives the anchor vectors of the layer.
+    model.set_predictor(predictor, cur_layer if branch_depth == 0 else None)
     # We will compute our own labels.
     #ph.disp('There are %i centroids %i layer cluster_vecs and %i y train samples'
     #        % (len(layer_centroids), len(layer_cluster_vecs),
@@ -487,7 +727,6 @@ def recur_apply_kmeans(layer_cluster_vecs, k, batch_size, min_cluster_samples,
         label_freqs = list(get_freq_percents(real_labels))
         label_freqs = sorted(label_freqs, key=lambda x: x[1], reverse=True)
 
-        this_cluster_var = np.var(this_cluster)
         #print(pre_txt + str(len(this_cluster)) + '_' + ('%.9f' %
         #    this_cluster_var) + '_' + str(label_freqs))
 
@@ -515,11 +754,6 @@ def recur_apply_kmeans(layer_cluster_vecs, k, batch_size, min_cluster_samples,
                         count_equal += 1
                 like_freqs[count_equal] += 1
 
-        this_cluster_std = 0.0
-        if len(this_cluster) > 0:
-            this_cluster_std = np.var(this_cluster)
-            this_cluster_avg = np.mean(this_cluster)
-
         if (len(label_freqs) > 0 and label_freqs[0][1] / float(len(this_cluster))) < 0.6:
             disp_color = ph.FAIL
         else:
@@ -567,20 +801,23 @@ def recur_apply_kmeans(layer_cluster_vecs, k, batch_size, min_cluster_samples,
     return final_centroids
 
 
-def apply_kmeans(layer_cluster_vecs, k, cur_layer, model_wrapper, batch_size):
+@prof.timed('kmeans')
+def apply_kmeans(layer_cluster_vecs, k, cur_layer, model_wrapper, batch_size,
+        warm_start_loc=''):
     layer_cluster_vecs = post_sort_process_clusters(layer_cluster_vecs)
     #layer_cluster_vecs = pre_process_clusters(layer_cluster_vecs)
     #if cur_layer == 2:
     #    plot_samples(layer_cluster_vecs, None, [0] * len(layer_cluster_vecs))
 
     ph.disp('The cur layer is %i' % cur_layer)
+    prof.count('clustered_vecs', len(layer_cluster_vecs), cur_layer)
     max_std = 0.01
     min_samples_percentage = 0.01
 
     # The minimum # of samples per cluster.
     # Note that this rule always has precedence over the max std rule.
     min_cluster_samples = int(len(layer_cluster_vecs) * min_samples_percentage)
-    min_cluster_samples = len(layer_cluster_vecs) / k
+    min_cluster_samples = len(layer_cluster_vecs) / np.max(k)
 
     can_recur = (cur_layer == 2)
     can_recur = False
@@ -598,19 +835,59 @@ def apply_kmeans(layer_cluster_vecs, k, cur_layer, model_wrapper, batch_size):
     all_centroids = recur_apply_kmeans(layer_cluster_vecs, k, batch_size,
             min_cluster_samples, max_std, can_recur, train_y,
             model_wrapper.all_train_x, mapping, cur_layer, model_wrapper,
-            right, wrong)
+            right, wrong, warm_start_loc=warm_start_loc)
 
     model_wrapper.set_mapping(mapping)
 
     return np.array(all_centroids, np.float64)
 
 
+def construct_centroids_out_of_core(memmap_loc, batch_size, train_set_x,
+        input_shape, stride, filter_shape, k, convolute, filter_params,
+        layer_index, model_wrapper, warm_start_loc=''):
+    """
+    The out-of-core counterpart of construct_centroids. The cluster vectors are
+    written to a memory mapped file at memmap_loc and only the filtered
+    selection is ever loaded into memory.
+    """
+
+    cluster_vecs = build_cluster_vecs_memmap(train_set_x, input_shape, stride,
+            filter_shape, convolute, memmap_loc)
+
+    if convolute:
+        cluster_vecs = filter_params.get_top_out_of_core(cluster_vecs, layer_index)
+    else:
+        cluster_vecs = filter_params.get_selected_out_of_core(cluster_vecs,
+                layer_index)
+
+    centroids = apply_kmeans(cluster_vecs, k, layer_index,
+            model_wrapper, batch_size, warm_start_loc=warm_start_loc)
+
+    ph.disp('Centroids now have shape %s' % str(centroids.shape))
+
+    return centroids
+
+
 def construct_centroids(raw_save_loc, batch_size, train_set_x, input_shape, stride,
-        filter_shape, k, convolute, filter_params, layer_index, model_wrapper):
+        filter_shape, k, convolute, filter_params, layer_index, model_wrapper,
+        memmap_loc='', warm_start_loc='', cluster_vecs=None):
     """
     The entry point for creating the centroids for input samples for a given layer.
+
+    :param memmap_loc: If set the cluster vectors are kept in a memory mapped
+    file at this location instead of in memory.
+    :param warm_start_loc: If set the clustering is seeded from the centers
+    saved at this location and the new centers are saved there.
+    :param cluster_vecs: The cluster vectors of train_set_x if they were
+    already built by build_layer_cluster_vecs.
     """
 
+    if memmap_loc != '':
+        return construct_centroids_out_of_core(memmap_loc, batch_size,
+                train_set_x, input_shape, stride, filter_shape, k, convolute,
+                filter_params, layer_index, model_wrapper,
+                warm_start_loc=warm_start_loc)
+
     #raw_save_loc = 'data/tmp.h5'
     raw_save_loc = ''
     try:
@@ -618,29 +895,18 @@ def construct_centroids(raw_save_loc, batch_size, train_set_x, input_shape, stri
         with open(raw_save_loc, 'rb') as f:
             cluster_vecs = pickle.load(f)
     except IOError:
-        cluster_vecs = build_cluster_vecs(train_set_x, input_shape, stride,
-                filter_shape, convolute)
-
-        cvs = cluster_vecs.shape
-        cluster_vecs = cluster_vecs.reshape(cvs[1], cvs[0] * cvs[2])
-
-        print('')
-        print('PRE PROC CLUSTER DATA')
-        print('Min ' + str(np.amin( cluster_vecs)) + ', ', end='')
-        print('Max ' + str(np.amax( cluster_vecs)) + ', ', end='')
-        print('Mean ' + str(np.mean(cluster_vecs)) + ', ', end='')
-        print('STD ' +  str(np.std( cluster_vecs)))
-        print('')
-
-        cluster_vecs = pre_process_clusters(cluster_vecs, convolute)
-
-        print('')
-        print('POST PROC CLUSTER DATA')
-        print('Min ' + str(np.amin( cluster_vecs)) + ', ', end='')
-        print('Max ' + str(np.amax( cluster_vecs)) + ', ', end='')
-        print('Mean ' + str(np.mean(cluster_vecs)) + ', ', end='')
-        print('STD ' +  str(np.std( cluster_vecs)))
-        print('')
+        if cluster_vecs is None:
+            cluster_vecs = build_cluster_vecs(train_set_x, input_shape, stride,
+                    filter_shape, convolute)
+
+            cvs = cluster_vecs.shape
+            cluster_vecs = cluster_vecs.reshape(cvs[1], cvs[0] * cvs[2])
+
+            ph.stats('PRE PROC CLUSTER DATA', cluster_vecs)
+
+            cluster_vecs = pre_process_clusters(cluster_vecs, convolute)
+
+        ph.stats('POST PROC CLUSTER DATA', cluster_vecs)
 
         if convolute:
             cluster_vecs = filter_params.get_sorted(cluster_vecs, layer_index)
@@ -662,7 +928,7 @@ def construct_centroids(raw_save_loc, batch_size, train_set_x, input_shape, stri
     cluster_vecs = np.array(cluster_vecs)
 
     centroids = apply_kmeans(cluster_vecs, k, layer_index,
-            model_wrapper, batch_size)
+            model_wrapper, batch_size, warm_start_loc=warm_start_loc)
 
     ph.disp('Centroids now have shape %s' % str(centroids.shape))
 
@@ -671,12 +937,21 @@ def construct_centroids(raw_save_loc, batch_size, train_set_x, input_shape, stri
 
 def load_or_create_centroids(force_create, filename, batch_size, data_set_x,
         input_shape, stride, filter_shape, k, filter_params, layer_index,
-        model_wrapper, convolute=True, raw_save_loc=''):
+        model_wrapper, convolute=True, raw_save_loc='', memmap_loc='',
+        warm_start_loc='', cluster_vecs=None, writer=None):
     """
     Wrapper function to load they anchor vectors for the current layer if they exist
     or otherwise create the anchor vectors. The created centroids will be by default saved.
 
     :param force_create: Create the anchor vectors even if they already exist at a file location.
+    :param memmap_loc: Where to memory map the cluster vectors for out-of-core
+    clustering. Empty to cluster in memory.
+    :param warm_start_loc: Where to warm start the clustering from. Empty to
+    always start from fresh seeds.
+    :param cluster_vecs: The already built cluster vectors of data_set_x. See
+    construct_centroids.
+    :param writer: A BackgroundWriter to save the anchor vectors with. None to
+    save them before returning.
 
     :returns: The calculated or loaded anchor vectors.
     """
@@ -692,8 +967,13 @@ def load_or_create_centroids(force_create, filename, batch_size, data_set_x,
     if force_create:
         centroids = construct_centroids(raw_save_loc, batch_size, data_set_x, input_shape,
                 stride, filter_shape, k, convolute, filter_params, layer_index,
-                model_wrapper)
-        save_centroids(centroids, filename)
+                model_wrapper, memmap_loc=memmap_loc,
+                warm_start_loc=warm_start_loc, cluster_vecs=cluster_vecs)
+        if writer is None:
+            save_centroids(centroids, filename)
+        else:
+            writer.submit(save_centroids, centroids, filename,
+                    layer_index=layer_index)
 
     return centroids
 
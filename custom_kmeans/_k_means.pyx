@@ -14,6 +14,8 @@ import scipy.sparse as sp
 cimport numpy as np
 cimport cython
 from cython cimport floating
+from cython.parallel import prange, threadid
+from scipy.linalg.cython_blas cimport sdot, ddot, sgemm, dgemm
 
 from sklearn.utils.extmath import norm
 from sklearn.utils.sparsefuncs_fast import assign_rows_csr
@@ -22,82 +24,137 @@ from sklearn.utils.fixes import bincount
 ctypedef np.float64_t DOUBLE
 ctypedef np.int32_t INT
 
-ctypedef floating (*DOT)(int N, floating *X, int incX, floating *Y,
-                         int incY)
-
-cdef extern from "cblas.h":
-    double ddot "cblas_ddot"(int N, double *X, int incX, double *Y, int incY)
-    float sdot "cblas_sdot"(int N, float *X, int incX, float *Y, int incY)
+# The number of samples whose distances are computed by a single GEMM call.
+# A block of distances is CHUNK_SIZE * n_clusters floats per thread which
+# stays in cache for the usual number of clusters.
+DEF CHUNK_SIZE = 256
 
 np.import_array()
 
 
+cdef inline floating _dot(int n, floating *x, int incx,
+                          floating *y, int incy) nogil:
+    """Dot product through the BLAS scipy is linked against"""
+    if floating is float:
+        return sdot(&n, x, &incx, y, &incy)
+    else:
+        return ddot(&n, x, &incx, y, &incy)
+
+
+cdef inline void _gemm_block(int n_clusters, int n_block, int n_features,
+                             floating *centers, floating *X_block,
+                             floating *out) nogil:
+    """Compute out = -2 * X_block . centers^T for C-contiguous inputs
+
+    out is a C-contiguous (n_block, n_clusters) buffer. BLAS is column major
+    so every C-contiguous matrix is seen as its transpose: this is
+    out^T = -2 * centers . X_block^T in BLAS terms.
+    """
+    cdef:
+        char *transa = 'T'
+        char *transb = 'N'
+        floating alpha = -2.0
+        floating beta = 0.0
+
+    if floating is float:
+        sgemm(transa, transb, &n_clusters, &n_block, &n_features, &alpha,
+              centers, &n_features, X_block, &n_features, &beta,
+              out, &n_clusters)
+    else:
+        dgemm(transa, transb, &n_clusters, &n_block, &n_features, &alpha,
+              centers, &n_features, X_block, &n_features, &beta,
+              out, &n_clusters)
+
+
 @cython.boundscheck(False)
 @cython.wraparound(False)
 @cython.cdivision(True)
-cpdef DOUBLE _assign_labels_array(np.ndarray[floating, ndim=2] X,
-                                  np.ndarray[floating, ndim=1] x_squared_norms,
-                                  np.ndarray[floating, ndim=2] centers,
-                                  np.ndarray[INT, ndim=1] labels,
-                                  np.ndarray[floating, ndim=1] distances):
+@cython.profile(False)
+cpdef DOUBLE _assign_labels_array(floating[:, ::1] X,
+                                  floating[:] x_squared_norms,
+                                  floating[:, ::1] centers,
+                                  INT[:] labels,
+                                  floating[:] distances,
+                                  int n_threads=1):
     """Compute label assignment and inertia for a dense array
 
+    The samples are processed in blocks of CHUNK_SIZE. The dot products of a
+    block with all of the centers are a single GEMM call, so the bulk of the
+    work runs in the optimized BLAS scipy is linked against. The blocks are
+    split across n_threads OpenMP threads with the GIL released, each thread
+    writing its distances into its own buffer. The only shared state is the
+    inertia, which is combined as a reduction.
+
+    X and centers must be C-contiguous.
+
     Return the inertia (sum of squared distances to the centers).
     """
     cdef:
-        unsigned int n_clusters = centers.shape[0]
-        unsigned int n_features = centers.shape[1]
-        unsigned int n_samples = X.shape[0]
-        unsigned int x_stride
-        unsigned int center_stride
-        unsigned int sample_idx, center_idx, feature_idx
-        unsigned int store_distances = 0
-        unsigned int k
-        np.ndarray[floating, ndim=1] center_squared_norms
+        int n_clusters = centers.shape[0]
+        int n_features = centers.shape[1]
+        Py_ssize_t n_samples = X.shape[0]
+        Py_ssize_t n_blocks = (n_samples + CHUNK_SIZE - 1) // CHUNK_SIZE
+        Py_ssize_t block_idx, sample_idx, start
+        int center_idx, n_block
+        bint store_distances = 0
+        floating[:] center_squared_norms
+        floating[:, :, ::1] dots_buffer
+        floating *dots
         # the following variables are always double cause make them floating
         # does not save any memory, but makes the code much bigger
         DOUBLE inertia = 0.0
         DOUBLE min_dist
         DOUBLE dist
-        DOT dot
+        INT best_center
+
+    if n_samples == 0:
+        return inertia
+
+    # No point in starting threads that would not get a block.
+    n_threads = max(min(n_threads, n_blocks), 1)
 
     if floating is float:
-        center_squared_norms = np.zeros(n_clusters, dtype=np.float32)
-        x_stride = X.strides[1] / sizeof(float)
-        center_stride = centers.strides[1] / sizeof(float)
-        dot = sdot
+        dtype = np.float32
     else:
-        center_squared_norms = np.zeros(n_clusters, dtype=np.float64)
-        x_stride = X.strides[1] / sizeof(DOUBLE)
-        center_stride = centers.strides[1] / sizeof(DOUBLE)
-        dot = ddot
+        dtype = np.float64
+    center_squared_norms = np.zeros(n_clusters, dtype=dtype)
+    dots_buffer = np.empty((n_threads, CHUNK_SIZE, n_clusters), dtype=dtype)
 
     if n_samples == distances.shape[0]:
         store_distances = 1
 
-    for center_idx in range(n_clusters):
-        center_squared_norms[center_idx] = dot(
-            n_features, &centers[center_idx, 0], center_stride,
-            &centers[center_idx, 0], center_stride)
-
-    for sample_idx in range(n_samples):
-        min_dist = -1
+    with nogil:
         for center_idx in range(n_clusters):
-            dist = 0.0
+            center_squared_norms[center_idx] = _dot(
+                n_features, &centers[center_idx, 0], 1,
+                &centers[center_idx, 0], 1)
+
+        for block_idx in prange(n_blocks, schedule='static',
+                                num_threads=n_threads):
+            start = block_idx * CHUNK_SIZE
+            n_block = <int> min(CHUNK_SIZE, n_samples - start)
+            dots = &dots_buffer[threadid(), 0, 0]
+
             # hardcoded: minimize euclidean distance to cluster center:
             # ||a - b||^2 = ||a||^2 + ||b||^2 -2 <a, b>
-            dist += dot(n_features, &X[sample_idx, 0], x_stride,
-                        &centers[center_idx, 0], center_stride)
-            dist *= -2
-            dist += center_squared_norms[center_idx]
-            dist += x_squared_norms[sample_idx]
-            if min_dist == -1 or dist < min_dist:
-                min_dist = dist
-                labels[sample_idx] = center_idx
-
-        if store_distances:
-            distances[sample_idx] = min_dist
-        inertia += min_dist
+            _gemm_block(n_clusters, n_block, n_features, &centers[0, 0],
+                        &X[start, 0], dots)
+
+            for sample_idx in range(start, start + n_block):
+                min_dist = -1
+                best_center = 0
+                for center_idx in range(n_clusters):
+                    dist = dots[(sample_idx - start) * n_clusters + center_idx]
+                    dist = dist + center_squared_norms[center_idx]
+                    dist = dist + x_squared_norms[sample_idx]
+                    if min_dist == -1 or dist < min_dist:
+                        min_dist = dist
+                        best_center = center_idx
+
+                labels[sample_idx] = best_center
+                if store_distances:
+                    distances[sample_idx] = min_dist
+                inertia += min_dist
 
     return inertia
 
@@ -105,7 +162,7 @@ cpdef DOUBLE _assign_labels_array(np.ndarray[floating, ndim=2] X,
 @cython.boundscheck(False)
 @cython.wraparound(False)
 @cython.cdivision(True)
-cpdef DOUBLE _assign_labels_csr(X, np.ndarray[DOUBLE, ndim=1] x_squared_norms,
+cpdef DOUBLE _assign_labels_csr(X, np.ndarray[floating, ndim=1] x_squared_norms,
                                 np.ndarray[floating, ndim=2] centers,
                                 np.ndarray[INT, ndim=1] labels,
                                 np.ndarray[floating, ndim=1] distances):
@@ -129,20 +186,17 @@ cpdef DOUBLE _assign_labels_csr(X, np.ndarray[DOUBLE, ndim=1] x_squared_norms,
         DOUBLE inertia = 0.0
         DOUBLE min_dist
         DOUBLE dist
-        DOT dot
 
     if floating is float:
         center_squared_norms = np.zeros(n_clusters, dtype=np.float32)
-        dot = sdot
     else:
         center_squared_norms = np.zeros(n_clusters, dtype=np.float64)
-        dot = ddot
 
     if n_samples == distances.shape[0]:
         store_distances = 1
 
     for center_idx in range(n_clusters):
-            center_squared_norms[center_idx] = dot(
+            center_squared_norms[center_idx] = _dot(
                 n_features, &centers[center_idx, 0], 1, &centers[center_idx, 0], 1)
 
     for sample_idx in range(n_samples):
@@ -169,7 +223,7 @@ cpdef DOUBLE _assign_labels_csr(X, np.ndarray[DOUBLE, ndim=1] x_squared_norms,
 @cython.boundscheck(False)
 @cython.wraparound(False)
 @cython.cdivision(True)
-def _mini_batch_update_csr(X, np.ndarray[DOUBLE, ndim=1] x_squared_norms,
+def _mini_batch_update_csr(X, np.ndarray[floating, ndim=1] x_squared_norms,
                            np.ndarray[floating, ndim=2] centers,
                            np.ndarray[INT, ndim=1] counts,
                            np.ndarray[INT, ndim=1] nearest_center,
@@ -272,13 +326,18 @@ def _mini_batch_update_csr(X, np.ndarray[DOUBLE, ndim=1] x_squared_norms,
 @cython.boundscheck(False)
 @cython.wraparound(False)
 @cython.cdivision(True)
-def _centers_dense(np.ndarray[floating, ndim=2] X,
-        np.ndarray[INT, ndim=1] labels, int n_clusters,
-        np.ndarray[floating, ndim=1] distances):
+@cython.profile(False)
+def _centers_dense(floating[:, :] X,
+        INT[:] labels, int n_clusters,
+        floating[:] distances, int n_threads=1):
     """M step of the K-means EM algorithm
 
     Computation of cluster centers / means.
 
+    The samples are split across n_threads OpenMP threads with the GIL
+    released. Every thread accumulates into its own partial sum of the
+    centers which are added together at the end, so no locking is needed.
+
     Parameters
     ----------
     X : array-like, shape (n_samples, n_features)
@@ -292,6 +351,9 @@ def _centers_dense(np.ndarray[floating, ndim=2] X,
     distances : array-like, shape (n_samples)
         Distance to closest cluster for each sample.
 
+    n_threads : int
+        Number of OpenMP threads to use.
+
     Returns
     -------
     centers : array, shape (n_clusters, n_features)
@@ -301,31 +363,42 @@ def _centers_dense(np.ndarray[floating, ndim=2] X,
     cdef int n_samples, n_features
     n_samples = X.shape[0]
     n_features = X.shape[1]
-    cdef int i, j, c
-    cdef np.ndarray[floating, ndim=2] centers
+    cdef int i, j, tid
+    cdef floating[:, :, ::1] partial_centers
+
+    if n_threads < 1:
+        n_threads = 1
+
     if floating is float:
-        centers = np.zeros((n_clusters, n_features), dtype=np.float32)
+        dtype = np.float32
     else:
-        centers = np.zeros((n_clusters, n_features), dtype=np.float64)
+        dtype = np.float64
+
+    centers = np.zeros((n_clusters, n_features), dtype=dtype)
+    partial_centers_ = np.zeros((n_threads, n_clusters, n_features), dtype=dtype)
+    partial_centers = partial_centers_
 
-    n_samples_in_cluster = bincount(labels, minlength=n_clusters)
+    n_samples_in_cluster = bincount(np.asarray(labels), minlength=n_clusters)
     empty_clusters = np.where(n_samples_in_cluster == 0)[0]
     # maybe also relocate small clusters?
 
     if len(empty_clusters):
         # find points to reassign empty clusters to
-        far_from_centers = distances.argsort()[::-1]
+        far_from_centers = np.asarray(distances).argsort()[::-1]
 
         for i, cluster_id in enumerate(empty_clusters):
             # XXX two relocated clusters could be close to each other
-            new_center = X[far_from_centers[i]]
+            new_center = np.asarray(X[far_from_centers[i]])
             centers[cluster_id] = new_center
             n_samples_in_cluster[cluster_id] = 1
 
-    for i in range(n_samples):
-        for j in range(n_features):
-            centers[labels[i], j] += X[i, j]
+    with nogil:
+        for i in prange(n_samples, schedule='static', num_threads=n_threads):
+            tid = threadid()
+            for j in range(n_features):
+                partial_centers[tid, labels[i], j] += X[i, j]
 
+    centers += partial_centers_.sum(axis=0)
     centers /= n_samples_in_cluster[:, np.newaxis]
 
     return centers
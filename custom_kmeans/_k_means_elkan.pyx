@@ -29,10 +29,49 @@ cdef floating euclidian_dist(floating* a, floating* b, int n_features) nogil:
     return sqrt(result)
 
 
+cdef floating chord_dist(floating* a, floating* b, int n_features) nogil:
+    # Euclidean distance between two unit vectors from their dot product,
+    # ||a - b|| = sqrt(2 - 2 <a, b>). It is a monotone function of the cosine
+    # distance, so triangle inequality bounds on it prune exactly the centers
+    # that cosine bounds would.
+    cdef floating result
+    result = 0
+    cdef int i
+    for i in range(n_features):
+        result += a[i] * b[i]
+    result = 2 - 2 * result
+    if result < 0:
+        result = 0
+    return sqrt(result)
+
+
+cdef inline floating sample_dist(floating* a, floating* b, int n_features,
+                                 bint spherical) nogil:
+    if spherical:
+        return chord_dist(a, b, n_features)
+    return euclidian_dist(a, b, n_features)
+
+
+def _center_half_distances(centers, dtype):
+    """Half of the pairwise distances between the centers in the given dtype."""
+    return (euclidean_distances(centers) / 2.).astype(dtype, copy=False)
+
+
+def normalize_centers(np.ndarray[floating, ndim=2, mode='c'] centers):
+    """Project the centers back onto the unit sphere in place.
+
+    Centers of empty clusters with a zero norm are left untouched.
+    """
+    norms = np.sqrt(np.sum(centers ** 2, axis=1))
+    norms[norms == 0] = 1
+    centers /= norms[:, np.newaxis]
+    return centers
+
+
 cdef update_labels_distances_inplace(
         floating* X, floating* centers, floating[:, :] center_half_distances,
         int[:] labels, floating[:, :] lower_bounds, floating[:] upper_bounds,
-        int n_samples, int n_features, int n_clusters):
+        int n_samples, int n_features, int n_clusters, bint spherical=False):
     """
     Calculate upper and lower bounds for each sample.
 
@@ -79,6 +118,10 @@ cdef update_labels_distances_inplace(
 
     n_clusters : int
         The number of clusters.
+
+    spherical : bool
+        Whether X and centers lie on the unit sphere. The chord distance is
+        then computed from the dot product.
     """
     # assigns closest center to X
     # uses triangle inequality
@@ -90,12 +133,12 @@ cdef update_labels_distances_inplace(
         # assign first cluster center
         c_x = 0
         x = X + sample * n_features
-        d_c = euclidian_dist(x, centers, n_features)
+        d_c = sample_dist(x, centers, n_features, spherical)
         lower_bounds[sample, 0] = d_c
         for j in range(1, n_clusters):
             if d_c > center_half_distances[c_x, j]:
                 c = centers + j * n_features
-                dist = euclidian_dist(x, c, n_features)
+                dist = sample_dist(x, c, n_features, spherical)
                 lower_bounds[sample, j] = dist
                 if dist < d_c:
                     d_c = dist
@@ -106,9 +149,16 @@ cdef update_labels_distances_inplace(
 
 def k_means_elkan(np.ndarray[floating, ndim=2, mode='c'] X_, int n_clusters,
                   np.ndarray[floating, ndim=2, mode='c'] init,
-                  float tol=1e-4, int max_iter=30, verbose=False):
+                  float tol=1e-4, int max_iter=30, verbose=False,
+                  int n_threads=1, bint spherical=False, callback=None):
     """Run Elkan's k-means.
 
+    With spherical=True this runs spherical k-means instead. The rows of X_
+    and init must have unit norm, the centers are projected back onto the
+    unit sphere after every update and all distances are chord distances
+    computed from the cosine similarity. The same triangle inequality bounds
+    then hold, so most cosine computations are skipped.
+
     Parameters
     ----------
     X_ : nd-array, shape (n_samples, n_features)
@@ -128,6 +178,17 @@ def k_means_elkan(np.ndarray[floating, ndim=2, mode='c'] X_, int n_clusters,
     verbose : bool, default=False
         Whether to be verbose.
 
+    n_threads : int, default=1
+        Number of OpenMP threads used to compute the new centers.
+
+    spherical : bool, default=False
+        Run spherical k-means on unit normalized data.
+
+    callback : callable, optional
+        Called after every iteration with the centers the samples were
+        assigned to, the labels and the squared total center shift. The
+        iterations stop once it returns True.
+
     """
     if floating is float:
         dtype = np.float32
@@ -143,7 +204,8 @@ def k_means_elkan(np.ndarray[floating, ndim=2, mode='c'] X_, int n_clusters,
     cdef Py_ssize_t n_features = X_.shape[1]
     cdef int point_index, center_index, label
     cdef floating upper_bound, distance
-    cdef floating[:, :] center_half_distances = euclidean_distances(centers_) / 2.
+    # Keep every buffer in the dtype of X so float32 input is never upcast.
+    cdef floating[:, :] center_half_distances = _center_half_distances(centers_, dtype)
     cdef floating[:, :] lower_bounds = np.zeros((n_samples, n_clusters), dtype=dtype)
     cdef floating[:] distance_next_center
     labels_ = np.empty(n_samples, dtype=np.int32)
@@ -154,7 +216,8 @@ def k_means_elkan(np.ndarray[floating, ndim=2, mode='c'] X_, int n_clusters,
     # Get the inital set of upper bounds and lower bounds for each sample.
     update_labels_distances_inplace(X_p, centers_p, center_half_distances,
                                     labels, lower_bounds, upper_bounds,
-                                    n_samples, n_features, n_clusters)
+                                    n_samples, n_features, n_clusters,
+                                    spherical)
     cdef np.uint8_t[:] bounds_tight = np.ones(n_samples, dtype=np.uint8)
     cdef np.uint8_t[:] points_to_update = np.zeros(n_samples, dtype=np.uint8)
     cdef np.ndarray[floating, ndim=2, mode='c'] new_centers
@@ -164,6 +227,7 @@ def k_means_elkan(np.ndarray[floating, ndim=2, mode='c'] X_, int n_clusters,
         ', got %d instead' % max_iter)
 
     col_indices = np.arange(center_half_distances.shape[0], dtype=np.int)
+    should_stop = False
     for iteration in range(max_iter):
         if verbose:
             print("start iteration")
@@ -198,7 +262,8 @@ def k_means_elkan(np.ndarray[floating, ndim=2, mode='c'] X_, int n_clusters,
                     # Recompute the upper bound by calculating the actual distance
                     # between the sample and label.
                     if not bounds_tight[point_index]:
-                        upper_bound = euclidian_dist(x_p, centers_p + label * n_features, n_features)
+                        upper_bound = sample_dist(x_p, centers_p + label * n_features,
+                                                  n_features, spherical)
                         lower_bounds[point_index, label] = upper_bound
                         bounds_tight[point_index] = 1
 
@@ -207,7 +272,8 @@ def k_means_elkan(np.ndarray[floating, ndim=2, mode='c'] X_, int n_clusters,
                     # distance, reassign labels.
                     if (upper_bound > lower_bounds[point_index, center_index]
                             or (upper_bound > center_half_distances[label, center_index])):
-                        distance = euclidian_dist(x_p, centers_p + center_index * n_features, n_features)
+                        distance = sample_dist(x_p, centers_p + center_index * n_features,
+                                               n_features, spherical)
                         lower_bounds[point_index, center_index] = distance
                         if distance < upper_bound:
                             label = center_index
@@ -220,11 +286,17 @@ def k_means_elkan(np.ndarray[floating, ndim=2, mode='c'] X_, int n_clusters,
             print("end inner loop")
 
         # compute new centers
-        new_centers = _centers_dense(X_, labels_, n_clusters, upper_bounds_)
+        new_centers = _centers_dense(X_, labels_, n_clusters, upper_bounds_,
+                                     n_threads=n_threads)
+        if spherical:
+            new_centers = normalize_centers(new_centers)
         bounds_tight[:] = 0
 
         # compute distance each center moved
-        center_shift = np.sqrt(np.sum((centers_ - new_centers) ** 2, axis=1))
+        center_shift = np.sqrt(np.sum((centers_ - new_centers) ** 2, axis=1)).astype(dtype, copy=False)
+
+        if callback is not None:
+            should_stop = callback(centers_, labels_, np.sum(center_shift) ** 2)
 
         # update bounds accordingly
         lower_bounds = np.maximum(lower_bounds - center_shift, 0)
@@ -235,7 +307,7 @@ def k_means_elkan(np.ndarray[floating, ndim=2, mode='c'] X_, int n_clusters,
         centers_p = <floating*>new_centers.data
 
         # update between-center distances
-        center_half_distances = euclidean_distances(centers_) / 2.
+        center_half_distances = _center_half_distances(centers_, dtype)
         if verbose:
             print('Iteration %i, inertia %s'
                   % (iteration, np.sum((X_ - centers_[labels]) ** 2)))
@@ -245,11 +317,14 @@ def k_means_elkan(np.ndarray[floating, ndim=2, mode='c'] X_, int n_clusters,
                 print("center shift %e within tolerance %e"
                       % (center_shift_total, tol))
             break
+        if should_stop:
+            break
 
     # We need this to make sure that the labels give the same output as
     # predict(X)
     if center_shift_total > 0:
         update_labels_distances_inplace(X_p, centers_p, center_half_distances,
                                         labels, lower_bounds, upper_bounds,
-                                        n_samples, n_features, n_clusters)
+                                        n_samples, n_features, n_clusters,
+                                        spherical)
     return centers_, labels_, iteration
@@ -12,6 +12,8 @@
 # License: BSD 3 clause
 
 import warnings
+from functools import partial
+from multiprocessing import cpu_count
 
 import numpy as np
 import scipy.sparse as sp
@@ -19,6 +21,7 @@ import scipy.sparse as sp
 from sklearn.base import BaseEstimator, ClusterMixin, TransformerMixin
 from sklearn.metrics.pairwise import euclidean_distances
 from sklearn.metrics.pairwise import pairwise_distances_argmin_min
+from sklearn.preprocessing import normalize
 from sklearn.utils.extmath import row_norms, squared_norm, stable_cumsum
 from sklearn.utils.sparsefuncs_fast import assign_rows_csr
 from sklearn.utils.sparsefuncs import mean_variance_axis
@@ -30,8 +33,6 @@ from sklearn.utils import gen_batches
 from sklearn.utils.validation import check_is_fitted
 from sklearn.utils.validation import FLOAT_DTYPES
 from sklearn.utils.random import choice
-from sklearn.externals.joblib import Parallel
-from sklearn.externals.joblib import delayed
 from sklearn.externals.six import string_types
 
 # The optimized Cython compiled functions.
@@ -39,11 +40,28 @@ from .ClusterCNN.custom_kmeans import _k_means
 from .ClusterCNN.custom_kmeans._k_means_elkan import k_means_elkan
 
 
+###############################################################################
+# Threading
+
+
+def _get_n_threads(n_jobs):
+    """Map an n_jobs value to the number of OpenMP threads for the kernels
+
+    -1 means all CPUs, -2 all CPUs but one and so on.
+    """
+    if n_jobs is None or n_jobs == 0:
+        return 1
+    if n_jobs < 0:
+        return max(cpu_count() + 1 + n_jobs, 1)
+    return n_jobs
+
+
 ###############################################################################
 # Initialization heuristic
 
 
-def _k_init(X, n_clusters, x_squared_norms, random_state, n_local_trials=None):
+def _k_init(X, n_clusters, x_squared_norms, random_state, n_local_trials=None,
+            sample_weight=None):
     """Init n_clusters seeds according to k-means++
 
     Parameters
@@ -67,6 +85,11 @@ def _k_init(X, n_clusters, x_squared_norms, random_state, n_local_trials=None):
         Set to None to make the number of trials depend logarithmically
         on the number of seeds (2+log(k)); this is the default.
 
+    sample_weight : array, shape (n_samples,), optional
+        Weight of each data point, as if it was repeated that many times.
+        Used to recluster the weighted candidates of k-means||. Defaults to
+        a weight of one for every point.
+
     Notes
     -----
     Selects initial cluster centers for k-mean clustering in a smart way
@@ -91,7 +114,13 @@ def _k_init(X, n_clusters, x_squared_norms, random_state, n_local_trials=None):
         n_local_trials = 2 + int(np.log(n_clusters))
 
     # Pick first center randomly
-    center_id = random_state.randint(n_samples)
+    if sample_weight is None:
+        center_id = random_state.randint(n_samples)
+    else:
+        center_id = np.searchsorted(stable_cumsum(sample_weight),
+                                    random_state.random_sample() *
+                                    sample_weight.sum())
+        center_id = min(center_id, n_samples - 1)
     if sp.issparse(X):
         centers[0] = X[center_id].toarray()
     else:
@@ -101,6 +130,8 @@ def _k_init(X, n_clusters, x_squared_norms, random_state, n_local_trials=None):
     closest_dist_sq = euclidean_distances(
         centers[0, np.newaxis], X, Y_norm_squared=x_squared_norms,
         squared=True)
+    if sample_weight is not None:
+        closest_dist_sq *= sample_weight
     current_pot = closest_dist_sq.sum()
 
     # Pick the remaining n_clusters-1 points
@@ -114,6 +145,8 @@ def _k_init(X, n_clusters, x_squared_norms, random_state, n_local_trials=None):
         # Compute distances to center candidates
         distance_to_candidates = euclidean_distances(
             X[candidate_ids], X, Y_norm_squared=x_squared_norms, squared=True)
+        if sample_weight is not None:
+            distance_to_candidates *= sample_weight
 
         # Decide which candidate is the best
         best_candidate = None
@@ -142,6 +175,137 @@ def _k_init(X, n_clusters, x_squared_norms, random_state, n_local_trials=None):
     return centers
 
 
+def _k_init_parallel(X, n_clusters, x_squared_norms, random_state,
+                     oversampling_factor=None, n_rounds=5):
+    """Init n_clusters seeds according to k-means|| (scalable k-means++)
+
+    Parameters
+    -----------
+    X : array or sparse matrix, shape (n_samples, n_features)
+        The data to pick seeds for.
+
+    n_clusters : integer
+        The number of seeds to choose
+
+    x_squared_norms : array, shape (n_samples,)
+        Squared Euclidean norm of each data point.
+
+    random_state : numpy.RandomState
+        The generator used to initialize the centers.
+
+    oversampling_factor : float, optional
+        The expected number of candidates sampled in every round. Defaults
+        to 0.5 * n_clusters.
+
+    n_rounds : integer, default 5
+        The number of sampling rounds, each of which is one pass over X.
+
+    Notes
+    -----
+    Instead of the n_clusters sequential passes of k-means++, every round
+    samples each point independently with a probability proportional to its
+    squared distance to the closest candidate so far. After n_rounds passes
+    there are about n_rounds * oversampling_factor candidates. Each
+    candidate is weighted by the number of points closest to it and the
+    weighted candidates are reclustered with k-means++, which only touches
+    the candidates. See: Bahmani, B. et al. "Scalable k-means++". VLDB 2012.
+
+    Every candidate costs a distance to each point, so the rounds compute
+    about n_rounds * oversampling_factor * n_samples distances against the
+    (2 + log(n_clusters)) * n_clusters * n_samples of k-means++. The default
+    of 2.5 * n_clusters * n_samples keeps it cheaper than k-means++ while
+    still sampling more candidates than clusters. A larger factor gives
+    better seeds at a cost that grows linearly with it.
+    """
+    n_samples = X.shape[0]
+
+    if oversampling_factor is None:
+        oversampling_factor = 0.5 * n_clusters
+
+    # Pick first candidate randomly
+    candidate_ids = [random_state.randint(n_samples)]
+    closest_dist_sq = euclidean_distances(
+        X[candidate_ids], X, Y_norm_squared=x_squared_norms,
+        squared=True).ravel()
+    closest_candidate = np.zeros(n_samples, dtype=np.int32)
+
+    for _ in range(n_rounds):
+        current_pot = closest_dist_sq.sum()
+        if current_pot == 0:
+            # Every point already is a candidate.
+            break
+
+        sample_proba = oversampling_factor * closest_dist_sq / current_pot
+        new_ids = np.flatnonzero(random_state.random_sample(n_samples) <
+                                 sample_proba)
+        if len(new_ids) == 0:
+            continue
+
+        # Only the distances to the new candidates have to be computed, in
+        # batches to bound the memory.
+        new_closest, new_dist = pairwise_distances_argmin_min(
+            X, X[new_ids], metric_kwargs={'squared': True})
+        closer = new_dist < closest_dist_sq
+        closest_dist_sq[closer] = new_dist[closer]
+        closest_candidate[closer] = len(candidate_ids) + new_closest[closer]
+        candidate_ids.extend(new_ids)
+
+    candidate_ids = np.asarray(candidate_ids)
+    if len(candidate_ids) < n_clusters:
+        # Top up with random points so there is one candidate per cluster.
+        others = np.setdiff1d(np.arange(n_samples), candidate_ids)
+        extra_ids = random_state.permutation(others)[
+            :n_clusters - len(candidate_ids)]
+        candidate_ids = np.concatenate([candidate_ids, extra_ids])
+
+    weights = np.bincount(closest_candidate,
+                          minlength=len(candidate_ids)).astype(np.float64)
+    # The points added to top up are at least their own closest point.
+    weights = np.maximum(weights, 1)
+
+    candidates = X[candidate_ids]
+    if sp.issparse(candidates):
+        candidates = candidates.toarray()
+
+    return _k_init(candidates, n_clusters,
+                   x_squared_norms=x_squared_norms[candidate_ids],
+                   random_state=random_state, sample_weight=weights)
+
+
+def _k_init_sample(X, n_clusters, x_squared_norms, random_state,
+                   sample_size=None):
+    """Init n_clusters seeds with k-means++ on a random subset of X
+
+    Parameters
+    -----------
+    X : array or sparse matrix, shape (n_samples, n_features)
+        The data to pick seeds for.
+
+    n_clusters : integer
+        The number of seeds to choose
+
+    x_squared_norms : array, shape (n_samples,)
+        Squared Euclidean norm of each data point.
+
+    random_state : numpy.RandomState
+        The generator used to initialize the centers.
+
+    sample_size : integer, optional
+        The number of points k-means++ is run on. Defaults to
+        10 * n_clusters.
+    """
+    n_samples = X.shape[0]
+
+    if sample_size is None:
+        sample_size = 10 * n_clusters
+    sample_size = max(min(sample_size, n_samples), n_clusters)
+
+    sample_ids = random_state.choice(n_samples, sample_size, replace=False)
+    return _k_init(X[sample_ids], n_clusters,
+                   x_squared_norms=x_squared_norms[sample_ids],
+                   random_state=random_state)
+
+
 ###############################################################################
 # K-means batch estimation by EM (expectation maximization)
 
@@ -158,19 +322,46 @@ def _validate_center_shape(X, n_centers, centers):
             % (centers.shape[1], X.shape[1]))
 
 
+def _dense_variances(X, batch_size=10000):
+    """Per feature variances of a dense X
+
+    Computed in batches so no temporary of the size of X is allocated, which
+    np.var would do to subtract the mean.
+    """
+    n_samples = X.shape[0]
+    mean = X.mean(axis=0, dtype=np.float64)
+    squared_sum = np.zeros(X.shape[1], dtype=np.float64)
+    for batch in gen_batches(n_samples, batch_size):
+        squared_sum += np.einsum('ij,ij->j', X[batch], X[batch],
+                                 dtype=np.float64)
+    return np.maximum(squared_sum / n_samples - mean ** 2, 0)
+
+
+def _dense_inertia(X, centers, labels, batch_size=10000):
+    """Sum of squared distances of the samples of X to their centers
+
+    Computed in batches so no temporary of the size of X is allocated.
+    """
+    inertia = 0.0
+    for batch in gen_batches(X.shape[0], batch_size):
+        diff = X[batch] - centers[labels[batch]]
+        inertia += np.einsum('ij,ij->', diff, diff, dtype=np.float64)
+    return inertia
+
+
 def _tolerance(X, tol):
     """Return a tolerance which is independent of the dataset"""
     if sp.issparse(X):
         variances = mean_variance_axis(X, axis=0)[1]
     else:
-        variances = np.var(X, axis=0)
+        variances = _dense_variances(X)
     return np.mean(variances) * tol
 
 
 def k_means(X, n_clusters, init='k-means++', precompute_distances='auto',
             n_init=10, max_iter=300, verbose=False,
             tol=1e-4, random_state=None, copy_x=True, n_jobs=1,
-            algorithm="auto", return_n_iter=False):
+            algorithm="auto", return_n_iter=False, monitor=None):
     """K-means clustering algorithm.
 
     Read more in the :ref:`User Guide <k_means>`.
@@ -192,13 +383,22 @@ def k_means(X, n_clusters, init='k-means++', precompute_distances='auto',
         centroid seeds. The final results will be the best output of
         n_init consecutive runs in terms of inertia.
 
-    init : {'k-means++', 'random', or ndarray, or a callable}, optional
+    init : {'k-means++', 'k-means||', 'k-means++-sample',
+            'random', or ndarray, or a callable}, optional
         Method for initialization, default to 'k-means++':
 
         'k-means++' : selects initial cluster centers for k-mean
         clustering in a smart way to speed up convergence. See section
         Notes in k_init for more details.
 
+        'k-means||' : scalable k-means++. Oversamples candidates in a few
+        passes over the data and reclusters the weighted candidates. Much
+        cheaper than 'k-means++' for many clusters on large data. See
+        _k_init_parallel.
+
+        'k-means++-sample' : k-means++ on a random subset of 10 samples per
+        cluster.
+
         'random': generate k centroids from a Gaussian with mean and
         variance estimated from the data.
 
@@ -208,11 +408,13 @@ def k_means(X, n_clusters, init='k-means++', precompute_distances='auto',
         If a callable is passed, it should take arguments X, k and
         and a random state and return an initialization.
 
-    algorithm : "auto", "full" or "elkan", default="auto"
+    algorithm : "auto", "full", "elkan" or "spherical", default="auto"
         K-means algorithm to use. The classical EM-style algorithm is "full".
         The "elkan" variation is more efficient by using the triangle
         inequality, but currently doesn't support sparse data. "auto" chooses
-        "elkan" for dense data and "full" for sparse data.
+        "elkan" for dense data and "full" for sparse data. "spherical" runs
+        spherical (cosine) k-means with the Elkan bounds on the unit
+        normalized data; it needs dense data and at least 2 clusters.
 
     precompute_distances : {'auto', True, False}
         Precompute distances (faster but takes more memory).
@@ -241,20 +443,33 @@ def k_means(X, n_clusters, init='k-means++', precompute_distances='auto',
         the data first.  If copy_x is True, then the original data is not
         modified.  If False, the original data is modified, and put back before
         the function returns, but small numerical differences may be introduced
-        by subtracting and then adding the data mean.
+        by subtracting and then adding the data mean. For the "spherical"
+        algorithm copy_x=False leaves X normalized in place.
+
+        float32 and float64 input keep their dtype throughout. With
+        copy_x=False and C ordered float32 input no copy of X is made at all,
+        which halves the memory compared to float64.
 
     n_jobs : int
-        The number of jobs to use for the computation. This works by computing
-        each of the n_init runs in parallel.
+        The number of OpenMP threads to use for the computation. The n_init
+        runs are performed one after the other and each run splits its label
+        assignment and center computation across the threads, so the data is
+        never copied per worker.
 
-        If -1 all CPUs are used. If 1 is given, no parallel computing code is
-        used at all, which is useful for debugging. For n_jobs below -1,
+        If -1 all CPUs are used. If 1 is given, a single thread is used,
+        which is useful for debugging. For n_jobs below -1,
         (n_cpus + 1 + n_jobs) are used. Thus for n_jobs = -2, all CPUs but one
         are used.
 
     return_n_iter : bool, optional
         Whether or not to return the number of iterations.
 
+    monitor : callable, optional
+        Called after every iteration with the inertia, the center shift and
+        the labels of the iteration. The run stops early once it returns
+        True, for instance a helpers.convergence.ConvergenceMonitor. With
+        n_init > 1 it is called for the iterations of every run in turn.
+
     Returns
     -------
     centroid : float ndarray with shape (k, n_features)
@@ -283,6 +498,19 @@ def k_means(X, n_clusters, init='k-means++', precompute_distances='auto',
                          ' got %d instead' % max_iter)
 
     X = as_float_array(X, copy=copy_x)
+
+    spherical = algorithm == "spherical"
+    if spherical:
+        if sp.issparse(X):
+            raise ValueError("algorithm='spherical' not supported for sparse "
+                             "input X")
+        if n_clusters < 2:
+            raise ValueError("algorithm='spherical' needs at least 2 "
+                             "clusters, got %d" % n_clusters)
+        # Spherical k-means works on the unit sphere. The copy, if any, was
+        # already made above.
+        X = normalize(X, copy=False)
+
     tol = _tolerance(X, tol)
 
     # If the distances are precomputed every job will create a matrix of shape
@@ -311,9 +539,15 @@ def k_means(X, n_clusters, init='k-means++', precompute_distances='auto',
                 % n_init, RuntimeWarning, stacklevel=2)
             n_init = 1
 
-    # subtract of mean of x for more accurate distance computations
-    if not sp.issparse(X):
-        X_mean = X.mean(axis=0)
+    if spherical and hasattr(init, '__array__'):
+        init = normalize(init, copy=False)
+
+    # subtract of mean of x for more accurate distance computations.
+    # Centering would move the data off the unit sphere for spherical k-means.
+    center_data = not sp.issparse(X) and not spherical
+    if center_data:
+        # Accumulate in double precision but keep the dtype of X.
+        X_mean = X.mean(axis=0, dtype=np.float64).astype(X.dtype)
         # The copy was already done above
         X -= X_mean
 
@@ -324,7 +558,7 @@ def k_means(X, n_clusters, init='k-means++', precompute_distances='auto',
     x_squared_norms = row_norms(X, squared=True)
 
     best_labels, best_inertia, best_centers = None, None, None
-    if n_clusters == 1:
+    if n_clusters == 1 and not spherical:
         # elkan doesn't make sense for a single cluster, full will produce
         # the right result.
         algorithm = "full"
@@ -334,44 +568,30 @@ def k_means(X, n_clusters, init='k-means++', precompute_distances='auto',
         kmeans_single = _kmeans_single_lloyd
     elif algorithm == "elkan":
         kmeans_single = _kmeans_single_elkan
+    elif algorithm == "spherical":
+        kmeans_single = partial(_kmeans_single_elkan, spherical=True)
     else:
-        raise ValueError("Algorithm must be 'auto', 'full' or 'elkan', got"
-                         " %s" % str(algorithm))
-    if n_jobs == 1:
-        # For a single thread, less memory is needed if we just store one set
-        # of the best results (as opposed to one set per run per thread).
-        for it in range(n_init):
-            # run a k-means once
-            labels, inertia, centers, n_iter_ = kmeans_single(
-                X, n_clusters, max_iter=max_iter, init=init, verbose=verbose,
-                precompute_distances=precompute_distances, tol=tol,
-                x_squared_norms=x_squared_norms, random_state=random_state)
-            # determine if these results are the best so far
-            if best_inertia is None or inertia < best_inertia:
-                best_labels = labels.copy()
-                best_centers = centers.copy()
-                best_inertia = inertia
-                best_n_iter = n_iter_
-    else:
-        # parallelisation of k-means runs
-        seeds = random_state.randint(np.iinfo(np.int32).max, size=n_init)
-        results = Parallel(n_jobs=n_jobs, verbose=0)(
-            delayed(kmeans_single)(X, n_clusters, max_iter=max_iter, init=init,
-                                   verbose=verbose, tol=tol,
-                                   precompute_distances=precompute_distances,
-                                   x_squared_norms=x_squared_norms,
-                                   # Change seed to ensure variety
-                                   random_state=seed)
-            for seed in seeds)
-        # Get results with the lowest inertia
-        labels, inertia, centers, n_iters = zip(*results)
-        best = np.argmin(inertia)
-        best_labels = labels[best]
-        best_inertia = inertia[best]
-        best_centers = centers[best]
-        best_n_iter = n_iters[best]
-
-    if not sp.issparse(X):
+        raise ValueError("Algorithm must be 'auto', 'full', 'elkan' or "
+                         "'spherical', got %s" % str(algorithm))
+    n_threads = _get_n_threads(n_jobs)
+
+    # The runs share X and are parallelised internally, so only one set of the
+    # best results needs to be stored.
+    for it in range(n_init):
+        # run a k-means once
+        labels, inertia, centers, n_iter_ = kmeans_single(
+            X, n_clusters, max_iter=max_iter, init=init, verbose=verbose,
+            precompute_distances=precompute_distances, tol=tol,
+            x_squared_norms=x_squared_norms, random_state=random_state,
+            n_threads=n_threads, monitor=monitor)
+        # determine if these results are the best so far
+        if best_inertia is None or inertia < best_inertia:
+            best_labels = labels.copy()
+            best_centers = centers.copy()
+            best_inertia = inertia
+            best_n_iter = n_iter_
+
+    if center_data:
         if not copy_x:
             X += X_mean
         best_centers += X_mean
@@ -385,7 +605,8 @@ def k_means(X, n_clusters, init='k-means++', precompute_distances='auto',
 def _kmeans_single_elkan(X, n_clusters, max_iter=300, init='k-means++',
                          verbose=False, x_squared_norms=None,
                          random_state=None, tol=1e-4,
-                         precompute_distances=True):
+                         precompute_distances=True, n_threads=1,
+                         spherical=False, monitor=None):
     if sp.issparse(X):
         raise ValueError("algorithm='elkan' not supported for sparse input X")
     X = check_array(X, order="C")
@@ -396,18 +617,33 @@ def _kmeans_single_elkan(X, n_clusters, max_iter=300, init='k-means++',
     centers = _init_centroids(X, n_clusters, init, random_state=random_state,
                               x_squared_norms=x_squared_norms)
     centers = np.ascontiguousarray(centers)
+    if spherical:
+        centers = normalize(centers, copy=False)
     if verbose:
         print('Initialization complete')
+
+    callback = None
+    if monitor is not None:
+        # Elkan's bounds do not give the exact inertia, compute it for the
+        # monitor.
+        def callback(centers, labels, center_shift):
+            return monitor(_dense_inertia(X, centers, labels), center_shift,
+                           labels)
+
     centers, labels, n_iter = k_means_elkan(X, n_clusters, centers, tol=tol,
-                                            max_iter=max_iter, verbose=verbose)
-    inertia = np.sum((X - centers[labels]) ** 2, dtype=np.float64)
+                                            max_iter=max_iter, verbose=verbose,
+                                            n_threads=n_threads,
+                                            spherical=spherical,
+                                            callback=callback)
+    inertia = _dense_inertia(X, centers, labels)
     return labels, inertia, centers, n_iter
 
 
 def _kmeans_single_lloyd(X, n_clusters, max_iter=300, init='k-means++',
                          verbose=False, x_squared_norms=None,
                          random_state=None, tol=1e-4,
-                         precompute_distances=True):
+                         precompute_distances=True, n_threads=1,
+                         monitor=None):
     """A single run of k-means, assumes preparation completed prior.
 
     Parameters
@@ -422,13 +658,22 @@ def _kmeans_single_lloyd(X, n_clusters, max_iter=300, init='k-means++',
     max_iter : int, optional, default 300
         Maximum number of iterations of the k-means algorithm to run.
 
-    init : {'k-means++', 'random', or ndarray, or a callable}, optional
+    init : {'k-means++', 'k-means||', 'k-means++-sample',
+            'random', or ndarray, or a callable}, optional
         Method for initialization, default to 'k-means++':
 
         'k-means++' : selects initial cluster centers for k-mean
         clustering in a smart way to speed up convergence. See section
         Notes in k_init for more details.
 
+        'k-means||' : scalable k-means++. Oversamples candidates in a few
+        passes over the data and reclusters the weighted candidates. Much
+        cheaper than 'k-means++' for many clusters on large data. See
+        _k_init_parallel.
+
+        'k-means++-sample' : k-means++ on a random subset of 10 samples per
+        cluster.
+
         'random': generate k centroids from a Gaussian with mean and
         variance estimated from the data.
 
@@ -455,6 +700,13 @@ def _kmeans_single_lloyd(X, n_clusters, max_iter=300, init='k-means++',
         given, it fixes the seed. Defaults to the global numpy random
         number generator.
 
+    n_threads : int, default: 1
+        Number of OpenMP threads used by the assignment and center kernels.
+
+    monitor : callable, optional
+        Called after every iteration with the inertia, the center shift and
+        the labels. The iterations stop once it returns True.
+
     Returns
     -------
     centroid : float ndarray with shape (k, n_features)
@@ -491,14 +743,15 @@ def _kmeans_single_lloyd(X, n_clusters, max_iter=300, init='k-means++',
         labels, inertia = \
             _labels_inertia(X, x_squared_norms, centers,
                             precompute_distances=precompute_distances,
-                            distances=distances)
+                            distances=distances, n_threads=n_threads)
 
         # computation of the means is also called the M-step of EM
         if sp.issparse(X):
             centers = _k_means._centers_sparse(X, labels, n_clusters,
                                                distances)
         else:
-            centers = _k_means._centers_dense(X, labels, n_clusters, distances)
+            centers = _k_means._centers_dense(X, labels, n_clusters, distances,
+                                              n_threads=n_threads)
 
         if verbose:
             print("Iteration %2d, inertia %.3f" % (i, inertia))
@@ -516,13 +769,19 @@ def _kmeans_single_lloyd(X, n_clusters, max_iter=300, init='k-means++',
                       % (i, center_shift_total, tol))
             break
 
+        if monitor is not None and monitor(inertia, center_shift_total,
+                                           labels):
+            if verbose:
+                print("Stopped by the monitor at iteration %d" % i)
+            break
+
     if center_shift_total > 0:
         # rerun E-step in case of non-convergence so that predicted labels
         # match cluster centers
         best_labels, best_inertia = \
             _labels_inertia(X, x_squared_norms, best_centers,
                             precompute_distances=precompute_distances,
-                            distances=distances)
+                            distances=distances, n_threads=n_threads)
 
     return best_labels, best_inertia, best_centers, i + 1
 
@@ -572,7 +831,7 @@ def _labels_inertia_precompute_dense(X, x_squared_norms, centers, distances):
 
 
 def _labels_inertia(X, x_squared_norms, centers,
-                    precompute_distances=True, distances=None):
+                    precompute_distances=True, distances=None, n_threads=1):
     """E step of the K-means EM algorithm.
 
     Compute the labels and the inertia of the given samples and centers.
@@ -597,6 +856,9 @@ def _labels_inertia(X, x_squared_norms, centers,
         Pre-allocated array to be filled in with each sample's distance
         to the closest center.
 
+    n_threads : int, default: 1
+        Number of OpenMP threads used for the dense assignment.
+
     Returns
     -------
     labels : int array of shape(n)
@@ -619,8 +881,12 @@ def _labels_inertia(X, x_squared_norms, centers,
         if precompute_distances:
             return _labels_inertia_precompute_dense(X, x_squared_norms,
                                                     centers, distances)
+        # The blocked GEMM kernel reads rows of X and centers directly from
+        # memory. This is a no-op for the C ordered arrays used in fit.
         inertia = _k_means._assign_labels_array(
-            X, x_squared_norms, centers, labels, distances=distances)
+            np.ascontiguousarray(X), x_squared_norms,
+            np.ascontiguousarray(centers), labels, distances=distances,
+            n_threads=n_threads)
     return labels, inertia
 
 
@@ -636,7 +902,8 @@ def _init_centroids(X, k, init, random_state=None, x_squared_norms=None,
     k : int
         number of centroids
 
-    init : {'k-means++', 'random' or ndarray or callable} optional
+    init : {'k-means++', 'k-means||', 'k-means++-sample', 'random' or
+            ndarray or callable} optional
         Method for initialization
 
     random_state : integer or numpy.RandomState, optional
@@ -682,6 +949,12 @@ def _init_centroids(X, k, init, random_state=None, x_squared_norms=None,
     if isinstance(init, string_types) and init == 'k-means++':
         centers = _k_init(X, k, random_state=random_state,
                           x_squared_norms=x_squared_norms)
+    elif isinstance(init, string_types) and init == 'k-means||':
+        centers = _k_init_parallel(X, k, random_state=random_state,
+                                   x_squared_norms=x_squared_norms)
+    elif isinstance(init, string_types) and init == 'k-means++-sample':
+        centers = _k_init_sample(X, k, random_state=random_state,
+                                 x_squared_norms=x_squared_norms)
     elif isinstance(init, string_types) and init == 'random':
         seeds = random_state.permutation(n_samples)[:k]
         centers = X[seeds]
@@ -694,7 +967,8 @@ def _init_centroids(X, k, init, random_state=None, x_squared_norms=None,
         centers = np.asarray(centers, dtype=X.dtype)
     else:
         raise ValueError("the init parameter for the k-means should "
-                         "be 'k-means++' or 'random' or an ndarray, "
+                         "be 'k-means++', 'k-means||', 'k-means++-sample' "
+                         "or 'random' or an ndarray, "
                          "'%s' (type '%s') was passed." % (init, type(init)))
 
     if sp.issparse(centers):
@@ -725,24 +999,35 @@ class KMeans(BaseEstimator, ClusterMixin, TransformerMixin):
         centroid seeds. The final results will be the best output of
         n_init consecutive runs in terms of inertia.
 
-    init : {'k-means++', 'random' or an ndarray}
+    init : {'k-means++', 'k-means||', 'k-means++-sample',
+            'random' or an ndarray}
         Method for initialization, defaults to 'k-means++':
 
         'k-means++' : selects initial cluster centers for k-mean
         clustering in a smart way to speed up convergence. See section
         Notes in k_init for more details.
 
+        'k-means||' : scalable k-means++. Oversamples candidates in a few
+        passes over the data and reclusters the weighted candidates. Much
+        cheaper than 'k-means++' for many clusters on large data. See
+        _k_init_parallel.
+
+        'k-means++-sample' : k-means++ on a random subset of 10 samples per
+        cluster.
+
         'random': choose k observations (rows) at random from data for
         the initial centroids.
 
         If an ndarray is passed, it should be of shape (n_clusters, n_features)
         and gives the initial centers.
 
-    algorithm : "auto", "full" or "elkan", default="auto"
+    algorithm : "auto", "full", "elkan" or "spherical", default="auto"
         K-means algorithm to use. The classical EM-style algorithm is "full".
         The "elkan" variation is more efficient by using the triangle
         inequality, but currently doesn't support sparse data. "auto" chooses
-        "elkan" for dense data and "full" for sparse data.
+        "elkan" for dense data and "full" for sparse data. "spherical" runs
+        spherical (cosine) k-means with the Elkan bounds on the unit
+        normalized data; it needs dense data and at least 2 clusters.
 
     precompute_distances : {'auto', True, False}
         Precompute distances (faster but takes more memory).
@@ -759,11 +1044,13 @@ class KMeans(BaseEstimator, ClusterMixin, TransformerMixin):
         Relative tolerance with regards to inertia to declare convergence
 
     n_jobs : int
-        The number of jobs to use for the computation. This works by computing
-        each of the n_init runs in parallel.
+        The number of OpenMP threads to use for the computation. The n_init
+        runs are performed one after the other and each run splits its label
+        assignment and center computation across the threads, so the data is
+        never copied per worker.
 
-        If -1 all CPUs are used. If 1 is given, no parallel computing code is
-        used at all, which is useful for debugging. For n_jobs below -1,
+        If -1 all CPUs are used. If 1 is given, a single thread is used,
+        which is useful for debugging. For n_jobs below -1,
         (n_cpus + 1 + n_jobs) are used. Thus for n_jobs = -2, all CPUs but one
         are used.
 
@@ -869,15 +1156,25 @@ class KMeans(BaseEstimator, ClusterMixin, TransformerMixin):
                              "Got %d features, expected %d" % (
                                  n_features, expected_n_features))
 
+        if self.algorithm == 'spherical':
+            # The centers live on the unit sphere so the samples must as well
+            # for the closest center to be the most cosine similar one.
+            X = normalize(X)
+
         return X
 
-    def fit(self, X, y=None):
+    def fit(self, X, y=None, monitor=None):
         """Compute k-means clustering.
 
         Parameters
         ----------
         X : array-like or sparse matrix, shape=(n_samples, n_features)
             Training instances to cluster.
+
+        monitor : callable, optional
+            Called after every iteration with the inertia, the center shift
+            and the labels. The run stops early once it returns True. See
+            k_means.
         """
         random_state = check_random_state(self.random_state)
         X = self._check_fit_data(X)
@@ -889,7 +1186,7 @@ class KMeans(BaseEstimator, ClusterMixin, TransformerMixin):
                 precompute_distances=self.precompute_distances,
                 tol=self.tol, random_state=random_state, copy_x=self.copy_x,
                 n_jobs=self.n_jobs, algorithm=self.algorithm,
-                return_n_iter=True)
+                return_n_iter=True, monitor=monitor)
         return self
 
     def fit_predict(self, X, y=None):
@@ -959,7 +1256,8 @@ class KMeans(BaseEstimator, ClusterMixin, TransformerMixin):
 
         X = self._check_test_data(X)
         x_squared_norms = row_norms(X, squared=True)
-        return _labels_inertia(X, x_squared_norms, self.cluster_centers_)[0]
+        return _labels_inertia(X, x_squared_norms, self.cluster_centers_,
+                               n_threads=_get_n_threads(self.n_jobs))[0]
 
     def score(self, X, y=None):
         """Opposite of the value of X on the K-means objective.
@@ -978,7 +1276,8 @@ class KMeans(BaseEstimator, ClusterMixin, TransformerMixin):
 
         X = self._check_test_data(X)
         x_squared_norms = row_norms(X, squared=True)
-        return -_labels_inertia(X, x_squared_norms, self.cluster_centers_)[1]
+        return -_labels_inertia(X, x_squared_norms, self.cluster_centers_,
+                                n_threads=_get_n_threads(self.n_jobs))[1]
 
 
 def _mini_batch_step(X, x_squared_norms, centers, counts,
@@ -1226,13 +1525,22 @@ class MiniBatchKMeans(KMeans):
         only algorithm is initialized by running a batch KMeans on a
         random subset of the data. This needs to be larger than n_clusters.
 
-    init : {'k-means++', 'random' or an ndarray}, default: 'k-means++'
+    init : {'k-means++', 'k-means||', 'k-means++-sample',
+            'random' or an ndarray}, default: 'k-means++'
         Method for initialization, defaults to 'k-means++':
 
         'k-means++' : selects initial cluster centers for k-mean
         clustering in a smart way to speed up convergence. See section
         Notes in k_init for more details.
 
+        'k-means||' : scalable k-means++. Oversamples candidates in a few
+        passes over the data and reclusters the weighted candidates. Much
+        cheaper than 'k-means++' for many clusters on large data. See
+        _k_init_parallel.
+
+        'k-means++-sample' : k-means++ on a random subset of 10 samples per
+        cluster.
+
         'random': choose k observations (rows) at random from data for
         the initial centroids.
 
@@ -0,0 +1,230 @@
+import hashlib
+import json
+import os
+import time
+
+import numpy as np
+
+from helpers.printhelper import PrintHelper as ph
+from helpers.layer_predictor import load_layer_predictor
+
+
+def hash_array(data):
+    """
+    :returns: The hex digest of the shape, dtype and contents of an array.
+    """
+    data = np.ascontiguousarray(data)
+    h = hashlib.sha1()
+    h.update(str((data.shape, data.dtype.str)).encode('utf-8'))
+    h.update(data.view(np.uint8).reshape(-1))
+    return h.hexdigest()
+
+
+def hash_config(upstream, config):
+    """
+    Chain the hash of everything upstream of a layer with the settings the
+    layer is built with.
+
+    :param upstream: The hash of the layer input.
+    :param config: A json serializable dictionary of the layer settings.
+    """
+    h = hashlib.sha1()
+    h.update(upstream.encode('utf-8'))
+    h.update(json.dumps(config, sort_keys=True, default=str).encode('utf-8'))
+    return h.hexdigest()
+
+
+def get_checkpoint_dir(extra_path):
+    """
+    The default directory of the layer checkpoints of a build.
+    """
+    return 'data/centroids/python_' + extra_path + '/checkpoint/'
+
+
+class LayerCheckpointer(object):
+    """
+    Checkpoints the anchor vectors of every layer of a build so a failed
+    build can resume after the last layer that finished.
+
+    The checkpoints form a hash chain. The key of a layer hashes the key of
+    the layer before, its anchor vectors and the settings of the layer. The
+    first layer starts from the hash of the training data. Checkpoints are
+    stored under their key, so changing the data, a setting or the anchor
+    vectors of any layer rebuilds everything downstream of it.
+
+    As every configuration keeps its own checkpoints, builds that share the
+    data and the settings of their first layers reuse those layers. With
+    cache_inputs the input of each layer is kept as well so a reused prefix
+    is not forwarded again.
+
+    A layer that is not clustered gets random weights, the chain ends there.
+    """
+
+    def __init__(self, checkpoint_dir, train_data, cache_inputs=False):
+        """
+        Constructor
+
+        :param checkpoint_dir: The directory the checkpoints are kept in.
+        :param train_data: The data the build starts from.
+        :param cache_inputs: Also keep the input of every layer.
+        """
+        if not os.path.exists(checkpoint_dir):
+            os.makedirs(checkpoint_dir)
+
+        self.checkpoint_dir = checkpoint_dir
+        self.cache_inputs   = cache_inputs
+        # The hash of the input of the next layer. None once the chain ended.
+        self.upstream       = hash_array(train_data)
+        self.start_times    = {}
+
+
+    def get_checkpoint_loc(self, key):
+        return os.path.join(self.checkpoint_dir, 'layer_%s.npz' % key)
+
+
+    def get_predictor_loc(self, key):
+        return os.path.join(self.checkpoint_dir, 'predictor_%s.npz' % key)
+
+
+    def get_input_loc(self, upstream, input_config):
+        """
+        :param input_config: The settings that decide the shape of the input
+        given the layers upstream.
+        """
+        key = hash_config(upstream, input_config)
+        return os.path.join(self.checkpoint_dir, 'input_%s.npy' % key)
+
+
+    def start_layer(self, layer_index):
+        self.start_times[layer_index] = time.time()
+
+
+    def load(self, layer_index, config):
+        """
+        Load the anchor vectors of a layer if there is a valid checkpoint.
+
+        :param config: The settings of the layer. See hash_config.
+
+        :returns: The anchor vectors and the LayerPredictor checkpointed with
+        them. The anchor vectors are None if the layer has to be built, the
+        predictor if there is none.
+        """
+        if self.upstream is None:
+            return None, None
+
+        key = hash_config(self.upstream, config)
+        filename = self.get_checkpoint_loc(key)
+        if not os.path.exists(filename):
+            return None, None
+
+        saved = np.load(filename)
+        if str(saved['key']) != key:
+            ph.disp('Checkpoint of layer %i is corrupt' % layer_index,
+                    ph.WARNING)
+            return None, None
+
+        self.upstream = str(saved['out_key'])
+        ph.disp('Resuming layer %i from its checkpoint, it took %.2fs to build' %
+                (layer_index, float(saved['seconds'])), ph.OKGREEN)
+
+        weights = saved['weights']
+        anchor_vecs = weights.reshape(len(weights), -1)
+        if len(weights.shape) == 2:
+            # The dense weights are the anchor vectors reshaped to
+            # (input_dim, output_dim).
+            anchor_vecs = weights.reshape(weights.shape[1], -1)
+
+        predictor = load_layer_predictor(self.get_predictor_loc(key),
+                len(anchor_vecs))
+        if predictor is not None and (predictor.anchor_vecs.shape != anchor_vecs.shape
+                or not np.allclose(predictor.anchor_vecs, anchor_vecs)):
+            ph.disp('The predictor of layer %i does not match its checkpoint' %
+                    layer_index, ph.WARNING)
+            predictor = None
+
+        return weights, predictor
+
+
+    def save(self, layer_index, config, weights, input_data, selected=None,
+            predictor=None):
+        """
+        Checkpoint a layer that was just built.
+
+        :param weights: The anchor vectors of the layer.
+        :param input_data: The input the layer was clustered from.
+        :param selected: The indices of the samples selected for clustering.
+        None if unknown.
+        :param predictor: The LayerPredictor of the layer. None if it has none.
+        """
+        # Anchor vectors loaded from CSV are still strings.
+        weights = np.asarray(weights, dtype=np.float64)
+
+        key = hash_config(self.upstream, config)
+        out_key = hash_config(key, {'weights': hash_array(weights)})
+
+        seconds = 0.0
+        if layer_index in self.start_times:
+            seconds = time.time() - self.start_times[layer_index]
+        if selected is None:
+            selected = np.empty(0, dtype=np.int64)
+
+        # Written under another name first so a crash never leaves half a
+        # checkpoint behind. The name is unique to the process as builds in
+        # several processes can share the directory.
+        if predictor is not None:
+            predictor_filename = self.get_predictor_loc(key)
+            tmp_filename = '%s.%i.tmp' % (predictor_filename, os.getpid())
+            with open(tmp_filename, 'wb') as f:
+                predictor.save(f)
+            os.replace(tmp_filename, predictor_filename)
+
+        filename = self.get_checkpoint_loc(key)
+        tmp_filename = '%s.%i.tmp' % (filename, os.getpid())
+        with open(tmp_filename, 'wb') as f:
+            np.savez(f, key=key, out_key=out_key, weights=weights,
+                    input_hash=hash_array(input_data), selected=selected,
+                    seconds=seconds, config=json.dumps(config, sort_keys=True,
+                        default=str))
+        os.replace(tmp_filename, filename)
+
+        self.upstream = out_key
+
+
+    def load_input(self, input_config):
+        """
+        :returns: The cached input of the next layer memory mapped or None if
+        it has to be computed.
+        """
+        if not self.cache_inputs or self.upstream is None:
+            return None
+
+        filename = self.get_input_loc(self.upstream, input_config)
+        if not os.path.exists(filename):
+            return None
+
+        ph.disp('Loading the cached layer input')
+        # Copy on write so the cached input is never changed.
+        return np.load(filename, mmap_mode='c')
+
+
+    def save_input(self, input_data, input_config):
+        """
+        Cache the input of the next layer.
+
+        :param input_config: See get_input_loc.
+        """
+        if not self.cache_inputs or self.upstream is None:
+            return
+
+        filename = self.get_input_loc(self.upstream, input_config)
+        tmp_filename = '%s.%i.tmp' % (filename, os.getpid())
+        with open(tmp_filename, 'wb') as f:
+            np.save(f, input_data)
+        os.replace(tmp_filename, filename)
+
+
+    def end_chain(self):
+        """
+        Stop resuming, the input of the next layers cannot be reproduced.
+        """
+        self.upstream = None
@@ -0,0 +1,279 @@
+import threading
+import time
+
+import numpy as np
+from sklearn.utils import check_random_state
+from sklearn.utils import gen_batches
+
+from helpers.printhelper import PrintHelper as ph
+
+
+# The number of rows whose distances are held in memory at a time.
+BLOCK_SIZE = 1024
+
+
+def _prepare(X, metric):
+    """
+    Copy X into a float32 matrix with one row per sample and precompute what
+    the distance computation needs. Cosine rows are normalized, euclidean rows
+    get their squared norms.
+    """
+    X = np.array(X, dtype=np.float32)
+    X = X.reshape(len(X), -1)
+    sq_norms = np.einsum('ij,ij->i', X, X)
+
+    if metric == 'cosine':
+        norms = np.sqrt(sq_norms)
+        norms[norms == 0.0] = 1.0
+        X /= norms[:, np.newaxis]
+    elif metric != 'euclidean':
+        raise ValueError('Unsupported metric %s' % metric)
+
+    return X, sq_norms
+
+
+def _pairwise(A, B, metric, a_sq_norms=None, b_sq_norms=None):
+    """
+    The distances between the rows of A and B as a single matrix product.
+    """
+    dots = np.dot(A, B.T)
+    if metric == 'cosine':
+        dists = 1.0 - dots
+    else:
+        dists = a_sq_norms[:, np.newaxis] - 2.0 * dots
+        dists += b_sq_norms[np.newaxis, :]
+        np.sqrt(np.maximum(dists, 0.0, out=dists), out=dists)
+    return np.maximum(dists, 0.0, out=dists)
+
+
+def _silhouette_from_ab(intra, inter):
+    return (inter - intra) / np.maximum(np.maximum(intra, inter),
+            np.finfo(np.float32).eps)
+
+
+def sampled_silhouette(X, labels, metric='cosine', sample_size=5000,
+        block_size=BLOCK_SIZE, random_state=None):
+    """
+    The mean silhouette coefficient over a random sample of X.
+
+    Only block_size rows of the sample by sample distance matrix exist at a
+    time. The summed distance of each row to every cluster is a product of
+    the block with a one hot label matrix, so no python loop runs over the
+    samples or clusters.
+
+    :param metric: 'cosine' or 'euclidean'.
+    :param sample_size: The number of samples to score. None for all of X.
+
+    :returns: The silhouette score or 0.0 if there is only a single cluster.
+    """
+    random_state = check_random_state(random_state)
+    labels = np.asarray(labels)
+    n_samples = len(labels)
+
+    if sample_size is not None and sample_size < n_samples:
+        indices = np.sort(random_state.choice(n_samples, sample_size,
+            replace=False))
+        X = X[indices]
+        labels = labels[indices]
+
+    _, labels = np.unique(labels, return_inverse=True)
+    n_clusters = labels.max() + 1
+    if n_clusters < 2:
+        return 0.0
+
+    X, sq_norms = _prepare(X, metric)
+    n_samples = len(X)
+
+    counts = np.bincount(labels, minlength=n_clusters).astype(np.float32)
+    onehot = np.zeros((n_samples, n_clusters), dtype=np.float32)
+    onehot[np.arange(n_samples), labels] = 1.0
+
+    scores = np.empty(n_samples, dtype=np.float32)
+    for block in gen_batches(n_samples, block_size):
+        block_labels = labels[block]
+        rows = np.arange(len(block_labels))
+
+        cluster_dists = _pairwise(X[block], X, metric, sq_norms[block],
+                sq_norms).dot(onehot)
+
+        # The distance of a sample to itself is 0 so only the count changes.
+        intra = cluster_dists[rows, block_labels] / np.maximum(
+                counts[block_labels] - 1.0, 1.0)
+
+        cluster_dists /= counts
+        cluster_dists[rows, block_labels] = np.inf
+        inter = cluster_dists.min(axis=1)
+
+        block_scores = _silhouette_from_ab(intra, inter)
+        # A sample alone in its cluster has a silhouette of 0 by definition.
+        block_scores[counts[block_labels] == 1] = 0.0
+        scores[block] = block_scores
+
+    return float(scores.mean())
+
+
+def simplified_silhouette(X, labels, centers, metric='cosine',
+        sample_size=None, block_size=BLOCK_SIZE, random_state=None):
+    """
+    The simplified silhouette which measures the distance of a sample to the
+    cluster centers instead of to every other sample. This is linear in the
+    number of samples so it is cheap enough to run on all of X.
+
+    :param centers: The cluster centers, labels index into these.
+    :param metric: 'cosine' or 'euclidean'.
+    :param sample_size: The number of samples to score. None for all of X.
+
+    :returns: The simplified silhouette score.
+    """
+    random_state = check_random_state(random_state)
+    labels = np.asarray(labels)
+    n_samples = len(labels)
+
+    if len(centers) < 2:
+        return 0.0
+
+    if sample_size is not None and sample_size < n_samples:
+        indices = np.sort(random_state.choice(n_samples, sample_size,
+            replace=False))
+        X = X[indices]
+        labels = labels[indices]
+        n_samples = sample_size
+
+    centers, center_sq_norms = _prepare(centers, metric)
+
+    total = 0.0
+    for block in gen_batches(n_samples, block_size):
+        block_data, block_sq_norms = _prepare(X[block], metric)
+        block_labels = labels[block]
+        rows = np.arange(len(block_labels))
+
+        dists = _pairwise(block_data, centers, metric, block_sq_norms,
+                center_sq_norms)
+        intra = dists[rows, block_labels].copy()
+        dists[rows, block_labels] = np.inf
+        inter = dists.min(axis=1)
+
+        total += _silhouette_from_ab(intra, inter).sum(dtype=np.float64)
+
+    return float(total / n_samples)
+
+
+class QualityResult(object):
+    """
+    The outcome of scoring a clustering. The score and the seconds it took are
+    None until the scoring is done.
+    """
+
+    def __init__(self, method, metric):
+        self.method  = method
+        self.metric  = metric
+        self.score   = None
+        self.seconds = None
+        self.thread  = None
+
+
+    def wait(self):
+        """
+        Block until the score is computed.
+
+        :returns: The score.
+        """
+        if self.thread is not None:
+            self.thread.join()
+        return self.score
+
+
+class QualityScorer(object):
+    """
+    Scores clusterings for logging. The scoring can be turned off, run in
+    line or run on a background thread so it overlaps with the next steps.
+    The heavy lifting is in BLAS which releases the GIL.
+    """
+
+    MODES = ['none', 'sync', 'async']
+    METHODS = ['sampled', 'simplified']
+
+    def __init__(self, mode='sync', method='sampled', sample_size=5000,
+            random_state=None):
+        """
+        Constructor
+
+        :param mode: 'none' to skip scoring, 'sync' to score before returning
+        or 'async' to score on a background thread.
+        :param method: 'sampled' for the silhouette over a random sample or
+        'simplified' for the simplified silhouette using the centers.
+        :param sample_size: The number of samples to score. None for all.
+        """
+        if mode not in self.MODES:
+            raise ValueError('Invalid quality mode %s' % mode)
+        if method not in self.METHODS:
+            raise ValueError('Invalid quality method %s' % method)
+
+        self.mode         = mode
+        self.method       = method
+        self.sample_size  = sample_size
+        self.random_state = random_state
+        self.results      = []
+
+
+    def score(self, X, labels, centers=None, metric='cosine', pre_txt=''):
+        """
+        Score a clustering of X. The score is displayed once computed.
+
+        :param centers: The cluster centers. Needed by the simplified method.
+        :param metric: 'cosine' or 'euclidean'.
+
+        :returns: A QualityResult or None if scoring is turned off.
+        """
+        if self.mode == 'none':
+            return None
+        if self.method == 'simplified' and centers is None:
+            raise ValueError('The simplified silhouette needs the centers')
+
+        result = QualityResult(self.method, metric)
+        self.results.append(result)
+
+        if self.mode == 'async':
+            result.thread = threading.Thread(target=self.__compute,
+                    args=(X, labels, centers, result, pre_txt))
+            result.thread.daemon = True
+            result.thread.start()
+        else:
+            self.__compute(X, labels, centers, result, pre_txt)
+
+        return result
+
+
+    def wait(self):
+        """
+        Block until every pending score is computed.
+        """
+        for result in self.results:
+            result.wait()
+
+
+    @property
+    def total_seconds(self):
+        """
+        The time spent scoring so far.
+        """
+        return sum(result.seconds for result in self.results
+                if result.seconds is not None)
+
+
+    def __compute(self, X, labels, centers, result, pre_txt):
+        start = time.time()
+        if self.method == 'sampled':
+            score = sampled_silhouette(X, labels, metric=result.metric,
+                    sample_size=self.sample_size,
+                    random_state=self.random_state)
+        else:
+            score = simplified_silhouette(X, labels, centers,
+                    metric=result.metric, sample_size=self.sample_size,
+                    random_state=self.random_state)
+
+        result.seconds = time.time() - start
+        result.score = score
+
+        ph.disp(pre_txt + 'Got a %s %s silhouette of %.4f in %.2fs' %
+                (self.method, result.metric, score, result.seconds))
@@ -0,0 +1,242 @@
+import time
+
+import numpy as np
+from sklearn.utils import check_random_state
+from sklearn.utils import gen_batches
+
+
+# The stopping rule of the native fit of the sklearn style estimators.
+DEFAULT_MAX_ITER = 300
+DEFAULT_TOL = 1e-4
+
+
+def needs_monitor(max_iter=DEFAULT_MAX_ITER, tol=DEFAULT_TOL, time_budget=None):
+    """
+    Whether a clustering has to be followed iteration by iteration to honor
+    its stopping rule. Monitored fits run one iteration per fit call which is
+    much slower than the native fit, so only use them when the native
+    stopping rule does not do.
+    """
+    return (time_budget is not None or tol != DEFAULT_TOL or
+            max_iter != DEFAULT_MAX_ITER)
+
+
+class ConvergenceMonitor(object):
+    """
+    Records the inertia, center shift and number of reassigned samples of
+    every iteration of a clustering run and decides when to stop it early.
+
+    It is passed as the monitor of a fit and called after every iteration. The
+    call returns True once the run should stop, the reason is kept in
+    stop_reason.
+    """
+
+    def __init__(self, max_iter=DEFAULT_MAX_ITER, tol=DEFAULT_TOL, time_budget=None,
+            shift_tol=None):
+        """
+        Constructor
+
+        :param max_iter: Stop after this many iterations.
+        :param tol: Stop once the relative improvement of the inertia falls
+        below this. None to disable.
+        :param time_budget: Stop once this many seconds have passed since
+        start. None to disable.
+        :param shift_tol: Stop once the center shift falls below this. None to
+        disable.
+        """
+        self.max_iter    = max_iter
+        self.tol         = tol
+        self.time_budget = time_budget
+        self.shift_tol   = shift_tol
+        self.start()
+
+
+    def start(self):
+        """
+        Clear the history and start the clock for the time budget.
+        """
+        self.inertia      = []
+        self.center_shift = []
+        self.n_reassigned = []
+        self.elapsed      = []
+        self.stop_reason  = None
+        self.start_time   = time.time()
+        self.__prev_labels = None
+        self.__n_iter      = None
+
+
+    def __call__(self, inertia, center_shift=None, labels=None):
+        """
+        Record one iteration.
+
+        :param inertia: The inertia of the iteration.
+        :param center_shift: How far the centers moved, as measured by the
+        backend. None if unknown.
+        :param labels: The labels of the iteration. Used to count how many
+        samples changed cluster.
+
+        :returns: True if the run should stop.
+        """
+        n_reassigned = None
+        if labels is not None:
+            labels = np.array(labels, copy=True)
+            if self.__prev_labels is not None:
+                n_reassigned = int(np.count_nonzero(labels != self.__prev_labels))
+            self.__prev_labels = labels
+
+        self.inertia.append(float(inertia))
+        self.center_shift.append(None if center_shift is None else
+                float(center_shift))
+        self.n_reassigned.append(n_reassigned)
+        self.elapsed.append(time.time() - self.start_time)
+
+        self.stop_reason = self.__get_stop_reason()
+        return self.stop_reason is not None
+
+
+    def __get_stop_reason(self):
+        if self.n_reassigned[-1] == 0:
+            return 'no reassignments'
+
+        if (self.shift_tol is not None and self.center_shift[-1] is not None
+                and self.center_shift[-1] <= self.shift_tol):
+            return 'center shift'
+
+        if self.tol is not None and len(self.inertia) > 1:
+            prev_inertia = self.inertia[-2]
+            improvement = (prev_inertia - self.inertia[-1]) / max(abs(prev_inertia),
+                    np.finfo(np.float64).eps)
+            if improvement < self.tol:
+                return 'inertia'
+
+        if self.time_budget is not None and self.elapsed[-1] >= self.time_budget:
+            return 'time budget'
+
+        if self.n_iter >= self.max_iter:
+            return 'max iter'
+
+        return None
+
+
+    def record_fit(self, estimator):
+        """
+        Record a run that was fitted without the monitor. Only the final
+        inertia and the number of iterations of the estimator are known,
+        unless it kept a monitor of its own as monitor_.
+        """
+        own_monitor = getattr(estimator, 'monitor_', None)
+        if own_monitor is not None:
+            self.inertia      = list(own_monitor.inertia)
+            self.center_shift = list(own_monitor.center_shift)
+            self.n_reassigned = list(own_monitor.n_reassigned)
+            self.elapsed      = list(own_monitor.elapsed)
+            self.stop_reason  = own_monitor.stop_reason
+            return
+
+        self.inertia      = [float(estimator.inertia_)]
+        self.center_shift = [None]
+        self.n_reassigned = [None]
+        self.elapsed      = [time.time() - self.start_time]
+        self.stop_reason  = 'native fit'
+        self.__n_iter     = int(getattr(estimator, 'n_iter_', 1))
+
+
+    @property
+    def n_iter(self):
+        if self.__n_iter is not None:
+            return self.__n_iter
+        return len(self.inertia)
+
+
+    def get_stats(self):
+        """
+        :returns: The history of the run as a dictionary of lists.
+        """
+        return {
+                'inertia': self.inertia,
+                'center_shift': self.center_shift,
+                'n_reassigned': self.n_reassigned,
+                'elapsed': self.elapsed,
+                'n_iter': self.n_iter,
+                'stop_reason': self.stop_reason,
+            }
+
+
+    def summary(self):
+        if self.n_iter == 0:
+            return 'No iterations run'
+        return 'Stopped after %i iterations (%s) in %.2fs, inertia %.4f' % (
+                self.n_iter, self.stop_reason, self.elapsed[-1], self.inertia[-1])
+
+
+def fit_stepwise(estimator, X, monitor):
+    """
+    Fit an sklearn style k-means estimator one iteration at a time so a
+    monitor can follow and stop the run.
+
+    The first step uses the estimator's own initialization. Every following
+    step is a single iteration restarted from the centers of the previous one.
+
+    :param estimator: An estimator with the max_iter, init and n_init
+    parameters and the cluster_centers_, labels_ and inertia_ attributes.
+    :param monitor: A ConvergenceMonitor.
+
+    :returns: The fitted estimator.
+    """
+    max_iter = estimator.get_params()['max_iter']
+
+    estimator.set_params(max_iter=1)
+    estimator.fit(X)
+    should_stop = monitor(estimator.inertia_, labels=estimator.labels_)
+
+    while not should_stop:
+        centers = estimator.cluster_centers_
+        estimator.set_params(init=centers, n_init=1)
+        estimator.fit(X)
+
+        center_shift = np.sum((estimator.cluster_centers_ - centers) ** 2)
+        should_stop = monitor(estimator.inertia_, center_shift,
+                estimator.labels_)
+
+    estimator.set_params(max_iter=max_iter)
+    return estimator
+
+
+def fit_minibatch(estimator, X, batch_size, monitor, random_state=None):
+    """
+    Fit a MiniBatchKMeans with partial_fit one epoch over X at a time so a
+    monitor can follow and stop the run. The inertia of an epoch is the sum
+    of the inertia of its batches, so no extra pass over X is needed.
+
+    :param estimator: An unfitted MiniBatchKMeans.
+    :param batch_size: The number of samples in each batch.
+    :param monitor: A ConvergenceMonitor.
+
+    :returns: The fitted estimator with labels_ for all of X.
+    """
+    random_state = check_random_state(random_state)
+    n_samples = X.shape[0]
+    order = random_state.permutation(n_samples)
+    labels = np.empty(n_samples, dtype=np.int32)
+
+    should_stop = False
+    while not should_stop:
+        centers = None
+        if hasattr(estimator, 'cluster_centers_'):
+            centers = estimator.cluster_centers_.copy()
+
+        inertia = 0.0
+        for batch in gen_batches(n_samples, batch_size):
+            batch_indices = order[batch]
+            estimator.partial_fit(X[batch_indices])
+            labels[batch_indices] = estimator.labels_
+            inertia += estimator.inertia_
+
+        center_shift = None
+        if centers is not None:
+            center_shift = np.sum((estimator.cluster_centers_ - centers) ** 2)
+        should_stop = monitor(inertia, center_shift, labels)
+
+    # The batch labels were computed as the centers moved.
+    estimator.labels_ = estimator.predict(X)
+    return estimator
@@ -1,24 +1,106 @@
+import copy
+import itertools
+import os
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures import as_completed
+from multiprocessing import cpu_count
+
 import numpy as np
 from matplotlib import cm
 import matplotlib.pyplot as plt
 import scipy.interpolate
 from helpers.printhelper import PrintHelper as ph
+from helpers.parallel import set_n_jobs
+from helpers.warm_start import WARM_START_DIR
+from helpers.checkpoint import get_checkpoint_dir
+from helpers.result_cache import ResultCache
+from helpers.result_cache import hash_hyperparams
+
+
+def expand_grid(hyper_params_range):
+    """
+    :returns: A dictionary of the assigned hyperparameters for every point of
+    the grid, the first hyperparameter changing slowest.
+    """
+    param_names = list(hyper_params_range.keys())
+    return [dict(zip(param_names, values)) for values in
+            itertools.product(*[hyper_params_range[name] for name in param_names])]
+
+
+def evaluate_point(model_class, hyperparams, force_create, eval_func_name,
+        assigned, dataset=None):
+    """
+    Build a new model for one point of the grid and evaluate it. Run in a
+    worker process.
+
+    Each worker process writes its centroids under its own extra path and
+    keeps its own warm start centers so concurrent builds never overwrite
+    each other. The layer checkpoints stay shared so builds in different
+    workers reuse each other's layers.
+
+    :param model_class: ModelWrapper or a subclass of it.
+    :param hyperparams: The hyperparameters of the point.
+    :param assigned: The hyperparameters of the point that vary over the grid
+    keyed by name.
+    :param dataset: The dataset of the searched model if it was given one.
+
+    :returns: The point with its accuracy and whether it could be evaluated.
+    """
+    ph.DISP = False
+
+    hyperparams = copy.deepcopy(hyperparams)
+    if hyperparams.checkpoint_dir is None:
+        hyperparams.checkpoint_dir = get_checkpoint_dir(hyperparams.extra_path)
+    hyperparams.extra_path = '%s_worker%i' % (hyperparams.extra_path, os.getpid())
+    hyperparams.warm_start_dir = os.path.join(WARM_START_DIR, 'worker%i' % os.getpid())
+    model = model_class(hyperparams, force_create)
+    model.dataset = dataset
+
+    evaluated = True
+    try:
+        accuracy = getattr(model, eval_func_name)()
+    except ValueError:
+        accuracy = 0.0
+        evaluated = False
+
+    point = dict(assigned)
+    point['accuracy'] = accuracy
+    return point, evaluated
+
 
 class HyperParamSearch:
-    def __init__(self, model = None, eval_func_name = None, hyper_params_range = None, points = []):
+    def __init__(self, model = None, eval_func_name = None, hyper_params_range = None, points = None,
+            cache_loc = None):
+       """
+       Constructor
+
+       :param points: Points evaluated before.
+       :param cache_loc: The file every evaluated point is appended to. Points
+       already in it are not evaluated again. None to keep points in memory
+       only.
+       """
        self.model = model
        self.eval_func_name = eval_func_name
        self.hyper_params_range = hyper_params_range
-       self.points = points
+       self.points = [] if points is None else points
+       self.cache = None if cache_loc is None else ResultCache(cache_loc)
        self.max_point = None
        if len(self.points) != 0:
            self.__calc_max_point()
 
 
-    def search(self):
+    def search(self, max_workers=1):
+        """
+        Evaluate every point of the grid.
+
+        :param max_workers: How many points are evaluated at once. With more
+        than one every point is built by a new model in a worker process
+        instead of the shared model. None for one per core.
+
+        :returns: The evaluated points.
+        """
         ph.DISP = False
-        all_param_names = list(self.hyper_params_range.keys())
-        accuracies = self.__recur_search(0, all_param_names)
+        self.__evaluate(expand_grid(self.hyper_params_range), max_workers)
 
         self.__calc_max_point()
         ph.DISP = True
@@ -26,6 +108,62 @@ class HyperParamSearch:
         return self.points
 
 
+    def successive_halving(self, min_budget, eta=3, max_workers=1):
+        """
+        Successive halving over the number of samples the models are built
+        from. Every point of the grid is evaluated with a cluster_count of
+        min_budget. The best 1 / eta of them are evaluated again with eta
+        times the budget until the cluster_count of the model is reached.
+
+        The builds keep checkpoints of their layers so points that share the
+        settings of their first layers reuse them. The points are evaluated
+        in grid order, the first hyperparameter changing slowest, which keeps
+        points sharing early layers next to each other.
+
+        The budget limits the loaded data and a dataset given with
+        set_dataset alike. The selection counts of the model have to fit in
+        min_budget samples.
+
+        :param min_budget: The cluster_count of the first round.
+        :param eta: The factor the budget grows and the points shrink by every
+        round.
+        :param max_workers: See search.
+
+        :returns: The points evaluated with the full budget.
+        """
+        if eta < 2:
+            raise ValueError('eta has to be at least 2')
+
+        max_budget = self.model.hyperparams.cluster_count
+        if self.model.dataset is not None:
+            max_budget = min(max_budget, len(self.model.dataset[0]))
+        all_assigned = expand_grid(self.hyper_params_range)
+        budget = min(min_budget, max_budget)
+
+        while True:
+            ph.disp('Evaluating %i points with a budget of %i' %
+                    (len(all_assigned), budget))
+            ph.DISP = False
+            try:
+                points = self.__evaluate([dict(assigned, cluster_count=budget,
+                    resumable=True) for assigned in all_assigned], max_workers)
+            finally:
+                ph.DISP = True
+
+            if budget >= max_budget:
+                break
+
+            n_keep = max(1, len(all_assigned) // eta)
+            accuracies = np.array([point['accuracy'] for point in points])
+            keep = np.sort(np.argsort(-accuracies, kind='mergesort')[:n_keep])
+            all_assigned = [all_assigned[i] for i in keep]
+            budget = min(budget * eta, max_budget)
+
+        self.max_point = max(points, key=lambda point: point['accuracy'])
+
+        return points
+
+
     def get_max_point(self):
         return self.max_point
 
@@ -42,43 +180,93 @@ class HyperParamSearch:
                 max_acc = point['accuracy']
 
 
-    def __print_percentage(self):
-        total = 1
-        for key in self.hyper_params_range:
-            total *= len(self.hyper_params_range[key])
-
-        fraction = float(len(self.points)) / float(total)
+    def __print_percentage(self, done, total):
+        fraction = float(done) / float(total)
         print('%.2f%%' % (fraction * 100.))
 
 
-    def __recur_search(self, cur_index, all_param_names, assigned={}):
-        param_name = all_param_names[cur_index]
-
-        accuracies = []
-
-        for param_value in self.hyper_params_range[param_name]:
-            self.model.set_hyperparam(param_name, param_value)
-            assigned[param_name] = param_value
-
-            if cur_index == (len(all_param_names) - 1):
-                eval_func = self.__get_eval_func()
-                try:
-                    accuracy = eval_func()
-                except ValueError:
-                    accuracy = 0.0
-                    ph.linebreak()
-                    ph.disp('Could not evaluate model!', ph.FAIL)
-                    ph.linebreak()
-
-                self.__print_percentage()
-
-                assigned['accuracy'] = accuracy
-                self.points.append(assigned.copy())
-                accuracies.append(accuracy)
+    def __get_point_hyperparams(self, assigned):
+        """
+        :returns: A copy of the hyperparameters of the model with the values
+        of a point of the grid assigned.
+        """
+        model = copy.copy(self.model)
+        model.set_hyperparams(copy.deepcopy(self.model.hyperparams))
+        for param_name, param_value in assigned.items():
+            model.set_hyperparam(param_name, param_value)
+        return model.hyperparams
+
+
+    def __evaluate(self, all_assigned, max_workers):
+        """
+        Evaluate points that are not cached yet and add them to the points.
+
+        :param all_assigned: The hyperparameters of each point keyed by name.
+        :param max_workers: See search.
+
+        :returns: The evaluated points in the order of all_assigned.
+        """
+        all_hyperparams = [self.__get_point_hyperparams(assigned) for assigned
+                in all_assigned]
+        keys = [hash_hyperparams(hyperparams) for hyperparams in all_hyperparams]
+        points = [None] * len(all_assigned)
+
+        def add_point(i, point, evaluated):
+            if not evaluated:
+                ph.linebreak()
+                ph.disp('Could not evaluate model!', ph.FAIL)
+                ph.linebreak()
+            if self.cache is not None:
+                self.cache.add(keys[i], point)
+            points[i] = point
+
+        to_evaluate = []
+        for i, key in enumerate(keys):
+            if self.cache is not None and key in self.cache:
+                points[i] = self.cache.get(key)
             else:
-                accuracies.append(self.__recur_search(cur_index + 1, all_param_names, assigned))
-
-        return accuracies
+                to_evaluate.append(i)
+
+        if max_workers == 1:
+            eval_func = self.__get_eval_func()
+            prev_hyperparams = self.model.hyperparams
+            try:
+                for done, i in enumerate(to_evaluate):
+                    self.model.set_hyperparams(all_hyperparams[i])
+                    point = dict(all_assigned[i])
+                    evaluated = True
+                    try:
+                        point['accuracy'] = eval_func()
+                    except ValueError:
+                        point['accuracy'] = 0.0
+                        evaluated = False
+                    add_point(i, point, evaluated)
+                    self.__print_percentage(done + 1, len(to_evaluate))
+            finally:
+                self.model.set_hyperparams(prev_hyperparams)
+        else:
+            model_class = type(self.model)
+            force_create = self.model.force_create
+
+            # Split the CPUs between the workers so the parallel steps of
+            # their builds do not oversubscribe them.
+            if max_workers is None:
+                max_workers = cpu_count()
+            n_jobs = max(1, cpu_count() // max_workers)
+
+            with ProcessPoolExecutor(max_workers=max_workers,
+                    initializer=set_n_jobs, initargs=(n_jobs,)) as executor:
+                futures = {executor.submit(evaluate_point, model_class,
+                    all_hyperparams[i], force_create, self.eval_func_name,
+                    all_assigned[i], self.model.dataset): i for i in to_evaluate}
+
+                for done, future in enumerate(as_completed(futures)):
+                    point, evaluated = future.result()
+                    add_point(futures[future], point, evaluated)
+                    self.__print_percentage(done + 1, len(to_evaluate))
+
+        self.points.extend(points)
+        return points
 
 
     def __draw_contour_plot(self):
@@ -1,7 +1,12 @@
 class HyperParamData:
     def __init__(self, input_shape, subsample, patches_subsample, filter_size, batch_size,
             nkerns, fc_sizes, n_epochs, selection_counts,
-            activation_func, extra_path, should_set_weights, should_eval, remaining, cluster_count):
+            activation_func, extra_path, should_set_weights, should_eval, remaining, cluster_count,
+            out_of_core=False, warm_start=False, cluster_max_iter=300,
+            cluster_tol=1e-4, cluster_time_budget=None, cluster_quality='sync',
+            cluster_quality_method='sampled', k_criterion='silhouette',
+            pipeline_chunk_size=1024, resumable=False, cache_layer_inputs=False,
+            random_state=None, warm_start_dir=None, checkpoint_dir=None):
         self.input_shape        = input_shape
         self.subsample          = subsample
         self.patches_subsample  = patches_subsample
@@ -17,3 +22,39 @@ class HyperParamData:
         self.should_eval        = should_eval
         self.remaining          = remaining
         self.cluster_count      = cluster_count
+        # Cluster from memory mapped files rather than in memory.
+        self.out_of_core        = out_of_core
+        # Seed the clustering of each layer from the centers of the last run.
+        self.warm_start         = warm_start
+        # Where the centers are kept for the next run. None for the directory
+        # shared by every extra path.
+        self.warm_start_dir     = warm_start_dir
+        # When to stop the clustering of a layer. The tolerance is on the
+        # relative improvement of the inertia and the budget is in seconds.
+        self.cluster_max_iter    = cluster_max_iter
+        self.cluster_tol         = cluster_tol
+        self.cluster_time_budget = cluster_time_budget
+        # How the silhouette of each clustering is logged. The mode is one of
+        # 'none', 'sync' or 'async', the method 'sampled' or 'simplified'.
+        self.cluster_quality        = cluster_quality
+        self.cluster_quality_method = cluster_quality_method
+        # Entries of nkerns and fc_sizes can be a list or range of widths to
+        # select from. They are compared by 'silhouette', 'bic' or 'elbow'.
+        self.k_criterion        = k_criterion
+        # The layer input is forwarded in chunks of this many samples while
+        # the cluster vectors of the previous chunk are built. None to run the
+        # build stages one after another.
+        self.pipeline_chunk_size = pipeline_chunk_size
+        # Checkpoint every layer and resume a build from the last valid
+        # checkpoint regardless of force_create. Builds sharing the data and
+        # the settings of their first layers reuse them.
+        self.resumable          = resumable
+        # Also keep the input of every checkpointed layer so a reused prefix
+        # is not forwarded again. Takes the disk space of every layer input.
+        self.cache_layer_inputs = cache_layer_inputs
+        # Where the checkpoints are kept. None for a directory under the extra
+        # path. Builds sharing it reuse each other's layers.
+        self.checkpoint_dir     = checkpoint_dir
+        # Seeds every random choice of the build, the data selection, the
+        # clustering and the initial weights. None for unseeded.
+        self.random_state       = random_state
@@ -0,0 +1,160 @@
+import time
+from functools import partial
+from multiprocessing import Pool
+from helpers.parallel import get_n_jobs
+
+import numpy as np
+from scipy.special import ive
+from spherecluster import SphericalKMeans
+
+from helpers.printhelper import PrintHelper as ph
+from helpers.cluster_quality import sampled_silhouette
+
+
+CRITERIA = ['silhouette', 'bic', 'elbow']
+
+
+def is_k_range(k):
+    """
+    Whether k is a list or range of candidates rather than a single k.
+    """
+    return np.ndim(k) > 0
+
+
+def _log_bessel_iv(v, z):
+    """
+    log I_v(z) for the modified Bessel function of the first kind. The scaled
+    function underflows for the large orders of high dimensional data, the
+    uniform asymptotic expansion is used then.
+    """
+    scaled = ive(v, z)
+    if scaled > 0.0 and np.isfinite(scaled):
+        return np.log(scaled) + z
+
+    root = np.sqrt(v ** 2 + z ** 2)
+    return root + v * np.log(z / (v + root)) - 0.5 * np.log(2.0 * np.pi * root)
+
+
+def vmf_bic(X, labels, centers):
+    """
+    The BIC of a hard assignment mixture of von Mises-Fisher distributions
+    sharing a single concentration. Lower is better.
+
+    :param X: The unit length samples.
+    :param labels: The cluster of each sample.
+    :param centers: The unit length mean direction of each cluster.
+
+    :returns: The BIC.
+    """
+    n_samples, n_features = X.shape
+    n_clusters = len(centers)
+
+    cos_sum = np.einsum('ij,ij->', X, centers[labels], dtype=np.float64)
+
+    # Approximation of the maximum likelihood concentration from the mean
+    # resultant length. Banerjee et al. "Clustering on the Unit Hypersphere
+    # using von Mises-Fisher Distributions". JMLR 2005
+    r_bar = min(max(cos_sum / n_samples, 1e-6), 1.0 - 1e-6)
+    kappa = r_bar * (n_features - r_bar ** 2) / (1.0 - r_bar ** 2)
+
+    order = n_features / 2.0 - 1.0
+    log_norm = (order * np.log(kappa) - (n_features / 2.0) * np.log(2.0 * np.pi)
+            - _log_bessel_iv(order, kappa))
+
+    counts = np.bincount(labels, minlength=n_clusters)
+    counts = counts[counts > 0].astype(np.float64)
+    log_weights = np.sum(counts * np.log(counts / n_samples))
+
+    log_likelihood = n_samples * log_norm + kappa * cos_sum + log_weights
+    # The mean directions, the shared concentration and the mixing weights.
+    n_params = n_clusters * (n_features - 1) + 1 + (n_clusters - 1)
+
+    return -2.0 * log_likelihood + n_params * np.log(n_samples)
+
+
+def elbow_index(ks, inertias):
+    """
+    The elbow of the inertia curve. This is the point furthest from the line
+    through the first and last point once both axes are scaled to [0, 1].
+    """
+    if len(ks) < 3:
+        return int(np.argmin(inertias))
+
+    x = np.array(ks, dtype=np.float64)
+    y = np.array(inertias, dtype=np.float64)
+    x = (x - x[0]) / max(x[-1] - x[0], 1e-12)
+    y = (y - y[-1]) / max(y[0] - y[-1], 1e-12)
+
+    # The line goes from (0, 1) to (1, 0). Points below it are the convex bend.
+    return int(np.argmax(1.0 - x - y))
+
+
+def fit_candidate(k, X, random_state=0, sample_size=5000):
+    """
+    Fit and score spherical k-means for a single candidate k. Run in a worker
+    process by select_k.
+
+    :returns: The fitted estimator and its row of the scoring table.
+    """
+    start = time.time()
+    skm = SphericalKMeans(n_clusters=k, n_jobs=1, random_state=random_state)
+    skm.fit(X)
+
+    row = {
+            'k': k,
+            'inertia': float(skm.inertia_),
+            # The same sample for every candidate so the scores compare.
+            'silhouette': sampled_silhouette(X, skm.labels_, metric='cosine',
+                sample_size=sample_size, random_state=random_state),
+            'bic': float(vmf_bic(X, skm.labels_, skm.cluster_centers_)),
+        }
+    row['seconds'] = time.time() - start
+
+    return skm, row
+
+
+def select_k(X, ks, criterion='silhouette', n_jobs=None, random_state=0,
+        pre_txt=''):
+    """
+    Cluster X for every candidate k in parallel processes and keep the best.
+
+    :param X: The unit length samples.
+    :param ks: The candidate numbers of clusters.
+    :param criterion: 'silhouette' for the highest sampled silhouette, 'bic'
+    for the lowest von Mises-Fisher BIC or 'elbow' for the elbow of the
+    inertia curve.
+    :param n_jobs: The number of processes. Defaults to one per CPU.
+
+    :returns: The fitted estimator of the best k and the scoring table, a list
+    with one dictionary per k sorted by k.
+    """
+    if criterion not in CRITERIA:
+        raise ValueError('Invalid k selection criterion %s' % criterion)
+
+    ks = sorted(set(int(k) for k in ks))
+    if n_jobs is None:
+        n_jobs = get_n_jobs()
+    processes = max(min(len(ks), n_jobs), 1)
+
+    ph.disp(pre_txt + 'Selecting k out of %s by %s' % (str(ks), criterion))
+
+    fit_f = partial(fit_candidate, X=X, random_state=random_state)
+    with Pool(processes=processes) as p:
+        results = p.map(fit_f, ks)
+
+    estimators = [result[0] for result in results]
+    table = [result[1] for result in results]
+
+    if criterion == 'silhouette':
+        best_index = int(np.argmax([row['silhouette'] for row in table]))
+    elif criterion == 'bic':
+        best_index = int(np.argmin([row['bic'] for row in table]))
+    else:
+        best_index = elbow_index(ks, [row['inertia'] for row in table])
+
+    for i, row in enumerate(table):
+        ph.disp(pre_txt + '|   k %4i inertia %.4f silhouette %.4f bic %.1f %.2fs%s' %
+                (row['k'], row['inertia'], row['silhouette'], row['bic'],
+                    row['seconds'], ' <-' if i == best_index else ''))
+
+    return estimators[best_index], table
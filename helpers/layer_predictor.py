@@ -0,0 +1,165 @@
+import os
+
+import numpy as np
+from sklearn.utils import gen_batches
+
+from helpers.printhelper import PrintHelper as ph
+
+
+# The number of samples whose distances are held in memory at a time.
+BLOCK_SIZE = 4096
+
+
+def closest_anchors(anchor_vecs, X, too_close_thresh=0.001,
+        block_size=BLOCK_SIZE):
+    """
+    The closest anchor vector to each sample. Gives the same result as
+    get_closest_vectors but computes the distances of a whole block of samples
+    as a single matrix product instead of one sample at a time.
+
+    :param anchor_vecs: The unit length anchor vectors.
+    :param X: The unit length samples.
+    :param too_close_thresh: Anchor vectors this close to the minimum distance
+    of a sample are counted as ambiguous for it.
+
+    :returns: The index of the closest anchor vector, the distance to it and
+    the number of anchor vectors within too_close_thresh of that distance
+    (including the closest) for every sample.
+    """
+    anchor_vecs = np.asarray(anchor_vecs, dtype=np.float64)
+    X = np.asarray(X, dtype=np.float64)
+    n_samples = len(X)
+
+    labels = np.empty(n_samples, dtype=np.int64)
+    dists = np.empty(n_samples, dtype=np.float64)
+    close_counts = np.empty(n_samples, dtype=np.int64)
+
+    for block in gen_batches(n_samples, block_size):
+        # The same formula as opt_compute_dist.
+        block_dists = 2.0 - 2.0 * np.dot(X[block], anchor_vecs.T)
+        block_labels = np.argmin(block_dists, axis=1)
+        min_dists = block_dists[np.arange(len(block_labels)), block_labels]
+
+        labels[block] = block_labels
+        dists[block] = min_dists
+        close_counts[block] = np.sum(np.absolute(block_dists -
+            min_dists[:, np.newaxis]) < too_close_thresh, axis=1)
+
+    return labels, dists, close_counts
+
+
+class LayerPredictor(object):
+    """
+    The fitted clustering of a single layer in a form that can be saved next
+    to the anchor vector CSV and loaded with the model.
+
+    Keeps the raw cluster centers and the training labels so the clustering
+    can be continued, and the post processed anchor vectors the layer weights
+    were set to so new samples are assigned without redoing the clustering.
+    """
+
+    def __init__(self, cluster_centers, anchor_vecs, labels=None,
+            center_mean=None):
+        """
+        Constructor
+
+        :param cluster_centers: The raw cluster centers of the clustering.
+        :param anchor_vecs: The post processed centers, one row per anchor
+        vector.
+        :param labels: The cluster of each training cluster vector.
+        :param center_mean: The mean subtracted from the centers when post
+        processing them. Defaults to the mean of the centers.
+        """
+        self.cluster_centers_ = np.asarray(cluster_centers, dtype=np.float64)
+        self.anchor_vecs      = np.asarray(anchor_vecs, dtype=np.float64)
+        self.labels_          = None if labels is None else np.asarray(labels,
+                dtype=np.int64)
+        if center_mean is None:
+            center_mean = np.mean(self.cluster_centers_)
+        self.center_mean      = float(center_mean)
+
+
+    @classmethod
+    def from_predictor(cls, predictor, anchor_vecs):
+        """
+        :param predictor: A fitted estimator with cluster_centers_ and labels_.
+        :param anchor_vecs: The anchor vectors the layer weights were set to.
+        """
+        anchor_vecs = np.asarray(anchor_vecs)
+        return cls(predictor.cluster_centers_,
+                anchor_vecs.reshape(len(anchor_vecs), -1),
+                getattr(predictor, 'labels_', None))
+
+
+    @property
+    def counts_(self):
+        """
+        The number of training cluster vectors in each cluster.
+        """
+        if self.labels_ is None:
+            return None
+        return np.bincount(self.labels_, minlength=len(self.anchor_vecs))
+
+
+    def predict(self, X):
+        """
+        :returns: The index of the closest anchor vector to each sample.
+        """
+        return self.closest(X)[0]
+
+
+    def closest(self, X, too_close_thresh=0.001):
+        """
+        See closest_anchors.
+        """
+        return closest_anchors(self.anchor_vecs, X, too_close_thresh)
+
+
+    def save(self, filename):
+        labels = self.labels_
+        if labels is None:
+            labels = np.empty(0, dtype=np.int64)
+        else:
+            # Label indices are far below the int32 limit.
+            labels = labels.astype(np.int32)
+
+        np.savez_compressed(filename,
+                cluster_centers=self.cluster_centers_.astype(np.float32),
+                anchor_vecs=self.anchor_vecs,
+                labels=labels,
+                center_mean=np.array(self.center_mean))
+
+
+def get_predictor_loc(centroids_loc):
+    """
+    Get the file the predictor of a layer is kept in from the file its anchor
+    vectors are kept in.
+    """
+    return os.path.splitext(centroids_loc)[0] + '.npz'
+
+
+def load_layer_predictor(filename, n_anchor_vecs=None):
+    """
+    Load a saved LayerPredictor.
+
+    :param n_anchor_vecs: The number of anchor vectors the layer has. The
+    predictor is only used if it matches.
+
+    :returns: The LayerPredictor or None if there is no usable one.
+    """
+    if not os.path.exists(filename):
+        return None
+
+    saved = np.load(filename)
+    anchor_vecs = saved['anchor_vecs']
+    if n_anchor_vecs is not None and len(anchor_vecs) != n_anchor_vecs:
+        ph.disp('Not using predictor %s, it has %i anchor vectors' %
+                (filename, len(anchor_vecs)), ph.WARNING)
+        return None
+
+    labels = saved['labels']
+    if len(labels) == 0:
+        labels = None
+
+    return LayerPredictor(saved['cluster_centers'], anchor_vecs, labels,
+            float(saved['center_mean']))
@@ -10,7 +10,7 @@ import random
 import pickle
 from functools import partial
 from multiprocessing import Pool
-from multiprocessing import cpu_count
+from helpers.parallel import get_n_jobs
 from scipy.spatial.distance import cosine as cosine_dist
 from scipy.spatial.distance import euclidean as euclidean_dist
 
@@ -62,7 +62,7 @@ def get_closest_vectors(ref_vecs, compare_vecs, too_close_thresh = 0.001):
     get_closest_f = partial(get_closest_anchor,
             anchor_vecs = ref_vecs, too_close_thresh = too_close_thresh)
 
-    with Pool(processes=cpu_count()) as p:
+    with Pool(processes=get_n_jobs()) as p:
         sample_anchor_vecs = p.map(get_closest_f, compare_vecs)
 
     return sample_anchor_vecs
@@ -106,7 +106,7 @@ def get_nearest_neighbors(vecs, search_vec, N):
     """
     distance_from = partial(distance_select, search_vec)
 
-    with Pool(processes=cpu_count()) as p:
+    with Pool(processes=get_n_jobs()) as p:
         vector_distances = p.map(distance_from, vecs)
 
     ordered_vector_distances = sorted(vector_distances, key=lambda x: x[0])
@@ -0,0 +1,67 @@
+import time
+
+import numpy as np
+
+from helpers.shape_inference import conv_block_output_shape
+from helpers.shape_inference import conv_output_shape
+from helpers.shape_inference import dense_output_shape
+
+
+# How often the latency is measured, the median is reported.
+LATENCY_REPEATS = 5
+
+
+def conv_flops(input_shape, nkern, filter_size, subsample, border_mode='same'):
+    """
+    The multiplies and adds of a convolution for a single sample.
+    """
+    output_shape = conv_output_shape(input_shape, nkern, filter_size, subsample,
+            border_mode)
+    return (2 * int(np.prod(output_shape)) * input_shape[0] * filter_size[0] *
+            filter_size[1])
+
+
+def dense_flops(input_dim, output_dim):
+    """
+    The multiplies and adds of a dense layer for a single sample.
+    """
+    return 2 * int(input_dim) * int(output_dim)
+
+
+def count_flops(input_shape, nkerns, fc_sizes, filter_size, subsample,
+        border_mode='same', pool_size=(2, 2)):
+    """
+    The FLOPs of every layer with parameters of a network built by
+    ModelWrapper, for a single sample. Activations and pooling are left out.
+
+    :returns: The FLOPs of each layer in order.
+    """
+    flops = []
+    for i, nkern in enumerate(nkerns):
+        flops.append(conv_flops(input_shape, nkern, filter_size, subsample,
+            border_mode))
+        input_shape = conv_block_output_shape(input_shape, nkern, filter_size,
+                subsample, border_mode=border_mode, pool_size=pool_size,
+                flatten=(i == len(nkerns) - 1))
+
+    for fc_size in fc_sizes:
+        flops.append(dense_flops(input_shape[0], fc_size))
+        input_shape = dense_output_shape(input_shape, fc_size)
+
+    return flops
+
+
+def measure_latency(model, data, batch_size=32, n_repeats=LATENCY_REPEATS):
+    """
+    :returns: The median seconds the model takes to predict a sample.
+    """
+    # The first prediction compiles the predict function.
+    model.predict(data[:batch_size], batch_size=batch_size)
+
+    times = []
+    for i in range(n_repeats):
+        start = time.time()
+        model.predict(data, batch_size=batch_size)
+        times.append(time.time() - start)
+
+    return float(np.median(times)) / len(data)
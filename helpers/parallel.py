@@ -0,0 +1,24 @@
+from multiprocessing import cpu_count
+
+
+# The number of processes or jobs every parallel step of a build uses. None
+# for one per CPU. Lowered in the workers of a parallel hyperparameter search
+# so they do not oversubscribe the CPUs.
+N_JOBS = None
+
+
+def set_n_jobs(n_jobs):
+    """
+    Set how many processes every parallel step uses. None for one per CPU.
+    """
+    global N_JOBS
+    N_JOBS = n_jobs
+
+
+def get_n_jobs():
+    """
+    :returns: How many processes a parallel step should use.
+    """
+    if N_JOBS is None:
+        return cpu_count()
+    return N_JOBS
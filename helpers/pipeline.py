@@ -0,0 +1,204 @@
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+from queue import Queue
+
+import numpy as np
+from sklearn.utils import gen_batches
+
+from helpers.printhelper import PrintHelper as ph
+
+
+# The number of samples forwarded through the network at a time.
+CHUNK_SIZE = 1024
+
+
+class StageTimeline(object):
+    """
+    Records when each stage of the model build ran and on which thread so
+    the overlap between the stages can be reported.
+    """
+
+    def __init__(self):
+        """
+        Constructor
+        """
+        self.spans      = []
+        self.start_time = time.time()
+        self.__lock     = threading.Lock()
+
+
+    @contextmanager
+    def stage(self, name, layer_index=None):
+        """
+        Time the body of a with statement as a span of the stage name.
+        """
+        start = time.time()
+        try:
+            yield
+        finally:
+            self.add_span(name, layer_index, start, time.time())
+
+
+    def add_span(self, name, layer_index, start, end):
+        span = {
+                'stage': name,
+                'layer': layer_index,
+                'start': start - self.start_time,
+                'end': end - self.start_time,
+                'thread': threading.current_thread().name,
+            }
+        with self.__lock:
+            self.spans.append(span)
+
+
+    def get_stage_totals(self):
+        """
+        :returns: The summed seconds of every stage keyed by stage name.
+        """
+        totals = {}
+        for span in self.spans:
+            totals[span['stage']] = totals.get(span['stage'], 0.0) + \
+                    span['end'] - span['start']
+        return totals
+
+
+    @property
+    def wall_seconds(self):
+        if len(self.spans) == 0:
+            return 0.0
+        return max(span['end'] for span in self.spans) - \
+                min(span['start'] for span in self.spans)
+
+
+    def report(self):
+        """
+        Display every span in the order it started followed by the total of
+        each stage. The stage total over the wall time is above 1 when stages
+        overlapped.
+        """
+        ph.disp('Stage timeline', ph.OKBLUE)
+        for span in sorted(self.spans, key=lambda span: span['start']):
+            layer = '' if span['layer'] is None else 'layer %i ' % span['layer']
+            ph.disp('%8.2fs - %8.2fs %s%s [%s]' % (span['start'], span['end'],
+                layer, span['stage'], span['thread']))
+
+        totals = self.get_stage_totals()
+        for name in sorted(totals, key=totals.get, reverse=True):
+            ph.disp('%-12s %8.2fs' % (name, totals[name]))
+
+        wall = self.wall_seconds
+        if wall > 0.0:
+            ph.disp('Stages took %.2fs in %.2fs of wall time (%.2fx overlap)' %
+                    (sum(totals.values()), wall, sum(totals.values()) / wall))
+
+
+class BackgroundWriter(object):
+    """
+    Runs file writes on a single background thread so the build can move on
+    to the next layer while the anchor vectors of the last one are written.
+    """
+
+    def __init__(self, timeline=None):
+        """
+        Constructor
+
+        :param timeline: The StageTimeline the writes are recorded in.
+        """
+        self.timeline = timeline
+        self.futures  = []
+        self.__executor = ThreadPoolExecutor(max_workers=1)
+
+
+    def submit(self, write_f, *args, layer_index=None):
+        """
+        Queue a call of write_f with args. The arguments must not be modified
+        until the write is done.
+        """
+        self.futures.append(self.__executor.submit(self.__write, write_f,
+            args, layer_index))
+
+
+    def wait(self):
+        """
+        Block until every queued write is done. Raises the first error of a
+        failed write.
+        """
+        futures = self.futures
+        self.futures = []
+        for future in futures:
+            future.result()
+
+
+    def __write(self, write_f, args, layer_index):
+        if self.timeline is None:
+            return write_f(*args)
+        with self.timeline.stage('write', layer_index):
+            return write_f(*args)
+
+
+def pipelined_forward(f_prev_out, data, extract_f=None, chunk_size=CHUNK_SIZE,
+        timeline=None, layer_index=None):
+    """
+    Pass data through the network in chunks on a background thread. While a
+    chunk is being forwarded the output of the previous one is handed to
+    extract_f, so the forward pass and the building of the cluster vectors
+    overlap.
+
+    :param f_prev_out: The Keras function giving the output of the layers so
+    far.
+    :param extract_f: Called with the output of each chunk. Its results are
+    concatenated along the first axis. None to only forward the data.
+
+    :returns: The output of the network for all of data and the concatenated
+    results of extract_f or None.
+    """
+    # Only one chunk waits while the next one is forwarded.
+    chunk_queue = Queue(maxsize=1)
+
+    def forward():
+        try:
+            for chunk in gen_batches(len(data), chunk_size):
+                start = time.time()
+                chunk_out = f_prev_out([data[chunk]])[0]
+                if timeline is not None:
+                    timeline.add_span('forward', layer_index, start, time.time())
+                chunk_queue.put(chunk_out)
+        except Exception as e:
+            chunk_queue.put(e)
+            return
+        chunk_queue.put(None)
+
+    producer = threading.Thread(target=forward, name='forward')
+    producer.daemon = True
+    producer.start()
+
+    # Allocated once the shape of the output is known from the first chunk.
+    layer_out = None
+    n_out = 0
+    extracted = []
+    while True:
+        chunk_out = chunk_queue.get()
+        if chunk_out is None:
+            break
+        if isinstance(chunk_out, Exception):
+            producer.join()
+            raise chunk_out
+
+        if layer_out is None:
+            layer_out = np.empty((len(data),) + chunk_out.shape[1:],
+                    dtype=chunk_out.dtype)
+        layer_out[n_out:n_out + len(chunk_out)] = chunk_out
+        n_out += len(chunk_out)
+        if extract_f is not None:
+            start = time.time()
+            extracted.append(extract_f(chunk_out))
+            if timeline is not None:
+                timeline.add_span('extract', layer_index, start, time.time())
+
+    producer.join()
+
+    if extract_f is None:
+        return layer_out, None
+    return layer_out, np.concatenate(extracted)
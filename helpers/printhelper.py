@@ -1,4 +1,18 @@
+import time
+
+import numpy as np
+
+
 class PrintHelper(object):
+    """
+    Leveled display of progress messages.
+
+    Messages are only formatted when their level is displayed. Pass the
+    format arguments separately to get this, as in
+    ph.debug('Got %i samples', len(samples)). Anything expensive that is
+    only computed for display should be guarded by is_enabled or go through
+    stats.
+    """
     HEADER = '\033[95m'
     OKBLUE = '\033[94m'
     OKGREEN = '\033[92m'
@@ -8,13 +22,44 @@ class PrintHelper(object):
     BOLD = '\033[1m'
     UNDERLINE = '\033[4m'
 
+    # The levels in increasing order of importance. The same values as the
+    # logging module.
+    DEBUG = 10
+    INFO = 20
+    WARN = 30
+    ERROR = 40
+
+    # Turns off all display when False.
     DISP = True
+    # Messages below this level are not displayed.
+    LEVEL = INFO
+    # Prefix every message with the seconds since the start.
+    TIMESTAMPS = False
+    START_TIME = time.time()
 
     @staticmethod
-    def disp(txt, txt_type = None):
-        if not PrintHelper.DISP:
+    def is_enabled(level):
+        return PrintHelper.DISP and level >= PrintHelper.LEVEL
+
+    @staticmethod
+    def set_level(level):
+        PrintHelper.LEVEL = level
+
+    @staticmethod
+    def log(level, txt, *args, txt_type = None):
+        """
+        Display txt formatted with args if level is enabled.
+
+        :param txt_type: The color to display the message in.
+        """
+        if not PrintHelper.is_enabled(level):
             return
+        if len(args) > 0:
+            txt = txt % args
+
         final_str = ""
+        if PrintHelper.TIMESTAMPS:
+            final_str += '[%9.2fs] ' % (time.time() - PrintHelper.START_TIME)
         if txt_type is not None:
             final_str += txt_type
 
@@ -25,9 +70,42 @@ class PrintHelper(object):
 
         print(final_str)
 
+    @staticmethod
+    def disp(txt, txt_type = None):
+        PrintHelper.log(PrintHelper.INFO, txt, txt_type=txt_type)
+
+    @staticmethod
+    def debug(txt, *args):
+        PrintHelper.log(PrintHelper.DEBUG, txt, *args)
+
+    @staticmethod
+    def info(txt, *args):
+        PrintHelper.log(PrintHelper.INFO, txt, *args)
+
+    @staticmethod
+    def warning(txt, *args):
+        PrintHelper.log(PrintHelper.WARN, txt, *args,
+                txt_type=PrintHelper.WARNING)
+
+    @staticmethod
+    def error(txt, *args):
+        PrintHelper.log(PrintHelper.ERROR, txt, *args,
+                txt_type=PrintHelper.FAIL)
+
+    @staticmethod
+    def stats(txt, data, level = DEBUG):
+        """
+        Display the min, max, mean and standard deviation of data. None of
+        them are computed unless level is enabled.
+        """
+        if not PrintHelper.is_enabled(level):
+            return
+        PrintHelper.log(level, '%s Min %s, Max %s, Mean %s, STD %s', txt,
+                np.amin(data), np.amax(data), np.mean(data), np.std(data))
+
     @staticmethod
     def linebreak():
-        if not PrintHelper.DISP:
+        if not PrintHelper.is_enabled(PrintHelper.INFO):
             return
         print('\n' * 2)
 
@@ -0,0 +1,216 @@
+import functools
+import json
+import resource
+import threading
+import time
+from contextlib import contextmanager
+
+
+# How often the resident set size is sampled while a timer is running.
+SAMPLE_INTERVAL = 0.05
+
+
+def get_rss():
+    """
+    :returns: The current resident set size of this process in bytes or None
+    if it cannot be read.
+    """
+    try:
+        with open('/proc/self/statm', 'r') as f:
+            return int(f.read().split()[1]) * resource.getpagesize()
+    except (IOError, OSError, IndexError, ValueError):
+        return None
+
+
+def get_peak_rss():
+    """
+    :returns: The peak resident set size of this process so far in bytes.
+    """
+    # Linux reports kilobytes.
+    return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss * 1024
+
+
+class Profiler(object):
+    """
+    Times the stages of a build and samples the memory they use, grouped by
+    layer. Timers nest, a stage is timed in full even if it contains others.
+
+    Only the memory of this process is measured, not that of worker
+    processes.
+    """
+
+    ENABLED = True
+
+    def __init__(self, sample_interval=SAMPLE_INTERVAL):
+        """
+        Constructor
+
+        :param sample_interval: The seconds between samples of the resident
+        set size while a timer runs.
+        """
+        self.sample_interval = sample_interval
+        self.__lock          = threading.Lock()
+        self.__active        = []
+        self.__sampler       = None
+        self.reset()
+
+
+    def reset(self):
+        """
+        Forget everything recorded so far.
+        """
+        with self.__lock:
+            self.stages     = {}
+            self.counters   = {}
+            self.layer      = None
+            self.start_time = time.time()
+
+
+    @contextmanager
+    def layer_scope(self, layer_index):
+        """
+        Attribute everything recorded in the body of a with statement to a
+        layer unless a timer names another one.
+        """
+        prev_layer = self.layer
+        self.layer = layer_index
+        try:
+            yield
+        finally:
+            self.layer = prev_layer
+
+
+    @contextmanager
+    def timer(self, stage, layer_index=None):
+        """
+        Time the body of a with statement as the stage of a layer.
+
+        :param layer_index: Defaults to the layer of the enclosing layer_scope.
+        """
+        if not self.ENABLED:
+            yield
+            return
+
+        if layer_index is None:
+            layer_index = self.layer
+
+        record = {'rss': get_rss()}
+        record['peak_rss'] = record['rss']
+        self.__start_sampling(record)
+
+        start = time.time()
+        try:
+            yield
+        finally:
+            seconds = time.time() - start
+            self.__stop_sampling(record)
+            self.__add(stage, layer_index, seconds, record)
+
+
+    def timed(self, stage):
+        """
+        Decorator to time every call of a function as a stage.
+        """
+        def decorator(f):
+            @functools.wraps(f)
+            def wrapper(*args, **kwargs):
+                with self.timer(stage):
+                    return f(*args, **kwargs)
+            return wrapper
+        return decorator
+
+
+    def count(self, name, value=1, layer_index=None):
+        """
+        Add value to the counter name of a layer.
+        """
+        if not self.ENABLED:
+            return
+        if layer_index is None:
+            layer_index = self.layer
+        with self.__lock:
+            counters = self.counters.setdefault(layer_index, {})
+            counters[name] = counters.get(name, 0) + value
+
+
+    def get_report(self):
+        """
+        :returns: A dictionary with the time, calls and memory of every stage
+        and the counters, grouped by layer. Memory is in megabytes.
+        """
+        layers = {}
+        with self.__lock:
+            for (layer_index, stage), stats in self.stages.items():
+                layer = layers.setdefault(self.__layer_key(layer_index),
+                        {'stages': {}, 'counters': {}})
+                layer['stages'][stage] = dict(stats)
+            for layer_index, counters in self.counters.items():
+                layer = layers.setdefault(self.__layer_key(layer_index),
+                        {'stages': {}, 'counters': {}})
+                layer['counters'] = dict(counters)
+
+        return {
+                'layers': layers,
+                'wall_seconds': time.time() - self.start_time,
+                'peak_rss_mb': get_peak_rss() / 1e6,
+            }
+
+
+    def save_report(self, filename):
+        """
+        Write the report as JSON.
+        """
+        with open(filename, 'w') as f:
+            json.dump(self.get_report(), f, indent=4, sort_keys=True)
+
+
+    def __layer_key(self, layer_index):
+        return 'build' if layer_index is None else 'layer%i' % layer_index
+
+
+    def __add(self, stage, layer_index, seconds, record):
+        rss = get_rss()
+        with self.__lock:
+            stats = self.stages.setdefault((layer_index, stage), {
+                'seconds': 0.0,
+                'calls': 0,
+                'rss_delta_mb': 0.0,
+                'peak_rss_mb': 0.0,
+                })
+            stats['seconds'] += seconds
+            stats['calls'] += 1
+            if rss is not None and record['rss'] is not None:
+                stats['rss_delta_mb'] += (rss - record['rss']) / 1e6
+                stats['peak_rss_mb'] = max(stats['peak_rss_mb'],
+                        max(record['peak_rss'], rss) / 1e6)
+
+
+    def __start_sampling(self, record):
+        if record['rss'] is None:
+            return
+        with self.__lock:
+            self.__active.append(record)
+            if self.__sampler is None:
+                self.__sampler = threading.Thread(target=self.__sample,
+                        name='rss sampler')
+                self.__sampler.daemon = True
+                self.__sampler.start()
+
+
+    def __stop_sampling(self, record):
+        with self.__lock:
+            self.__active = [active for active in self.__active
+                    if active is not record]
+
+
+    def __sample(self):
+        while True:
+            time.sleep(self.sample_interval)
+            rss = get_rss()
+            with self.__lock:
+                for record in self.__active:
+                    record['peak_rss'] = max(record['peak_rss'], rss)
+
+
+# The profiler of the build shared by every module.
+PROFILER = Profiler()
@@ -0,0 +1,199 @@
+import numpy as np
+from scipy.sparse import csr_matrix
+from scipy.sparse.csgraph import connected_components
+from sklearn.metrics.pairwise import cosine_similarity
+
+
+def get_unit_vecs(weights):
+    """
+    The weights of every output unit of a layer as rows.
+
+    :param weights: Convolution weights of shape (nkern, channels, rows, cols)
+    or dense weights of shape (input_dim, output_dim).
+    """
+    if weights.ndim > 2:
+        return weights.reshape(len(weights), -1)
+    return weights.T
+
+
+def set_unit_vecs(unit_vecs, weights_shape):
+    """
+    The inverse of get_unit_vecs for a layer with len(unit_vecs) units.
+    """
+    if len(weights_shape) > 2:
+        return unit_vecs.reshape((len(unit_vecs),) + tuple(weights_shape[1:]))
+    return unit_vecs.T
+
+
+def get_input_unit_weights(next_weights, n_units):
+    """
+    The weights of the next layer grouped by the unit of this layer they
+    take as input, along the first axis.
+
+    :param next_weights: The weights of the next layer. A dense layer after a
+    flattened convolution has channels * rows * cols inputs.
+    """
+    if next_weights.ndim > 2:
+        # The input channels of a convolution are the second axis.
+        return np.moveaxis(next_weights, 1, 0)
+    return next_weights.reshape(n_units, -1, next_weights.shape[1])
+
+
+def set_input_unit_weights(unit_weights, next_weights_shape):
+    """
+    The inverse of get_input_unit_weights for len(unit_weights) input units.
+    """
+    if len(next_weights_shape) > 2:
+        return np.moveaxis(unit_weights, 0, 1)
+    return unit_weights.reshape(-1, next_weights_shape[1])
+
+
+def find_merge_groups(unit_vecs, cs_thresh):
+    """
+    Group units whose weights are more cosine similar than cs_thresh. The
+    groups are the connected components of the graph of similar pairs so
+    similarity is transitive.
+
+    :returns: The group of each unit and the number of groups.
+    """
+    similar = cosine_similarity(unit_vecs) > cs_thresh
+    n_groups, labels = connected_components(csr_matrix(similar), directed=False)
+    return labels, n_groups
+
+
+def merge_units(weights, bias, labels, n_groups):
+    """
+    Replace every group of units by the mean of their weights and biases.
+
+    :returns: The merged weights and biases and the scale of each original
+    unit. The scale is the ratio of the norm of the unit to the norm of the
+    unit it was merged into.
+    """
+    unit_vecs = get_unit_vecs(weights)
+    counts = np.bincount(labels, minlength=n_groups).astype(np.float64)
+
+    merged = np.zeros((n_groups, unit_vecs.shape[1]))
+    np.add.at(merged, labels, unit_vecs)
+    merged /= counts[:, np.newaxis]
+
+    merged_bias = np.zeros(n_groups)
+    np.add.at(merged_bias, labels, bias)
+    merged_bias /= counts
+
+    norms = np.linalg.norm(unit_vecs, axis=1)
+    merged_norms = np.linalg.norm(merged, axis=1)
+    scales = norms / np.maximum(merged_norms[labels], np.finfo(np.float64).eps)
+
+    return (set_unit_vecs(merged, weights.shape).astype(weights.dtype),
+            merged_bias.astype(bias.dtype), scales)
+
+
+def fold_next_layer(next_weights, labels, n_groups, scales):
+    """
+    Sum the input weights of the next layer over every group of merged units.
+    Units pointing the same way have outputs that only differ by the ratio
+    of their norms, so the weights are scaled by it first. Biases and the
+    nonlinearity make this an approximation.
+
+    :param next_weights: See get_input_unit_weights.
+
+    :returns: The weights of the next layer with n_groups input units.
+    """
+    n_units = len(labels)
+    unit_weights = get_input_unit_weights(next_weights, n_units)
+
+    scale_shape = (n_units,) + (1,) * (unit_weights.ndim - 1)
+    folded = np.zeros((n_groups,) + unit_weights.shape[1:])
+    np.add.at(folded, labels, unit_weights * scales.reshape(scale_shape))
+
+    return set_input_unit_weights(folded, next_weights.shape).astype(next_weights.dtype)
+
+
+def prune_layers(layer_params, cs_thresh):
+    """
+    Merge the similar units of every layer but the output layer and fold the
+    merged units into the layer after.
+
+    :param layer_params: The [weights, bias] of every layer with parameters in
+    order.
+
+    :returns: The new [weights, bias] of every layer and how many units were
+    removed from each.
+    """
+    layer_params = [list(params) for params in layer_params]
+    n_removed = [0] * len(layer_params)
+
+    for i in range(len(layer_params) - 1):
+        weights, bias = layer_params[i]
+        labels, n_groups = find_merge_groups(get_unit_vecs(weights), cs_thresh)
+        if n_groups == len(labels):
+            continue
+
+        weights, bias, scales = merge_units(weights, bias, labels, n_groups)
+        layer_params[i] = [weights, bias]
+        layer_params[i + 1][0] = fold_next_layer(layer_params[i + 1][0],
+                labels, n_groups, scales)
+        n_removed[i] = len(labels) - n_groups
+
+    return layer_params, n_removed
+
+
+def find_dead_units(layer_params, norm_thresh=1e-6):
+    """
+    Find the units that cannot change the output of the network. A unit is
+    dead if its weights and bias are zero or the next layer ignores it. A
+    unit with zero weights but a bias still outputs a constant the next layer
+    sees. The units of the output layer are always kept.
+
+    :param layer_params: See prune_layers.
+
+    :returns: A boolean mask of the units to keep for every layer.
+    """
+    keep = []
+    for i, (weights, bias) in enumerate(layer_params):
+        unit_vecs = get_unit_vecs(weights)
+        layer_keep = ((np.linalg.norm(unit_vecs, axis=1) > norm_thresh) |
+                (np.abs(bias) > norm_thresh))
+        if i < len(layer_params) - 1:
+            unit_weights = get_input_unit_weights(layer_params[i + 1][0],
+                    len(unit_vecs))
+            out_norms = np.linalg.norm(unit_weights.reshape(len(unit_vecs), -1), axis=1)
+            layer_keep &= out_norms > norm_thresh
+        else:
+            layer_keep[:] = True
+        keep.append(layer_keep)
+    return keep
+
+
+def slice_layers(layer_params, keep):
+    """
+    Remove units from every layer and their input weights from the layer
+    after.
+
+    :param layer_params: See prune_layers.
+    :param keep: A boolean mask or the indices of the units to keep for every
+    layer.
+
+    :returns: The new [weights, bias] of every layer.
+    """
+    layer_params = [list(params) for params in layer_params]
+
+    for i in range(len(layer_params)):
+        weights, bias = layer_params[i]
+        n_units = len(bias)
+        layer_keep = np.arange(n_units)[keep[i]]
+        if len(layer_keep) == n_units:
+            continue
+        if len(layer_keep) == 0:
+            raise ValueError('Cannot remove every unit of layer %i' % i)
+
+        unit_vecs = get_unit_vecs(weights)[layer_keep]
+        layer_params[i] = [set_unit_vecs(unit_vecs, weights.shape), bias[layer_keep]]
+
+        if i < len(layer_params) - 1:
+            next_weights = layer_params[i + 1][0]
+            unit_weights = get_input_unit_weights(next_weights, n_units)[layer_keep]
+            layer_params[i + 1][0] = set_input_unit_weights(unit_weights,
+                    next_weights.shape)
+
+    return layer_params
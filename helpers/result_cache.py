@@ -0,0 +1,92 @@
+import hashlib
+import json
+import os
+
+from helpers.printhelper import PrintHelper as ph
+
+
+def hash_hyperparams(hyperparams):
+    """
+    :returns: The hex digest of every setting of a HyperParamData. Tuples and
+    lists hash the same.
+    """
+    config = json.dumps(vars(hyperparams), sort_keys=True, default=str)
+    return hashlib.sha1(config.encode('utf-8')).hexdigest()
+
+
+class ResultCache(object):
+    """
+    Append only store of evaluated hyperparameter points, one JSON record per
+    line keyed by the hash of the full hyperparameters of the point.
+
+    Records are only ever appended so an interrupted sweep loses at most the
+    point that was being written. A partial last line is cut off on load.
+    """
+
+    def __init__(self, filename):
+        """
+        Constructor
+
+        :param filename: The JSON lines file. Created on the first add.
+        """
+        self.filename = filename
+        self.results  = {}
+        self.__load()
+
+
+    def __contains__(self, key):
+        return key in self.results
+
+
+    def __len__(self):
+        return len(self.results)
+
+
+    def get(self, key):
+        """
+        :returns: The point stored under key or None.
+        """
+        return self.results.get(key)
+
+
+    def add(self, key, point):
+        """
+        Store an evaluated point and write it out immediately.
+        """
+        self.results[key] = point
+
+        cache_dir = os.path.dirname(self.filename)
+        if cache_dir != '' and not os.path.exists(cache_dir):
+            os.makedirs(cache_dir)
+
+        with open(self.filename, 'a') as f:
+            f.write(json.dumps({'key': key, 'point': point}, sort_keys=True,
+                default=str) + '\n')
+            f.flush()
+            os.fsync(f.fileno())
+
+
+    def __load(self):
+        if not os.path.exists(self.filename):
+            return
+
+        with open(self.filename, 'r') as f:
+            content = f.read()
+
+        # A crash while writing leaves a partial last line without a newline.
+        # Cut it off so the next record starts on a line of its own.
+        if content != '' and not content.endswith('\n'):
+            ph.disp('Dropping a partial record at the end of %s' % self.filename,
+                    ph.WARNING)
+            content = content[:content.rfind('\n') + 1]
+            with open(self.filename, 'r+') as f:
+                f.truncate(len(content.encode('utf-8')))
+
+        for line in content.splitlines():
+            try:
+                record = json.loads(line)
+            except ValueError:
+                ph.disp('Skipping a corrupt record in %s' % self.filename,
+                        ph.WARNING)
+                continue
+            self.results[record['key']] = record['point']
@@ -0,0 +1,77 @@
+import numpy as np
+
+
+def conv_output_length(input_length, filter_length, border_mode, stride):
+    """
+    The output length along one dimension of a convolution or pooling. The
+    same as keras.utils.np_utils.conv_output_length.
+    """
+    if border_mode == 'same':
+        output_length = input_length
+    elif border_mode == 'valid':
+        output_length = input_length - filter_length + 1
+    else:
+        raise ValueError('Invalid border mode %s' % border_mode)
+    return (output_length + stride - 1) // stride
+
+
+def conv_output_shape(input_shape, nkern, filter_size, subsample,
+        border_mode='same'):
+    """
+    :param input_shape: The (channels, rows, cols) input of the convolution.
+
+    :returns: The (nkern, rows, cols) output of the convolution.
+    """
+    return (int(nkern),
+            conv_output_length(input_shape[1], filter_size[0], border_mode,
+                subsample[0]),
+            conv_output_length(input_shape[2], filter_size[1], border_mode,
+                subsample[1]))
+
+
+def pool_output_shape(input_shape, pool_size=(2, 2), strides=None,
+        border_mode='valid'):
+    """
+    :param strides: Defaults to the pool size like MaxPooling2D.
+
+    :returns: The (channels, rows, cols) output of the pooling.
+    """
+    if strides is None:
+        strides = pool_size
+    return (input_shape[0],
+            conv_output_length(input_shape[1], pool_size[0], border_mode,
+                strides[0]),
+            conv_output_length(input_shape[2], pool_size[1], border_mode,
+                strides[1]))
+
+
+def flatten_output_shape(input_shape):
+    return (int(np.prod(input_shape)),)
+
+
+def dense_output_shape(input_shape, output_dim):
+    if len(input_shape) != 1:
+        raise ValueError('A dense layer needs a flat input not %s' %
+                str(input_shape))
+    return (int(output_dim),)
+
+
+def conv_block_output_shape(input_shape, nkern, filter_size, subsample,
+        border_mode='same', pool_size=None, flatten=False):
+    """
+    The output shape of a convolution optionally followed by max pooling and
+    flattening, as added by ModelWrapper. The activation keeps the shape.
+
+    The shapes use the Theano dimension ordering of (channels, rows, cols)
+    and leave out the batch dimension.
+
+    :param pool_size: The size and stride of the max pooling. None for no
+    pooling.
+    """
+    output_shape = conv_output_shape(input_shape, nkern, filter_size,
+            subsample, border_mode)
+    if pool_size is not None:
+        output_shape = pool_output_shape(output_shape, pool_size)
+    if flatten:
+        output_shape = flatten_output_shape(output_shape)
+    return output_shape
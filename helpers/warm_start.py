@@ -0,0 +1,78 @@
+import os
+
+import numpy as np
+import sklearn.preprocessing as preprocessing
+
+from helpers.checkpoint import hash_config
+from helpers.printhelper import PrintHelper as ph
+
+
+# The files are keyed on the build and the layer settings so builds only
+# warm start from their own earlier runs.
+WARM_START_DIR = 'data/centroids/warm/'
+
+# The settings that only decide how long the clustering runs. A warm start is
+# meant to carry over when they change.
+RUN_SETTINGS = ['k', 'cluster_max_iter', 'cluster_tol', 'cluster_time_budget',
+        'warm_start']
+
+
+def get_warm_start_loc(extra_path, config, warm_start_dir=WARM_START_DIR):
+    """
+    Get the file the cluster centers of a layer are warm started from.
+
+    :param extra_path: The extra_path of the build.
+    :param config: The settings of the layer, see LayerCheckpointer.load. The
+    number of clusters is checked when loading instead.
+    """
+    if not os.path.exists(warm_start_dir):
+        os.makedirs(warm_start_dir)
+
+    config = {name: value for name, value in config.items()
+            if name not in RUN_SETTINGS}
+    key = hash_config(extra_path, config)
+    return os.path.join(warm_start_dir, 'layer%i_%s.npz' %
+            (config['layer_index'], key))
+
+
+def save_warm_centers(filename, centers, labels):
+    """
+    Save the raw cluster centers of a layer along with the number of samples
+    that belong to each of them.
+    """
+    centers = np.asarray(centers)
+    counts = np.bincount(np.asarray(labels, dtype=np.int64),
+            minlength=len(centers))
+
+    # Written under a name of this process first so a concurrent read never
+    # sees half a file.
+    tmp_filename = '%s.%i.tmp' % (filename, os.getpid())
+    with open(tmp_filename, 'wb') as f:
+        np.savez(f, centers=centers, counts=counts)
+    os.replace(tmp_filename, filename)
+
+
+def load_warm_centers(filename, k, n_features):
+    """
+    Load previously saved cluster centers to seed the clustering of a layer.
+
+    :param k: The number of clusters the centers are for.
+    :param n_features: The dimension of the vectors being clustered.
+
+    :returns: The initial centers of shape (k, n_features) or None if there is
+    nothing usable to warm start from.
+    """
+    if not os.path.exists(filename):
+        return None
+
+    saved = np.load(filename)
+    centers = saved['centers']
+
+    # Centers for another k or input shape are not a sensible seed.
+    if centers.shape != (k, n_features):
+        ph.disp('Not warm starting, saved centers have shape %s' %
+                str(centers.shape))
+        return None
+
+    ph.disp('Warm starting from %i centers' % k)
+    return preprocessing.normalize(np.array(centers, dtype=np.float64))
@@ -1,5 +1,8 @@
 import os
 import csv
+from functools import partial
+from multiprocessing import Pool
+from helpers.parallel import get_n_jobs
 from keras import backend as K
 import numpy as np
 
@@ -7,6 +10,19 @@ from helpers.printhelper import PrintHelper as ph
 from clustering import pre_process_clusters
 
 from clustering import load_or_create_centroids
+from clustering import build_layer_cluster_vecs
+from helpers.pipeline import StageTimeline
+from helpers.pipeline import BackgroundWriter
+from helpers.pipeline import pipelined_forward
+from helpers.warm_start import WARM_START_DIR
+from helpers.warm_start import get_warm_start_loc
+from helpers.k_selection import is_k_range
+from helpers.layer_predictor import LayerPredictor
+from helpers.layer_predictor import get_predictor_loc
+from helpers.layer_predictor import load_layer_predictor
+from helpers.checkpoint import LayerCheckpointer
+from helpers.checkpoint import get_checkpoint_dir
+from helpers.profiler import PROFILER as prof
 
 
 class KMeansHandler(object):
@@ -26,6 +42,10 @@ class KMeansHandler(object):
         self.train_data = train_data
         self.filter_params = filter_params
         self.model_wrapper = model_wrapper
+        self.timeline = StageTimeline()
+        self.writer = BackgroundWriter(self.timeline)
+        self.checkpointer = None
+        self.profile_loc = ''
 
 
     def set_filter_params(self, selection_count):
@@ -60,6 +80,15 @@ class KMeansHandler(object):
 
         self.raw_out_loc = raw_out_loc
         self.centroids_out_loc = centroids_out_loc
+        self.profile_loc = 'data/centroids/python_' + extra_path + '/profile.json'
+
+        hyperparams = self.model_wrapper.hyperparams
+        if hyperparams.resumable:
+            checkpoint_dir = hyperparams.checkpoint_dir
+            if checkpoint_dir is None:
+                checkpoint_dir = get_checkpoint_dir(extra_path)
+            self.checkpointer = LayerCheckpointer(checkpoint_dir, self.train_data,
+                    cache_inputs=hyperparams.cache_layer_inputs)
 
 
     def handle_kmeans(self, layer_index, save_name, k, input_shape, output_shape,
@@ -72,6 +101,7 @@ class KMeansHandler(object):
         :param save_name: The file to save and load the anchor vectors and possibly raw
         output data to.
         :param k: The number of anchor vectors to create. Used in the k-means algorithm.
+        Can also be a list or range of candidates to select the number from.
         :param input_shape: The input dimensions of this layer.
         :param output_shape: The output dimensions of this layer.
         layer layer_index.
@@ -92,18 +122,80 @@ class KMeansHandler(object):
         ph.disp('Assert shape' + str(assert_shape), ph.FAIL)
         ph.disp('Output shape ' + str(output_shape), ph.FAIL)
 
+        # Resume from the checkpoint of the layer if it is still valid.
+        config = None
+        if self.checkpointer is not None:
+            if not self.should_set_weights[layer_index]:
+                self.checkpointer.end_chain()
+            else:
+                config = self.__get_layer_config(layer_index, save_name, k,
+                        input_shape, output_shape, convolute)
+                weights, predictor = self.checkpointer.load(layer_index, config)
+                if weights is not None:
+                    if self.force_create[layer_index]:
+                        ph.disp('Layer %i resumed from its checkpoint despite force_create' %
+                                layer_index, ph.WARNING)
+                    # The predictor saved under the save name may be from
+                    # another configuration, only the checkpointed one is used.
+                    self.model_wrapper.predictors.pop(layer_index, None)
+                    if predictor is not None:
+                        self.model_wrapper.set_predictor(predictor, layer_index)
+                    return weights
+                self.checkpointer.start_layer(layer_index)
+
         f_prev_out = None
         wrapper_model = self.model_wrapper.model
-
-        if len(wrapper_model.layers) > 0:
+        hyperparams = self.model_wrapper.hyperparams
+
+        # Keep the cluster vectors in a memory mapped file if requested.
+        memmap_loc = ''
+        if hyperparams.out_of_core:
+            memmap_loc = self.raw_out_loc + save_name + '.npy'
+
+        # Seed the clustering from the centers of the previous run.
+        warm_start_loc = ''
+        if hyperparams.warm_start:
+            warm_start_dir = hyperparams.warm_start_dir
+            if warm_start_dir is None:
+                warm_start_dir = WARM_START_DIR
+            if config is None:
+                config = self.__get_layer_config(layer_index, save_name, k,
+                        input_shape, output_shape, convolute)
+            warm_start_loc = get_warm_start_loc(hyperparams.extra_path, config,
+                    warm_start_dir)
+
+        # The cluster vectors if they were built while forwarding the input.
+        cluster_vecs = None
+
+        # The input of a layer with random weights is only needed to save it.
+        needs_input = self.should_set_weights[layer_index] or (self.SHOULD_SAVE_RAW and
+                self.force_create[layer_index])
+
+        # The input of the layer from an earlier build sharing its first layers.
+        # The key of the layers so far leaves out how their output is shaped.
+        cached_out = None
+        input_config = self.__get_input_config(input_shape)
+        if self.checkpointer is not None and len(wrapper_model.layers) > 0 and needs_input:
+            cached_out = self.checkpointer.load_input(input_config)
+            if cached_out is not None and cached_out.shape[1:] != tuple(input_shape):
+                ph.disp('Not using the cached input of layer %i, it has shape %s' %
+                        (layer_index, str(cached_out.shape[1:])), ph.WARNING)
+                cached_out = None
+
+        if len(wrapper_model.layers) > 0 and needs_input and cached_out is None:
             f_prev_out = K.function([wrapper_model.layers[0].input],
                     [wrapper_model.layers[len(wrapper_model.layers) - 1].output])
 
         # This is the first layer there is no need to transform any of the data.
-        if f_prev_out is None:
+        if len(wrapper_model.layers) == 0:
             # This is the first layer.
             ph.disp('Starting with the training data.')
             layer_out = self.train_data
+        elif cached_out is not None:
+            layer_out = cached_out
+        elif f_prev_out is None:
+            ph.disp('Skipping the forward pass of the unused input.')
+            layer_out = None
         else:
             if self.should_set_weights[layer_index]:
                 # Chain the output from the previous.
@@ -117,7 +209,26 @@ class KMeansHandler(object):
             #print('Mean ' + str(np.mean(self.prev_out)) + ', ', end='')
             #print('STD ' +  str(np.std(self.prev_out )))
 
-            layer_out = f_prev_out([self.train_data])[0]
+            if hyperparams.pipeline_chunk_size is None:
+                with self.timeline.stage('forward', layer_index), prof.timer('forward'):
+                    layer_out = f_prev_out([self.train_data])[0]
+            else:
+                # Only build the cluster vectors here if they will be used.
+                build_vecs = (self.should_set_weights[layer_index] and
+                        self.force_create[layer_index] and memmap_loc == '')
+                with prof.timer('forward'):
+                    layer_out, cluster_vecs = self.__pipelined_forward(f_prev_out,
+                            layer_index, input_shape, convolute, build_vecs,
+                            hyperparams.pipeline_chunk_size)
+
+            # The input shape was inferred statically by the model wrapper.
+            if layer_out.shape[1:] != tuple(input_shape):
+                raise ValueError('Layer %i input has shape %s but %s was inferred' %
+                        (layer_index, str(layer_out.shape[1:]), str(tuple(input_shape))))
+
+            if self.checkpointer is not None:
+                with self.timeline.stage('checkpoint', layer_index):
+                    self.checkpointer.save_input(layer_out, input_config)
 
             #layer_out = pre_process_clusters(layer_out, convolute)
 
@@ -134,25 +245,147 @@ class KMeansHandler(object):
 
         # If the anchor vectors should be calculated calculate them.
         if self.should_set_weights[layer_index]:
-            tmp_centroids = load_or_create_centroids(self.force_create[layer_index], self.centroids_out_loc +
-                save_name + '.csv', self.batch_size, layer_out, input_shape, self.subsample,
-                self.filter_size, k, self.filter_params, layer_index,
-                self.model_wrapper, convolute=convolute)
-
-            if len(tmp_centroids) != k:
-                output_shape = (output_shape[0], len(tmp_centroids))
-                assert_shape = (len(tmp_centroids), assert_shape[1])
+            centroids_loc = self.centroids_out_loc + save_name + '.csv'
+
+            # Only a layer that is clustered again gets a new predictor.
+            self.model_wrapper.predictors.pop(layer_index, None)
+            self.filter_params.selected_indices.pop(layer_index, None)
+
+            with self.timeline.stage('cluster', layer_index):
+                tmp_centroids = load_or_create_centroids(self.force_create[layer_index],
+                    centroids_loc, self.batch_size, layer_out, input_shape, self.subsample,
+                    self.filter_size, k, self.filter_params, layer_index, self.model_wrapper,
+                    convolute=convolute, memmap_loc=memmap_loc,
+                    warm_start_loc=warm_start_loc, cluster_vecs=cluster_vecs,
+                    writer=self.writer)
+
+            # The number of anchor vectors was adjusted or selected from a
+            # range of ks.
+            n_centroids = len(tmp_centroids)
+            if is_k_range(k) or n_centroids != k:
+                if convolute:
+                    output_shape = (n_centroids,) + tuple(output_shape[1:])
+                else:
+                    output_shape = (output_shape[0], n_centroids)
+                assert_shape = (n_centroids, assert_shape[1])
+
+            self.__handle_predictor(layer_index, get_predictor_loc(centroids_loc),
+                    tmp_centroids)
 
             if assert_shape is not None:
                 assert tmp_centroids.shape == assert_shape, 'Shape is %s' % str(tmp_centroids.shape)
 
             tmp_centroids = tmp_centroids.reshape(output_shape)
 
+            if self.checkpointer is not None:
+                with self.timeline.stage('checkpoint', layer_index):
+                    self.checkpointer.save(layer_index, config, tmp_centroids,
+                            layer_out, self.filter_params.selected_indices.get(layer_index),
+                            predictor=self.model_wrapper.predictors.get(layer_index))
+
             return tmp_centroids
         else:
             return None
 
 
+    def finish(self):
+        """
+        Wait for the anchor vectors to be written and report the timeline of
+        the build.
+        """
+        with self.timeline.stage('wait writes'):
+            self.writer.wait()
+        self.timeline.report()
+
+
+    def __get_layer_config(self, layer_index, save_name, k, input_shape,
+            output_shape, convolute):
+        """
+        The settings that decide the anchor vectors of a layer given its input.
+        """
+        hyperparams = self.model_wrapper.hyperparams
+        return {
+                'layer_index': layer_index,
+                'save_name': save_name,
+                'k': [int(x) for x in k] if is_k_range(k) else int(k),
+                'input_shape': [int(x) for x in input_shape],
+                'output_shape': [int(x) for x in output_shape],
+                'convolute': convolute,
+                'selection_count': self.filter_params.selection_count,
+                'subsample': list(self.subsample),
+                'filter_size': list(self.filter_size),
+                'batch_size': self.batch_size,
+                'out_of_core': hyperparams.out_of_core,
+                'cluster_max_iter': hyperparams.cluster_max_iter,
+                'cluster_tol': hyperparams.cluster_tol,
+                'cluster_time_budget': hyperparams.cluster_time_budget,
+                'warm_start': hyperparams.warm_start,
+                # The last layer is clustered recursively.
+                'n_layers': len(hyperparams.nkerns) + len(hyperparams.fc_sizes),
+                'k_criterion': hyperparams.k_criterion,
+                'activation_func': hyperparams.activation_func,
+                'random_state': hyperparams.random_state,
+            }
+
+
+    def __get_input_config(self, input_shape):
+        """
+        The settings that decide the shape of the input of a layer given the
+        layers before it.
+        """
+        hyperparams = self.model_wrapper.hyperparams
+        return {
+                'input_shape': [int(x) for x in input_shape],
+                'subsample': list(hyperparams.subsample),
+                'border_mode': self.model_wrapper.CONV_BORDER_MODE,
+                'pool_size': list(self.model_wrapper.POOL_SIZE),
+            }
+
+
+    def __pipelined_forward(self, f_prev_out, layer_index, input_shape, convolute,
+            build_vecs, chunk_size):
+        """
+        Forward the training data through the layers so far in chunks. If
+        build_vecs is set the cluster vectors of each chunk are built in a
+        process pool while the next chunk is forwarded.
+
+        :returns: The layer input and its cluster vectors or None.
+        """
+        if not build_vecs:
+            return pipelined_forward(f_prev_out, self.train_data,
+                    chunk_size=chunk_size, timeline=self.timeline,
+                    layer_index=layer_index)
+
+        ph.disp('Building cluster vectors while forwarding chunks of %i' % chunk_size)
+        with Pool(processes=get_n_jobs()) as p:
+            extract_f = partial(build_layer_cluster_vecs, input_shape=input_shape,
+                    stride=self.subsample, filter_shape=self.filter_size,
+                    convolute=convolute, pool=p)
+
+            return pipelined_forward(f_prev_out, self.train_data, extract_f,
+                    chunk_size=chunk_size, timeline=self.timeline,
+                    layer_index=layer_index)
+
+
+    def __handle_predictor(self, layer_index, filename, centroids):
+        """
+        Save the predictor of a layer that was just clustered next to its
+        anchor vectors, or load the saved one if the anchor vectors were
+        loaded.
+        """
+        predictor = self.model_wrapper.predictors.get(layer_index)
+        if predictor is not None:
+            predictor = LayerPredictor.from_predictor(predictor, centroids)
+            self.writer.submit(predictor.save, filename, layer_index=layer_index)
+        else:
+            predictor = load_layer_predictor(filename, len(centroids))
+            if predictor is None:
+                return
+            ph.disp('Loaded the predictor of layer %i' % layer_index)
+
+        self.model_wrapper.set_predictor(predictor, layer_index)
+
+
     def __save_raw_output(self, filename, output):
         """
         Helper method to save the transformed input of a layer.
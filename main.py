@@ -124,6 +124,8 @@ def search_test():
     for f0 in range(30, 180, 5):
         hyperparams = get_hyperparams()
         hyperparams.extra_path = 'kmeans'
+        # Consecutive points only differ in one layer size.
+        hyperparams.warm_start = True
         hyperparams.nkers = (max_k0, max_k1)
         hyperparams.fc_sizes = (f0, 60)
         force_create = [True, True, True, True]
@@ -145,6 +147,8 @@ def search_test():
     for f1 in range(20, 80, 5):
         hyperparams = get_hyperparams()
         hyperparams.extra_path = 'kmeans'
+        # Consecutive points only differ in one layer size.
+        hyperparams.warm_start = True
         hyperparams.nkers = (max_k0, max_k1)
         hyperparams.fc_sizes = (max_f0, f1)
         force_create = [True, True, True, True]
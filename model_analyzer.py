@@ -14,6 +14,8 @@ import collections
 from helpers.mathhelper import *
 from helpers.printhelper import PrintHelper as ph
 from clustering import pre_process_clusters
+from helpers.layer_predictor import LayerPredictor
+from helpers.pruning import prune_layers
 
 from MulticoreTSNE import MulticoreTSNE as TSNE
 import sklearn.preprocessing as preprocessing
@@ -97,20 +99,17 @@ class ModelAnalyzer(ModelWrapper):
 
         centroids = anchor_vecs[-1]
 
-        self.predictor = None
-        if self.predictor is not None:
-            pred_labels = self.predictor.predict(transformed_x)
-        else:
-            closest_anchor_vecs = get_closest_vectors(centroids,
-                    zip(transformed_x, train_y), too_close_thresh=0.01)
+        # Reuse the saved or fitted predictor of the final layer. After a
+        # partial update it no longer matches the weights, fall back to them.
+        predictor = self.predictors.get(len(anchor_vecs) - 1)
+        if not isinstance(predictor, LayerPredictor):
+            predictor = LayerPredictor(centroids, centroids)
 
-            pred_labels = [int(closest_anchor_vec[2]) for closest_anchor_vec in closest_anchor_vecs]
-            dists = [closest_anchor_vec[3] for closest_anchor_vec in closest_anchor_vecs]
-            closest = [len(closest_anchor_vec[4]) for closest_anchor_vec in
-                    closest_anchor_vecs]
+        pred_labels, dists, closest = predictor.closest(transformed_x,
+                too_close_thresh=0.01)
 
-            self.close_vecs_indices = [i for i in range(len(closest)) if closest[i] > 1]
-            self.pred_labels = pred_labels
+        self.close_vecs_indices = set(np.flatnonzero(closest > 1))
+        self.pred_labels = list(pred_labels)
 
         #print('The mean number of closest clusters')
         #closest = np.array(closest)
@@ -195,58 +194,19 @@ class ModelAnalyzer(ModelWrapper):
         #df.to_csv('data/output/' + data_filename + '.csv', index=False)
 
 
-    def prune_neurons(self):
-        ph.disp('Pruning network')
-        # Get the anchor vectors of the network.
-        anchor_vecs = list(get_anchor_vectors(self))
-
-        cs_thresh = 0.7
+    def prune_neurons(self, cs_thresh=0.7):
+        """
+        Merge the anchor vectors of each layer that are more cosine similar
+        than cs_thresh and compact the network.
 
-        is_conv = [False] * len(anchor_vecs)
+        :returns: The report of compact.
+        """
+        ph.disp('Pruning network')
+        layer_params, n_removed = prune_layers(self.get_layer_params(), cs_thresh)
+        for layer_index, n in enumerate(n_removed):
+            ph.disp('Layer %i: %i AVs compacted' % (layer_index, n))
 
-        conv_out_shape = [None] * len(anchor_vecs)
-        for i in range(len(self.hyperparams.nkerns)):
-            is_conv[i] = True
-            if i == 0:
-                prev_kern = 1
-            else:
-                prev_kern = self.hyperparams.nkerns[i - 1]
-            conv_out_shape[i] = (-1, prev_kern,
-                    *self.hyperparams.filter_size)
-
-        for layer_index, av_layer in enumerate(anchor_vecs):
-            pre_len = len(av_layer)
-            av_layer = list(av_layer)
-
-            # Check if any two anchor vectors are very similar
-            for i, av in enumerate(av_layer):
-                # Check if close to any other anchor vectors
-                for j, comp_av in enumerate(av_layer):
-                    if i == j:
-                        continue
-
-                    av = np.array(av).reshape(1, -1)
-                    comp_av = np.array(comp_av).reshape(1, -1)
-
-                    cs = cosine_similarity(av, comp_av)
-                    if cs > cs_thresh:
-                        av_layer[j] = (av + comp_av) / 2.0
-                        del av_layer[i]
-                        break
-
-            anchor_vecs[layer_index] = av_layer
-            ph.disp('Layer %i: %i AVs compacted' % (layer_index, pre_len - len(av_layer)))
-
-        anchor_vecs = np.array(anchor_vecs)
-        for layer_index, av_layer in enumerate(anchor_vecs):
-            if is_conv[layer_index]:
-                print('Trying to change to %s' +
-                        str(conv_out_shape[layer_index]))
-                print('existing ' +
-                        str(np.array(anchor_vecs[layer_index]).shape))
-                anchor_vecs[layer_index] = np.array(anchor_vecs[layer_index]).reshape(conv_out_shape[layer_index])
-
-        set_avs(self.model, np.array(anchor_vecs))
+        return self.compact(layer_params=layer_params)
 
 
     def perform_tsne(self):
@@ -2,6 +2,10 @@ import numpy as np
 import datetime
 from helpers.printhelper import PrintHelper as ph
 from sklearn.ensemble import IsolationForest
+from sklearn.utils import check_random_state
+from streaming_kmeans import iter_blocks
+from helpers.profiler import PROFILER as prof
+from helpers.parallel import get_n_jobs
 
 
 class DiscriminatoryFilter(object):
@@ -9,19 +13,25 @@ class DiscriminatoryFilter(object):
     CUTOFF = [25000, 25000, 40000, 40000, 40000]
     use_select_count = False
 
-    def __init__(self, selection_count = None):
+    def __init__(self, selection_count = None, random_state = None):
         """
         Constructor
 
         :param selection_percent: floating point value in [0.0, 1.0]
         the percentage of elements sorted by variance to return.
+        :param random_state: The seed of the random selections. None to use
+        the global numpy random state.
         """
         self.selection_count = selection_count
+        self.random_state = check_random_state(random_state)
+        # The indices of the samples selected for each layer by the methods
+        # that select at random or out-of-core, keyed by layer index.
+        self.selected_indices = {}
 
 
     def filter_outliers(self, samples):
         ph.disp('Filtering out outliers')
-        clf = IsolationForest(max_samples=5000, n_estimators = 500, n_jobs=-1)
+        clf = IsolationForest(max_samples=5000, n_estimators = 500, n_jobs=get_n_jobs())
         clf.fit(samples)
         samples_pred = clf.predict(samples)
 
@@ -44,40 +54,106 @@ class DiscriminatoryFilter(object):
             std_vars, avg_mean))
 
 
+    @prof.timed('filter')
     def get_selected(self, samples, layer_index):
         #self.disp_data_info(samples)
-        variances = np.var(samples, axis=1)
-        per_sample_avg = np.mean(variances)
-        per_sample_std = np.std(variances)
-        print('The min variance is ', np.amin(variances))
-        print('The max variance is ', np.amax(variances))
-        print('per sample std ', per_sample_std)
-        print('per sample avg ', per_sample_avg)
+        self.disp_variances(samples)
 
         if self.selection_count is None:
             return samples
-        return samples[np.random.choice(samples.shape[0], self.selection_count,
-            replace=False), :]
+        selected = self.random_state.choice(samples.shape[0], self.selection_count,
+            replace=False)
+        self.selected_indices[layer_index] = selected
+        return samples[selected, :]
 
+    @prof.timed('filter')
     def get_top(self, samples, layer_index):
-        if len(samples) > self.selection_count:
+        if self.selection_count is None:
+            ph.disp('-----Left with %i samples' % (len(samples)))
+        elif len(samples) > self.selection_count:
             samples = samples[0:self.selection_count]
             ph.disp('-----Selected %i samples' % (self.selection_count))
         else:
             ph.disp('-----Left with %i samples' % (len(samples)))
 
-        variances = np.var(samples, axis=1)
-        variances = np.array(variances, np.float32)
-        per_sample_avg = np.mean(variances)
-        per_sample_std = np.std(variances)
-        print('The min variance is ', np.amin(variances))
-        print('The max variance is ', np.amax(variances))
-        print('per sample std ', per_sample_std)
-        print('per sample avg ', per_sample_avg)
+        self.disp_variances(samples)
 
         return samples
 
 
+    def disp_variances(self, samples):
+        """
+        Display statistics of the per sample variances. They are only computed
+        if debug output is enabled.
+        """
+        if not ph.is_enabled(ph.DEBUG):
+            return
+
+        variances = np.array(np.var(samples, axis=1), np.float32)
+        ph.debug('The min variance is %s', np.amin(variances))
+        ph.debug('The max variance is %s', np.amax(variances))
+        ph.debug('per sample std %s', np.std(variances))
+        ph.debug('per sample avg %s', np.mean(variances))
+
+
+    def get_variances_out_of_core(self, samples):
+        """
+        The variance of each sample computed one block at a time so a memory
+        mapped set of samples is never loaded in full.
+        """
+        variances = np.empty(len(samples), dtype=np.float32)
+        for block in iter_blocks(len(samples)):
+            variances[block] = np.var(np.asarray(samples[block]), axis=1)
+        return variances
+
+
+    @prof.timed('filter')
+    def get_top_out_of_core(self, samples, layer_index):
+        """
+        The equivalent of get_sorted followed by get_top for memory mapped
+        samples. Only the selected samples are loaded into memory.
+        """
+        if self.selection_count is None:
+            return samples
+
+        variances = self.get_variances_out_of_core(samples)
+        thresh_var = np.mean(variances)
+
+        ph.disp('-----Filtering out values lower than %.5f to make sorting easier' % (thresh_var))
+        candidates = np.where(variances > thresh_var)[0]
+        ph.disp('-----Filtered out %i values to make sorting easier' %
+                (len(samples) - len(candidates)))
+
+        # Highest variance first.
+        order = np.argsort(-variances[candidates], kind='mergesort')
+        selected = candidates[order[0:self.selection_count]]
+        ph.disp('-----Selected %i samples' % (len(selected)))
+        self.selected_indices[layer_index] = selected
+
+        # Read in file order, then restore the variance order.
+        read_order = np.argsort(selected)
+        top_samples = np.empty((len(selected), samples.shape[1]), dtype=samples.dtype)
+        top_samples[read_order] = samples[selected[read_order]]
+
+        return top_samples
+
+
+    @prof.timed('filter')
+    def get_selected_out_of_core(self, samples, layer_index):
+        """
+        The equivalent of get_selected for memory mapped samples. If there is no
+        selection count the memory map is returned untouched.
+        """
+        if self.selection_count is None or self.selection_count >= len(samples):
+            return samples
+
+        selected = np.sort(self.random_state.choice(len(samples), self.selection_count,
+                replace=False))
+        self.selected_indices[layer_index] = selected
+        return np.asarray(samples[selected])
+
+
+    @prof.timed('filter')
     def get_sorted(self, samples, layer_index):
         if self.selection_count is None:
             return np.array(samples)
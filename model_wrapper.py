@@ -34,6 +34,16 @@ from multiprocessing import cpu_count
 from functools import partial
 
 from clustering import build_patch_vecs
+from clustering import build_layer_cluster_vecs
+from clustering import post_process_centroids
+from streaming_kmeans import streaming_from_predictor
+from helpers.shape_inference import conv_block_output_shape
+from helpers.shape_inference import dense_output_shape
+from helpers.profiler import PROFILER as prof
+from helpers.model_cost import count_flops
+from helpers.model_cost import measure_latency
+from helpers.pruning import find_dead_units
+from helpers.pruning import slice_layers
 from helpers.mathhelper import *
 from kmeans_handler import KMeansHandler
 
@@ -45,6 +55,10 @@ class ModelWrapper(object):
     Encapsulates all of the behavior of the full network.
     Intended to make analyzing and creating the network to be easy.
     """
+    # The border mode of the convolutions and the size and stride of the max
+    # pooling after them.
+    CONV_BORDER_MODE = 'same'
+    POOL_SIZE = (2, 2)
 
     def __init__(self, hyperparams, force_create):
         """
@@ -59,10 +73,55 @@ class ModelWrapper(object):
         self.accuracy     = None
         self.output_count = None
         self.predictor    = None
+        # The StageTimeline of the last build.
+        self.timeline     = None
+        # Where the profiling report of the last build is written.
+        self.profile_loc  = None
+        # The data to build from instead of CIFAR-10. See set_dataset.
+        self.dataset      = None
+        # The fitted clustering of each layer keyed by layer index.
+        self.predictors   = {}
+        # The ConvergenceMonitor of the clustering of each layer.
+        self.convergence  = {}
+        # The scoring table of each layer whose width was selected.
+        self.k_selection  = {}
+
+
+    def set_predictor(self, predictor, layer_index=None):
+        """
+        :param layer_index: The layer the predictor gave the anchor vectors
+        of. None if it is not the clustering of a whole layer.
+        """
+        self.predictor = predictor
+        if layer_index is not None:
+            self.predictors[layer_index] = predictor
 
 
-    def set_predictor(self, predictor):
-        self.predictor = predictor
+    def set_convergence(self, layer_index, monitor):
+        self.convergence[layer_index] = monitor
+
+
+    def set_k_selection(self, layer_index, k_table):
+        self.k_selection[layer_index] = k_table
+
+
+    def get_convergence_stats(self):
+        """
+        :returns: The clustering history of each layer keyed by layer index.
+        """
+        return {layer_index: monitor.get_stats() for layer_index, monitor in
+                self.convergence.items()}
+
+
+    def set_dataset(self, train_x, train_y, test_x, test_y):
+        """
+        Build from the given data instead of loading CIFAR-10. Like the loaded
+        data only the first cluster_count samples are used.
+
+        :param train_x: The images with the Theano dimension ordering.
+        :param train_y: The one hot labels of the images.
+        """
+        self.dataset = (train_x, test_x, train_y, test_y)
 
 
     def set_avg_ratio(self, avg_ratio):
@@ -83,6 +142,8 @@ class ModelWrapper(object):
             self.eval_performance()
         self.train_model()
         self.test_model()
+        # Add the training and evaluation to the report of the build.
+        prof.save_report(self.profile_loc)
         return self.accuracy
 
 
@@ -93,10 +154,22 @@ class ModelWrapper(object):
         compute and set the anchor vector for every single layer.
         """
 
+        prof.reset()
+
+        # Keras draws the initial weights from the global numpy random state.
+        if self.hyperparams.random_state is not None:
+            np.random.seed(self.hyperparams.random_state)
+
         # Break the data up into test and training set.
         # This will be set at 0.3 is test and 0.7 is training.
-        (train_data, test_data, train_labels, test_labels) = self.__fetch_data(0.3,
-                self.hyperparams.cluster_count)
+        with prof.timer('load data'):
+            if self.dataset is not None:
+                use_amount = self.hyperparams.cluster_count
+                (train_data, test_data, train_labels, test_labels) = [data[0:use_amount]
+                        for data in self.dataset]
+            else:
+                (train_data, test_data, train_labels, test_labels) = self.__fetch_data(0.3,
+                        self.hyperparams.cluster_count)
 
         self.all_train_x = train_data
         self.all_train_y =  train_labels
@@ -120,7 +193,7 @@ class ModelWrapper(object):
 
         kmeans_handler = KMeansHandler(should_set_weights, force_create, batch_size,
                 patches_subsample, filter_size, train_data,
-                DiscriminatoryFilter(), self)
+                DiscriminatoryFilter(random_state=self.hyperparams.random_state), self)
 
         kmeans_handler.set_filepaths(extra_path)
 
@@ -133,67 +206,250 @@ class ModelWrapper(object):
         for i in range(len(nkerns)):
             kmeans_handler.set_filter_params(selection_counts[i])
 
-            output_shape = (nkerns[i], input_shape[0], filter_size[0], filter_size[1])
-            assert_shape = (nkerns[i], input_shape[0] * filter_size[0] * filter_size[1])
+            if np.ndim(nkerns[i]) > 0 and not should_set_weights[i]:
+                raise ValueError('The width of layer %i can only be selected when it is clustered' % i)
+
+            # A range of widths is resolved by the clustering of the layer.
+            # Until then the largest candidate stands in for the shapes.
+            nkern = int(np.max(nkerns[i]))
+            output_shape = (nkern, input_shape[0], filter_size[0], filter_size[1])
+            assert_shape = (nkern, input_shape[0] * filter_size[0] * filter_size[1])
 
             #add_max_pool = (i % 2 == 1)
             add_max_pool = True
-            centroid_weights = kmeans_handler.handle_kmeans(i, 'c' + str(i), nkerns[i],
-                    input_shape, output_shape, True, assert_shape =
-                    assert_shape)
+            with prof.layer_scope(i):
+                centroid_weights = kmeans_handler.handle_kmeans(i, 'c' + str(i), nkerns[i],
+                        input_shape, output_shape, True, assert_shape =
+                        assert_shape)
 
             if should_set_weights[i]:
                 ph.disp('Setting layer weights.')
+                if nkern != centroid_weights.shape[0]:
+                    ph.disp('Selected %i kernels for layer %i' %
+                            (centroid_weights.shape[0], i))
+                    nkern = centroid_weights.shape[0]
 
             is_last = (i == len(nkerns) - 1)
             activation_func = 'relu'
-            f_conv_out = self.__add_convlayer(self.model, nkerns[i], subsample, filter_size,
-                            input_shape = input_shape, weights = centroid_weights,
-                            flatten=is_last, add_max_pooling=add_max_pool)
-
-            # Pass inputs through see what output is.
-            tmp_data = np.empty(input_shape)
-            tmp_out = f_conv_out([[tmp_data]])[0]
-            input_shape = tmp_out.shape[1:]
+            with prof.timer('set weights', i):
+                self.__add_convlayer(self.model, nkern, subsample, filter_size,
+                                input_shape = input_shape, weights = centroid_weights,
+                                flatten=is_last, add_max_pooling=add_max_pool)
+
+            input_shape = conv_block_output_shape(input_shape, nkern, filter_size,
+                    subsample, border_mode=self.CONV_BORDER_MODE,
+                    pool_size=self.POOL_SIZE if add_max_pool else None,
+                    flatten=is_last)
             ph.linebreak()
 
-        f_fc_out = f_conv_out
-
         # Create the FC layers.
         for i in range(len(fc_sizes)):
             offset_index = i + len(nkerns)
             kmeans_handler.set_filter_params(selection_counts[offset_index])
 
-            output_shape = (np.array(input_shape).prod(), fc_sizes[i])
-            assert_shape = (fc_sizes[i], np.array(input_shape).prod())
-            centroid_weights = kmeans_handler.handle_kmeans(offset_index, 'f' + str(i), fc_sizes[i],
-                    input_shape, output_shape, False, assert_shape = assert_shape)
+            if np.ndim(fc_sizes[i]) > 0 and not should_set_weights[offset_index]:
+                raise ValueError('The width of layer %i can only be selected when it is clustered' %
+                        offset_index)
+
+            fc_size = int(np.max(fc_sizes[i]))
+            output_shape = (np.array(input_shape).prod(), fc_size)
+            assert_shape = (fc_size, np.array(input_shape).prod())
+            with prof.layer_scope(offset_index):
+                centroid_weights = kmeans_handler.handle_kmeans(offset_index, 'f' + str(i),
+                        fc_sizes[i], input_shape, output_shape, False, assert_shape = assert_shape)
 
-            if should_set_weights[offset_index] and centroid_weights.shape[1] != fc_sizes[i]:
+            if should_set_weights[offset_index] and centroid_weights.shape[1] != fc_size:
                 # Made automatic adjustment to the # of clusters.
                 ph.disp('Adjusting %i to %i anchor vectors for layer %i' %
-                        (fc_sizes[i], centroid_weights.shape[1], offset_index))
+                        (fc_size, centroid_weights.shape[1], offset_index))
+
+                fc_size = centroid_weights.shape[1]
 
-                fc_sizes[i] = centroid_weights.shape[1]
+            fc_sizes[i] = fc_size
 
             if should_set_weights[offset_index]:
                 ph.disp('Setting layer weights')
 
-            if i == len(fc_sizes) - 1:
-                self.__add_dense_layer(self.model, fc_sizes[i], weights = centroid_weights)
-            else:
-                f_fc_out = self.__add_fclayer(self.model, fc_sizes[i], weights = centroid_weights)
+            with prof.timer('set weights', offset_index):
+                if i == len(fc_sizes) - 1:
+                    self.__add_dense_layer(self.model, fc_sizes[i], weights = centroid_weights)
+                else:
+                    self.__add_fclayer(self.model, fc_sizes[i], weights = centroid_weights)
 
-            input_shape = (fc_sizes[i],)
+            input_shape = dense_output_shape(input_shape, fc_sizes[i])
             ph.linebreak()
 
+        #self.model.add(Activation('softmax'))
+
+        with kmeans_handler.timeline.stage('compile'), prof.timer('compile'):
+            self.__compile_model()
+
+        # The anchor vectors are written while the model compiles.
+        kmeans_handler.finish()
+        self.timeline = kmeans_handler.timeline
+
+        self.profile_loc = kmeans_handler.profile_loc
+        prof.save_report(self.profile_loc)
+        ph.disp('Saved the profile of the build to %s' % self.profile_loc)
+
+
+    def rebuild_model(self, layer_params):
+        """
+        Rebuild the model with new parameters for every layer. The number of
+        units of a layer can change, nkerns and fc_sizes are updated to
+        match.
+
+        :param layer_params: The [weights, bias] of every layer with
+        parameters in order. The input dimension of each layer has to match
+        the units of the layer before.
+        """
+        n_conv             = len(self.hyperparams.nkerns)
+        n_fc               = len(self.hyperparams.fc_sizes)
+        input_shape        = self.hyperparams.input_shape
+        subsample          = self.hyperparams.subsample
+        filter_size        = self.hyperparams.filter_size
+
+        if len(layer_params) != n_conv + n_fc:
+            raise ValueError('Expected the parameters of %i layers not %i' %
+                    (n_conv + n_fc, len(layer_params)))
+
+        prev_widths = []
+        if self.model is not None:
+            prev_widths = self.get_layer_widths()
+
+        self.model = Sequential()
+
+        nkerns = []
+        for i in range(n_conv):
+            weights = layer_params[i][0]
+            nkern = weights.shape[0]
+            is_last = (i == n_conv - 1)
+            self.__add_convlayer(self.model, nkern, subsample, filter_size,
+                    input_shape = input_shape, weights = weights, flatten=is_last)
+            input_shape = conv_block_output_shape(input_shape, nkern, filter_size,
+                    subsample, border_mode=self.CONV_BORDER_MODE,
+                    pool_size=self.POOL_SIZE, flatten=is_last)
+            nkerns.append(nkern)
+
+        fc_sizes = []
+        for i in range(n_fc):
+            weights = layer_params[n_conv + i][0]
+            fc_size = weights.shape[1]
+            if i == n_fc - 1:
+                self.__add_dense_layer(self.model, fc_size, weights = weights)
+            else:
+                self.__add_fclayer(self.model, fc_size, weights = weights)
+            input_shape = dense_output_shape(input_shape, fc_size)
+            fc_sizes.append(fc_size)
+
+        param_layers = [layer for layer in self.model.layers if len(layer.get_weights()) > 0]
+        for layer, (weights, bias) in zip(param_layers, layer_params):
+            layer.set_weights([weights, bias])
+
+        # The clustering of a layer with fewer units no longer describes it.
+        for i, (prev_width, width) in enumerate(zip(prev_widths, nkerns + fc_sizes)):
+            if prev_width != width:
+                self.predictors.pop(i, None)
+
+        self.hyperparams.nkerns = tuple(nkerns)
+        self.hyperparams.fc_sizes = tuple(fc_sizes)
+
+        self.__compile_model()
+
+
+    def get_layer_params(self):
+        """
+        :returns: The [weights, bias] of every layer with parameters in order.
+        """
+        return [layer.get_weights() for layer in self.model.layers
+                if len(layer.get_weights()) > 0]
+
+
+    def get_layer_widths(self, layer_params=None):
+        """
+        The number of units of every layer with parameters. Taken from the
+        weights as nkerns and fc_sizes can hold ranges to search over.
+
+        :param layer_params: See rebuild_model. The parameters of the model by
+        default.
+        """
+        if layer_params is None:
+            layer_params = self.get_layer_params()
+
+        n_conv = len(self.hyperparams.nkerns)
+        return [int(weights.shape[0]) if i < n_conv else int(weights.shape[1])
+                for i, (weights, bias) in enumerate(layer_params)]
+
+
+    def get_flops(self):
+        """
+        :returns: The FLOPs of every layer with parameters for a single
+        sample.
+        """
+        widths = self.get_layer_widths()
+        n_conv = len(self.hyperparams.nkerns)
+        return count_flops(self.hyperparams.input_shape, widths[:n_conv],
+                widths[n_conv:], self.hyperparams.filter_size,
+                self.hyperparams.subsample, border_mode=self.CONV_BORDER_MODE,
+                pool_size=self.POOL_SIZE)
+
+
+    def compact(self, layer_params=None, keep=None, norm_thresh=1e-6,
+            latency_samples=256):
+        """
+        Remove units from the network and rebuild it with the smaller widths,
+        slicing the input weights of the layer after each removed unit.
+
+        :param layer_params: New parameters to compact instead of those of the
+        model, for instance after merging units. See rebuild_model.
+        :param keep: A boolean mask or the indices of the units to keep for
+        every layer with parameters. None to remove the units that cannot
+        change the output.
+        :param norm_thresh: Weights with a smaller norm count as zero when
+        looking for units to remove.
+        :param latency_samples: How many test samples the latency is measured
+        on.
+
+        :returns: A dictionary of the widths, FLOPs and latency per sample
+        before and after.
+        """
+        latency_data = self.all_test_x[:latency_samples]
+
+        before = {
+                'widths': self.get_layer_widths(),
+                'flops': self.get_flops(),
+                'latency': measure_latency(self.model, latency_data,
+                    self.hyperparams.batch_size),
+            }
+
+        if layer_params is None:
+            layer_params = self.get_layer_params()
+        if keep is None:
+            keep = find_dead_units(layer_params, norm_thresh)
+
+        self.rebuild_model(slice_layers(layer_params, keep))
+
+        after = {
+                'widths': self.get_layer_widths(),
+                'flops': self.get_flops(),
+                'latency': measure_latency(self.model, latency_data,
+                    self.hyperparams.batch_size),
+            }
+
+        ph.disp('Widths %s -> %s' % (str(before['widths']), str(after['widths'])))
+        ph.disp('FLOPs %i -> %i (%.2fx)' % (sum(before['flops']), sum(after['flops']),
+            float(sum(before['flops'])) / max(sum(after['flops']), 1)), ph.OKGREEN)
+        ph.disp('Latency %.3fms -> %.3fms per sample' % (before['latency'] * 1e3,
+            after['latency'] * 1e3), ph.OKGREEN)
+
+        return {'before': before, 'after': after}
+
+
+    def __compile_model(self):
         self.final_fc_out = K.function([self.model.layers[0].input],
                 [self.model.layers[len(self.model.layers) - 2].output])
 
-        #self.model.add(Activation('softmax'))
-
         ph.disp('Compiling model')
-
         opt = SGD(lr=0.01)
         self.model.compile(loss='categorical_crossentropy', optimizer=opt, metrics=['accuracy'])
         ph.disp('Model is compiled')
@@ -293,6 +549,7 @@ class ModelWrapper(object):
         ph.disp('Prediction Accuracy %.2f' % (pred_acc * 100.))
 
 
+    @prof.timed('train')
     def train_model(self):
         """
         Train the model the number of samples specified by
@@ -311,6 +568,7 @@ class ModelWrapper(object):
         #unset_bias(self.model)
 
 
+    @prof.timed('evaluate')
     def test_model(self):
         """
         Test and print the accuracy of the model.
@@ -333,11 +591,12 @@ class ModelWrapper(object):
         Helper method to add a convolution layer.
         """
         if input_shape is not None:
-            conv_layer = Convolution2D(nkern, filter_size[0], filter_size[1], border_mode='same',
-                    subsample=subsample, input_shape=input_shape)
+            conv_layer = Convolution2D(nkern, filter_size[0], filter_size[1],
+                    border_mode=self.CONV_BORDER_MODE, subsample=subsample,
+                    input_shape=input_shape)
         else:
-            conv_layer = Convolution2D(nkern, filter_size[0], filter_size[1], border_mode='same',
-                    subsample=subsample)
+            conv_layer = Convolution2D(nkern, filter_size[0], filter_size[1],
+                    border_mode=self.CONV_BORDER_MODE, subsample=subsample)
 
         model.add(conv_layer)
 
@@ -357,7 +616,7 @@ class ModelWrapper(object):
         ph.disp('Conv Output Shape ' + str(conv_layer.output_shape))
 
         if add_max_pooling:
-            max_pooling_out = MaxPooling2D(pool_size=(2, 2), strides=(2, 2))
+            max_pooling_out = MaxPooling2D(pool_size=self.POOL_SIZE, strides=self.POOL_SIZE)
             model.add(max_pooling_out)
             ph.disp('Max Pooling Output Shape ' + str(max_pooling_out.output_shape))
 
@@ -366,19 +625,7 @@ class ModelWrapper(object):
             flatten_layer = Flatten()
             model.add(flatten_layer)
 
-            print('Flatten Shape ' + str(flatten_layer.output_shape))
-            output = flatten_layer.output
-        elif add_max_pooling:
-            output = max_pooling_out.output
-        else:
-            if activation_func != 'none':
-                output = activation_layer.output
-            else:
-                output = conv_layer.output
-
-        # The function is the output of the conv / pooling layers.
-        convout_f = K.function([conv_layer.input], [output])
-        return convout_f
+            ph.disp('Flatten Shape ' + str(flatten_layer.output_shape))
 
 
     def __add_dense_layer(self, model, output_dim, weights = None):
@@ -407,8 +654,6 @@ class ModelWrapper(object):
     def __add_fclayer(self, model, output_dim, weights=None, activation_func='relu'):
         """
         Helper method to add on a FC layer to the model.
-
-        :returns: The function that passes an input through the FC layer.
         """
         dense_layer = Dense(output_dim)
 
@@ -423,10 +668,9 @@ class ModelWrapper(object):
 
         fcOutLayer = Activation(activation_func)
         model.add(fcOutLayer)
-        fcOut_f = K.function([dense_layer.input], [fcOutLayer.output])
-        return fcOut_f
 
 
+    @prof.timed('evaluate')
     def eval_performance(self):
         """
         For unsupervised learning the model will not know which cluster corresponds to
@@ -747,6 +991,64 @@ class ModelWrapper(object):
         return (train_data, test_data, train_labels, test_labels)
 
 
+    def partial_update(self, new_x):
+        """
+        Absorb new samples into the anchor vectors without rebuilding the
+        model. Layer by layer the new samples are passed through the already
+        updated layers below, turned into cluster vectors like during the
+        build and used to update the clustering of the layer. The layer
+        weights are then set to the new anchor vectors.
+
+        Unlike the build all of the new cluster vectors are used, they are not
+        filtered by variance.
+
+        :param new_x: New input samples shaped like the training data.
+        """
+        should_set_weights = self.hyperparams.should_set_weights
+        conv_count = len(self.hyperparams.nkerns)
+
+        for layer_index, layer in enumerate(self.__get_weighted_layers()):
+            if not should_set_weights[layer_index] or layer_index not in self.predictors:
+                continue
+
+            ph.disp('Updating layer %i with %i samples' % (layer_index, len(new_x)))
+
+            if layer_index == 0:
+                layer_in = new_x
+            else:
+                f_layer_in = K.function([self.model.layers[0].input], [layer.input])
+                layer_in = f_layer_in([new_x])[0]
+
+            convolute = layer_index < conv_count
+            cluster_vecs = build_layer_cluster_vecs(layer_in,
+                    layer.input_shape[1:], self.hyperparams.patches_subsample,
+                    self.hyperparams.filter_size, convolute)
+
+            # Only some clustering implementations can take new data.
+            predictor = self.predictors[layer_index]
+            if not hasattr(predictor, 'partial_fit'):
+                predictor = streaming_from_predictor(predictor)
+                self.set_predictor(predictor, layer_index)
+
+            predictor.partial_fit(cluster_vecs)
+
+            centroids = post_process_centroids(predictor.cluster_centers_)
+            weights, bias = layer.get_weights()
+            if centroids.size != weights.size:
+                raise ValueError('Layer %i has %i weights but %i anchor vector entries' %
+                        (layer_index, weights.size, centroids.size))
+
+            layer.set_weights([centroids.reshape(weights.shape).astype(weights.dtype),
+                bias])
+
+
+    def __get_weighted_layers(self):
+        """
+        The layers with anchor vectors in the order of their layer index.
+        """
+        return [layer for layer in self.model.layers if len(layer.get_weights()) > 0]
+
+
     def __clear_layer_stats(self):
         self.layer_weight_stds = []
         self.layer_weight_avgs = []
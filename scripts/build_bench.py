@@ -0,0 +1,202 @@
+"""
+End to end benchmark of building a small ClusterCNN.
+
+A model is built with fixed seeds on synthetic images, or on a cached dataset,
+then evaluated, trained and tested. The build time and memory of every layer,
+the clustering iterations and the accuracy are written to a results file
+named after the current version so runs of different versions can be
+compared.
+
+The synthetic images are noisy copies of one random prototype per class so
+the accuracy is meaningful. A cached dataset is an npz file with the arrays
+train_x, train_y, test_x and test_y, the images with the Theano dimension
+ordering and the labels one hot.
+
+Run from the repository root:
+    python -m scripts.build_bench --n 2000 --nkerns 8 16 --fc-sizes 64
+    python -m scripts.build_bench --data data/benchmarks/cifar_small.npz
+"""
+import argparse
+import json
+import os
+import subprocess
+import sys
+
+import numpy as np
+from keras.utils import np_utils
+
+from helpers.hyper_params import HyperParamData
+from helpers.printhelper import PrintHelper as ph
+from helpers.profiler import PROFILER as prof
+from model_wrapper import ModelWrapper
+
+
+RESULTS_DIR = 'data/benchmarks'
+N_CLASSES = 10
+TEST_RATIO = 0.3
+NOISE = 0.5
+
+
+def get_version():
+    """
+    :returns: The current git commit or 'unknown' outside of a repository.
+    """
+    try:
+        return subprocess.check_output(['git', 'rev-parse', '--short', 'HEAD'],
+                stderr=subprocess.STDOUT).decode('utf-8').strip()
+    except (OSError, subprocess.CalledProcessError):
+        return 'unknown'
+
+
+def make_dataset(n, c, h, w, seed):
+    """
+    Noisy copies of a random prototype image per class, split into a train
+    and test set.
+    """
+    random_state = np.random.RandomState(seed)
+    prototypes = random_state.rand(N_CLASSES, c, h, w)
+    labels = random_state.randint(N_CLASSES, size=n)
+    images = prototypes[labels] + NOISE * random_state.randn(n, c, h, w)
+    images = images.astype(np.float32)
+    labels = np_utils.to_categorical(labels, N_CLASSES)
+
+    n_train = n - int(n * TEST_RATIO)
+    return images[:n_train], labels[:n_train], images[n_train:], labels[n_train:]
+
+
+def load_dataset(filename):
+    saved = np.load(filename)
+    return saved['train_x'], saved['train_y'], saved['test_x'], saved['test_y']
+
+
+def build_model(dataset, nkerns, fc_sizes, selection_count, remaining,
+        n_epochs, seed):
+    """
+    Build, evaluate, train and test a model.
+
+    :returns: The ModelWrapper and the accuracy after the build and after
+    training.
+    """
+    train_x, train_y, test_x, test_y = dataset
+    n_layers = len(nkerns) + len(fc_sizes) + 1
+
+    hyperparams = HyperParamData(input_shape=train_x.shape[1:], subsample=(1,1),
+            patches_subsample=(1,1), filter_size=(3,3), batch_size=32,
+            nkerns=tuple(nkerns), fc_sizes=tuple(fc_sizes) + (N_CLASSES,),
+            n_epochs=n_epochs, selection_counts=[selection_count] * n_layers,
+            activation_func='relu', extra_path='build_bench',
+            should_set_weights=[True] * n_layers, should_eval=True,
+            remaining=remaining, cluster_count=len(train_x),
+            random_state=seed)
+
+    model = ModelWrapper(hyperparams, force_create=[True] * n_layers)
+    model.set_dataset(train_x, train_y, test_x, test_y)
+    model.create_model()
+
+    model.eval_performance()
+    model.test_model()
+    build_accuracy = model.accuracy
+
+    model.train_model()
+    model.test_model()
+
+    return model, build_accuracy, model.accuracy
+
+
+def get_layer_results(report, convergence):
+    """
+    :returns: The build time, peak memory and clustering iterations of every
+    layer keyed by layer name.
+    """
+    layers = {}
+    for name, layer in report['layers'].items():
+        stages = layer['stages']
+        layers[name] = {
+                'seconds': sum(stats['seconds'] for stats in stages.values()),
+                'peak_rss_mb': max([stats['peak_rss_mb'] for stats in
+                    stages.values()] + [0.0]),
+                'stages': {stage: stats['seconds'] for stage, stats in
+                    stages.items()},
+            }
+
+    for layer_index, stats in convergence.items():
+        layer = layers.setdefault('layer%i' % layer_index, {})
+        layer['n_iter'] = stats['n_iter']
+        layer['stop_reason'] = stats['stop_reason']
+
+    return layers
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Benchmark building a model')
+    parser.add_argument('--n', type=int, default=2000,
+            help='Number of synthetic images')
+    parser.add_argument('--c', type=int, default=3, help='Image channels')
+    parser.add_argument('--h', type=int, default=32, help='Image height')
+    parser.add_argument('--w', type=int, default=32, help='Image width')
+    parser.add_argument('--nkerns', type=int, nargs='*', default=[8, 16])
+    parser.add_argument('--fc-sizes', type=int, nargs='*', default=[64])
+    parser.add_argument('--selection-count', type=int, default=None,
+            help='Samples clustered per layer, all by default')
+    parser.add_argument('--remaining', type=int, default=500,
+            help='Samples to train on after the build')
+    parser.add_argument('--n-epochs', type=int, default=1)
+    parser.add_argument('--seed', type=int, default=0)
+    parser.add_argument('--data', default=None,
+            help='Cached npz dataset to use instead of synthetic images')
+    parser.add_argument('--out', default=None,
+            help='Results file, named after the version by default')
+    args = parser.parse_args()
+
+    ph.DISP = False
+    version = get_version()
+
+    if args.data is not None:
+        dataset = load_dataset(args.data)
+        data_config = {'data': args.data}
+    else:
+        dataset = make_dataset(args.n, args.c, args.h, args.w, args.seed)
+        data_config = {'n': args.n, 'c': args.c, 'h': args.h, 'w': args.w}
+
+    config = dict(data_config, nkerns=args.nkerns, fc_sizes=args.fc_sizes,
+            selection_count=args.selection_count, remaining=args.remaining,
+            n_epochs=args.n_epochs, seed=args.seed)
+
+    model, build_accuracy, accuracy = build_model(dataset, args.nkerns,
+            args.fc_sizes, args.selection_count, args.remaining, args.n_epochs,
+            args.seed)
+
+    report = prof.get_report()
+    results = {
+            'version': version,
+            'config': config,
+            'layers': get_layer_results(report, model.get_convergence_stats()),
+            'wall_seconds': report['wall_seconds'],
+            'peak_rss_mb': report['peak_rss_mb'],
+            'build_accuracy': float(build_accuracy),
+            'accuracy': float(accuracy),
+            'profile': report,
+        }
+
+    for name, layer in sorted(results['layers'].items()):
+        print('%-8s %8.3f s %9.1f MB %6s iterations' % (name,
+            layer.get('seconds', 0.0), layer.get('peak_rss_mb', 0.0),
+            str(layer.get('n_iter', '-'))))
+    print('Accuracy %.2f%% after the build, %.2f%% after training' %
+            (build_accuracy * 100., accuracy * 100.))
+
+    out_loc = args.out
+    if out_loc is None:
+        out_loc = os.path.join(RESULTS_DIR, 'build_%s.json' % version)
+    out_dir = os.path.dirname(out_loc)
+    if out_dir != '' and not os.path.exists(out_dir):
+        os.makedirs(out_dir)
+    with open(out_loc, 'w') as f:
+        json.dump(results, f, indent=4, sort_keys=True)
+    print('Saved the results to %s' % out_loc)
+
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
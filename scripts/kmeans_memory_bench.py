@@ -0,0 +1,70 @@
+"""
+Memory benchmark for the custom k-means engine.
+
+Clusters the same random data as float32 and float64 and reports the peak
+memory numpy allocated on top of the input. Every working buffer follows the
+dtype of X, so the float32 peak should be about half of the float64 one. More
+than that means X or one of the buffers was upcast somewhere.
+
+Run from the repository root with the Cython extensions built:
+    python -m scripts.kmeans_memory_bench
+"""
+import sys
+import time
+import tracemalloc
+
+import numpy as np
+
+from custom_kmeans.k_means_ import KMeans
+
+
+N_SAMPLES = 200000
+N_FEATURES = 27
+N_CLUSTERS = 32
+MAX_FLOAT32_RATIO = 0.6
+
+
+def measure(X, algorithm):
+    """
+    Fit once and return the peak traced memory in bytes and the time taken.
+    Numpy reports its allocations to tracemalloc.
+    """
+    km = KMeans(n_clusters=N_CLUSTERS, algorithm=algorithm, n_init=1,
+            max_iter=20, copy_x=False, precompute_distances=False,
+            random_state=0)
+
+    tracemalloc.start()
+    start = time.time()
+    km.fit(X)
+    elapsed = time.time() - start
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+
+    assert km.cluster_centers_.dtype == X.dtype, 'Centers were upcast'
+
+    return peak, elapsed
+
+
+def main():
+    X64 = np.random.RandomState(0).rand(N_SAMPLES, N_FEATURES)
+    X32 = X64.astype(np.float32)
+
+    failed = False
+    for algorithm in ['full', 'elkan', 'spherical']:
+        peak32, time32 = measure(X32.copy(), algorithm)
+        peak64, time64 = measure(X64.copy(), algorithm)
+
+        print('%-10s float32 peak %7.1f MB %6.2f s | float64 peak %7.1f MB %6.2f s' %
+                (algorithm, peak32 / 1e6, time32, peak64 / 1e6, time64))
+
+        # Leave some room for the int32 labels which do not shrink.
+        if peak32 > MAX_FLOAT32_RATIO * peak64:
+            print('--%s float32 peak is %.2f of the float64 peak' %
+                    (algorithm, float(peak32) / peak64))
+            failed = True
+
+    return 1 if failed else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
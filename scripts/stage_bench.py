@@ -0,0 +1,239 @@
+"""
+Benchmarks of the stages of the clustering pipeline on synthetic data.
+
+Every stage is timed on random images of a configurable size so nothing has
+to be downloaded. The time, throughput and peak memory numpy allocated on top
+of the input are reported for each stage. Memory used by worker processes is
+not included.
+
+The results are compared against a stored baseline taken with the same
+configuration. A stage more than REGRESSION_RATIO times slower than its
+baseline fails the run.
+
+Run from the repository root:
+    python -m scripts.stage_bench --n 2000 --c 3 --h 32 --w 32 --k 32
+    python -m scripts.stage_bench --save-baseline
+"""
+import argparse
+import json
+import os
+import sys
+import time
+import tracemalloc
+
+import numpy as np
+from keras.layers.core import Activation
+from keras.layers.core import Dense
+from keras.models import Sequential
+from keras.utils import np_utils
+
+from clustering import build_layer_cluster_vecs
+from clustering import build_patch_vecs
+from clustering import get_image_patches
+from clustering import kmeans
+from helpers.cluster_quality import QualityScorer
+from helpers.convergence import ConvergenceMonitor
+from helpers.hyper_params import HyperParamData
+from helpers.layer_predictor import closest_anchors
+from helpers.mathhelper import get_closest_vectors
+from helpers.printhelper import PrintHelper as ph
+from model_layers.discriminatory_filter import DiscriminatoryFilter
+from model_wrapper import ModelWrapper
+
+
+BASELINE_LOC = 'data/benchmarks/stage_baseline.json'
+REGRESSION_RATIO = 1.25
+KMEANS_METRICS = ['km', 'sp', 'mbk']
+# The clustering is run on at most this many of the patch vectors.
+MAX_CLUSTER_VECS = 20000
+N_CLASSES = 10
+FILTER_SIZE = (3, 3)
+STRIDE = (1, 1)
+
+
+def measure(f, *args, **kwargs):
+    """
+    Call f once and return its result, the time it took and the peak traced
+    memory in bytes. Numpy reports its allocations to tracemalloc.
+    """
+    tracemalloc.start()
+    start = time.time()
+    result = f(*args, **kwargs)
+    elapsed = time.time() - start
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+
+    return result, elapsed, peak
+
+
+def make_dataset(n, c, h, w, seed):
+    """
+    Random images with random one hot labels.
+    """
+    random_state = np.random.RandomState(seed)
+    images = random_state.rand(n, c, h, w).astype(np.float32)
+    labels = random_state.randint(N_CLASSES, size=n)
+    return images, np_utils.to_categorical(labels, N_CLASSES)
+
+
+def build_eval_wrapper(images, labels, seed):
+    """
+    A ModelWrapper around a single random dense layer, enough for
+    eval_performance to map its predictions to the labels.
+    """
+    hyperparams = HyperParamData(input_shape=images.shape[1:], subsample=STRIDE,
+            patches_subsample=STRIDE, filter_size=FILTER_SIZE, batch_size=32,
+            nkerns=(), fc_sizes=(N_CLASSES,), n_epochs=1, selection_counts=[None],
+            activation_func='relu', extra_path='bench', should_set_weights=[False],
+            should_eval=True, remaining=0, cluster_count=len(images))
+
+    np.random.seed(seed)
+    model = Sequential()
+    model.add(Dense(N_CLASSES, input_dim=int(np.prod(images.shape[1:]))))
+    model.add(Activation('softmax'))
+
+    wrapper = ModelWrapper(hyperparams, force_create=[True])
+    wrapper.model = model
+    wrapper.all_train_x = images.reshape(len(images), -1)
+    wrapper.all_train_y = labels
+    wrapper.all_test_x = wrapper.all_train_x
+    wrapper.all_test_y = labels
+    return wrapper
+
+
+def run_stages(n, c, h, w, k, seed):
+    """
+    :returns: The time, throughput and peak memory of every stage keyed by
+    stage name.
+    """
+    images, labels = make_dataset(n, c, h, w, seed)
+    input_shape = images.shape[1:]
+    results = {}
+
+    def record(name, n_items, elapsed, peak):
+        results[name] = {
+                'seconds': elapsed,
+                'items_per_second': n_items / max(elapsed, 1e-9),
+                'peak_mb': peak / 1e6,
+            }
+        print('%-22s %8.3f s %12.1f items/s %9.1f MB' % (name, elapsed,
+            results[name]['items_per_second'], results[name]['peak_mb']))
+
+    _, elapsed, peak = measure(lambda: [get_image_patches(image, input_shape,
+        STRIDE, FILTER_SIZE) for image in images])
+    record('get_image_patches', n, elapsed, peak)
+
+    _, elapsed, peak = measure(build_patch_vecs, images, input_shape, STRIDE,
+            FILTER_SIZE)
+    record('build_patch_vecs', n, elapsed, peak)
+
+    cluster_vecs = build_layer_cluster_vecs(images, input_shape, STRIDE,
+            FILTER_SIZE, True)
+
+    filter_params = DiscriminatoryFilter(len(cluster_vecs) // 4)
+    sorted_vecs, elapsed, peak = measure(filter_params.get_sorted, cluster_vecs, 0)
+    record('get_sorted', len(cluster_vecs), elapsed, peak)
+
+    random_state = np.random.RandomState(seed)
+    if len(cluster_vecs) > MAX_CLUSTER_VECS:
+        cluster_vecs = cluster_vecs[random_state.choice(len(cluster_vecs),
+            MAX_CLUSTER_VECS, replace=False)]
+
+    scorer = QualityScorer(mode='none')
+    for metric in KMEANS_METRICS:
+        np.random.seed(seed)
+        kmeans_out, elapsed, peak = measure(kmeans, cluster_vecs, k, 100,
+                metric=metric, scorer=scorer)
+        record('kmeans_' + metric, len(cluster_vecs), elapsed, peak)
+    centers = kmeans_out[0]
+
+    # The step by step fit recur_apply_kmeans uses when a time budget or a
+    # custom tolerance is set.
+    hyperparams = HyperParamData(input_shape=input_shape, subsample=STRIDE,
+            patches_subsample=STRIDE, filter_size=FILTER_SIZE, batch_size=100,
+            nkerns=(k,), fc_sizes=(), n_epochs=1, selection_counts=[None],
+            activation_func='relu', extra_path='bench', should_set_weights=[True],
+            should_eval=False, remaining=0, cluster_count=n)
+    monitor = ConvergenceMonitor(max_iter=hyperparams.cluster_max_iter,
+            tol=hyperparams.cluster_tol,
+            time_budget=hyperparams.cluster_time_budget)
+    np.random.seed(seed)
+    _, elapsed, peak = measure(kmeans, cluster_vecs, k, 100, metric='sp',
+            monitor=monitor, scorer=scorer)
+    record('kmeans_sp_monitored', len(cluster_vecs), elapsed, peak)
+
+    _, elapsed, peak = measure(get_closest_vectors, centers,
+            list(zip(cluster_vecs, np.zeros(len(cluster_vecs)))))
+    record('get_closest_vectors', len(cluster_vecs), elapsed, peak)
+
+    _, elapsed, peak = measure(closest_anchors, centers, cluster_vecs)
+    record('closest_anchors', len(cluster_vecs), elapsed, peak)
+
+    wrapper = build_eval_wrapper(images, labels, seed)
+    _, elapsed, peak = measure(wrapper.eval_performance)
+    record('eval_performance', n, elapsed, peak)
+
+    return results
+
+
+def compare(results, baseline, ratio=REGRESSION_RATIO):
+    """
+    :returns: The names of the stages that are more than ratio times slower
+    than their baseline.
+    """
+    regressions = []
+    for name, stats in sorted(results.items()):
+        if name not in baseline:
+            continue
+        base_seconds = baseline[name]['seconds']
+        if stats['seconds'] > ratio * base_seconds:
+            print('--%s took %.3f s, the baseline is %.3f s' % (name,
+                stats['seconds'], base_seconds))
+            regressions.append(name)
+    return regressions
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Benchmark the pipeline stages')
+    parser.add_argument('--n', type=int, default=2000, help='Number of images')
+    parser.add_argument('--c', type=int, default=3, help='Image channels')
+    parser.add_argument('--h', type=int, default=32, help='Image height')
+    parser.add_argument('--w', type=int, default=32, help='Image width')
+    parser.add_argument('--k', type=int, default=32, help='Number of clusters')
+    parser.add_argument('--seed', type=int, default=0)
+    parser.add_argument('--baseline', default=BASELINE_LOC)
+    parser.add_argument('--save-baseline', action='store_true',
+            help='Store the results as the new baseline')
+    args = parser.parse_args()
+
+    ph.DISP = False
+    config = {'n': args.n, 'c': args.c, 'h': args.h, 'w': args.w, 'k': args.k,
+            'seed': args.seed}
+    results = run_stages(**config)
+
+    if args.save_baseline:
+        baseline_dir = os.path.dirname(args.baseline)
+        if baseline_dir != '' and not os.path.exists(baseline_dir):
+            os.makedirs(baseline_dir)
+        with open(args.baseline, 'w') as f:
+            json.dump({'config': config, 'results': results}, f, indent=4,
+                    sort_keys=True)
+        print('Saved the baseline to %s' % args.baseline)
+        return 0
+
+    if not os.path.exists(args.baseline):
+        print('No baseline at %s to compare against' % args.baseline)
+        return 0
+
+    with open(args.baseline, 'r') as f:
+        baseline = json.load(f)
+    if baseline['config'] != config:
+        print('The baseline was taken with %s, not comparing' %
+                str(baseline['config']))
+        return 0
+
+    return 1 if len(compare(results, baseline['results'])) > 0 else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
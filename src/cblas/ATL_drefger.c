@@ -1,147 +0,0 @@
-/* ---------------------------------------------------------------------
- *
- * -- Automatically Tuned Linear Algebra Software (ATLAS)
- *    (C) Copyright 2000 All Rights Reserved
- *
- * -- ATLAS routine -- Version 3.9.24 -- December 25, 2000
- *
- * Author         : Antoine P. Petitet
- * Originally developed at the University of Tennessee,
- * Innovative Computing Laboratory, Knoxville TN, 37996-1301, USA.
- *
- * ---------------------------------------------------------------------
- *
- * -- Copyright notice and Licensing terms:
- *
- *  Redistribution  and  use in  source and binary forms, with or without
- *  modification, are  permitted provided  that the following  conditions
- *  are met:
- *
- * 1. Redistributions  of  source  code  must retain the above copyright
- *    notice, this list of conditions and the following disclaimer.
- * 2. Redistributions in binary form must reproduce  the above copyright
- *    notice,  this list of conditions, and the  following disclaimer in
- *    the documentation and/or other materials provided with the distri-
- *    bution.
- * 3. The name of the University,  the ATLAS group,  or the names of its
- *    contributors  may not be used to endorse or promote products deri-
- *    ved from this software without specific written permission.
- *
- * -- Disclaimer:
- *
- * THIS  SOFTWARE  IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS
- * ``AS IS'' AND ANY EXPRESS OR IMPLIED WARRANTIES,  INCLUDING,  BUT NOT
- * LIMITED TO, THE IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR
- * A PARTICULAR PURPOSE ARE DISCLAIMED. IN NO EVENT SHALL THE UNIVERSITY
- * OR CONTRIBUTORS BE LIABLE FOR ANY DIRECT,  INDIRECT, INCIDENTAL, SPE-
- * CIAL, EXEMPLARY, OR CONSEQUENTIAL DAMAGES (INCLUDING, BUT NOT LIMITED
- * TO,  PROCUREMENT  OF SUBSTITUTE GOODS OR SERVICES; LOSS OF USE, DATA,
- * OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER CAUSED AND ON ANY THEO-
- * RY OF LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY, OR TORT  (IN-
- * CLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE OF
- * THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
- *
- * ---------------------------------------------------------------------
- */
-/*
- * Include files
- */
-#include "atlas_refmisc.h"
-#include "atlas_reflvl2.h"
-#include "atlas_reflevel2.h"
-
-void ATL_drefger
-(
-   const int                  M,
-   const int                  N,
-   const double               ALPHA,
-   const double               * X,
-   const int                  INCX,
-   const double               * Y,
-   const int                  INCY,
-   double                     * A,
-   const int                  LDA
-)
-{
-/*
- * Purpose
- * =======
- *
- * ATL_drefger performs the rank 1 operation
- *
- *    A := alpha * x * y' + A,
- *
- * where alpha is a scalar,  x is an m-element vector, y is an n-element
- * vector and A is an m by n matrix.
- *
- * Arguments
- * =========
- *
- * M       (input)                       const int
- *         On entry,  M  specifies the number of rows of  the matrix  A.
- *         M must be at least zero. Unchanged on exit.
- *
- * N       (input)                       const int
- *         On entry, N  specifies the number of columns of the matrix A.
- *         N  must be at least zero. Unchanged on exit.
- *
- * ALPHA   (input)                       const double
- *         On entry, ALPHA specifies the scalar alpha.   When  ALPHA  is
- *         supplied as zero then the arrays X and Y need not be set on
- *         input. Unchanged on exit.
- *
- * X       (input)                       const double *
- *         On entry,  X  points to the  first entry to be accessed of an
- *         incremented array of size equal to or greater than
- *            ( 1 + ( m - 1 ) * abs( INCX ) ) * sizeof(   double  ),
- *         that contains the vector x. Unchanged on exit.
- *
- * INCX    (input)                       const int
- *         On entry, INCX specifies the increment for the elements of X.
- *         INCX must not be zero. Unchanged on exit.
- *
- * Y       (input)                       const double *
- *         On entry,  Y  points to the  first entry to be accessed of an
- *         incremented array of size equal to or greater than
- *            ( 1 + ( n - 1 ) * abs( INCY ) ) * sizeof(   double  ),
- *         that contains the vector y. Unchanged on exit.
- *
- * INCY    (input)                       const int
- *         On entry, INCY specifies the increment for the elements of Y.
- *         INCY must not be zero. Unchanged on exit.
- *
- * A       (input/output)                double *
- *         On entry,  A  points  to an array of size equal to or greater
- *         than   LDA * n * sizeof(   double  ).  Before entry, the lea-
- *         ding  m by n  part of the array  A  must  contain the  matrix
- *         coefficients.  On exit,  A  is overwritten by the updated ma-
- *         trix.
- *
- * LDA     (input)                       const int
- *         On entry, LDA  specifies the first dimension of A as declared
- *         in the calling (sub) program. LDA must be at least  max(1,m).
- *         Unchanged on exit.
- *
- * ---------------------------------------------------------------------
- */
-/*
- * .. Local Variables ..
- */
-   register double            t0;
-   int                        i, iaij, ix, j, jaj, jy;
-/* ..
- * .. Executable Statements ..
- *
- */
-   if( ( M == 0 ) || ( N == 0 ) || ( ALPHA == ATL_dZERO ) ) return;
-
-   for( j = 0, jaj = 0, jy = 0; j < N; j++, jaj += LDA, jy += INCY )
-   {
-      t0 = ALPHA * Y[jy];
-      for( i = 0, iaij = jaj, ix = 0; i < M; i++, iaij += 1, ix += INCX )
-      { A[iaij] += X[ix] * t0; }
-   }
-/*
- * End of ATL_drefger
- */
-}
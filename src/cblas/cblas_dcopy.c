@@ -1,52 +0,0 @@
-/*
- *             Automatically Tuned Linear Algebra Software v3.9.25
- *                    (C) Copyright 1999 R. Clint Whaley
- *
- * Redistribution and use in source and binary forms, with or without
- * modification, are permitted provided that the following conditions
- * are met:
- *   1. Redistributions of source code must retain the above copyright
- *      notice, this list of conditions and the following disclaimer.
- *   2. Redistributions in binary form must reproduce the above copyright
- *      notice, this list of conditions, and the following disclaimer in the
- *      documentation and/or other materials provided with the distribution.
- *   3. The name of the ATLAS group or the names of its contributers may
- *      not be used to endorse or promote products derived from this
- *      software without specific written permission.
- *
- * THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS
- * ``AS IS'' AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED
- * TO, THE IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR
- * PURPOSE ARE DISCLAIMED. IN NO EVENT SHALL THE ATLAS GROUP OR ITS CONTRIBUTORS
- * BE LIABLE FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL, EXEMPLARY, OR
- * CONSEQUENTIAL DAMAGES (INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF
- * SUBSTITUTE GOODS OR SERVICES; LOSS OF USE, DATA, OR PROFITS; OR BUSINESS
- * INTERRUPTION) HOWEVER CAUSED AND ON ANY THEORY OF LIABILITY, WHETHER IN
- * CONTRACT, STRICT LIABILITY, OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE)
- * ARISING IN ANY WAY OUT OF THE USE OF THIS SOFTWARE, EVEN IF ADVISED OF THE
- * POSSIBILITY OF SUCH DAMAGE.
- *
- */
-
-#define DREAL
-#include "atlas_misc.h"
-#ifdef ATL_USEPTHREADS
-   #include "atlas_ptalias1.h"
-#endif
-#include "atlas_level1.h"
-#include "cblas.h"
-
-void cblas_dcopy(const int N, const double *X, const int incX,
-                      double *Y, const int incY)
-{
-   if (N > 0)
-   {
-      if (incX < 0)
-      {
-         if (incY < 0) ATL_dcopy(N, X, -incX, Y, -incY);
-         else ATL_dcopy(N, X+(1-N)*incX, incX, Y, incY);
-      }
-      else if (incY < 0) ATL_dcopy(N, X+(N-1)*incX, -incX, Y, -incY);
-      else ATL_dcopy(N, X, incX, Y, incY);
-   }
-}
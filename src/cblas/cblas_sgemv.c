@@ -1,102 +0,0 @@
-/*
- *             Automatically Tuned Linear Algebra Software v3.10.3
- *                    (C) Copyright 1999 R. Clint Whaley
- *
- * Redistribution and use in source and binary forms, with or without
- * modification, are permitted provided that the following conditions
- * are met:
- *   1. Redistributions of source code must retain the above copyright
- *      notice, this list of conditions and the following disclaimer.
- *   2. Redistributions in binary form must reproduce the above copyright
- *      notice, this list of conditions, and the following disclaimer in the
- *      documentation and/or other materials provided with the distribution.
- *   3. The name of the ATLAS group or the names of its contributers may
- *      not be used to endorse or promote products derived from this
- *      software without specific written permission.
- *
- * THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS
- * ``AS IS'' AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED
- * TO, THE IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR
- * PURPOSE ARE DISCLAIMED. IN NO EVENT SHALL THE ATLAS GROUP OR ITS CONTRIBUTORS
- * BE LIABLE FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL, EXEMPLARY, OR
- * CONSEQUENTIAL DAMAGES (INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF
- * SUBSTITUTE GOODS OR SERVICES; LOSS OF USE, DATA, OR PROFITS; OR BUSINESS
- * INTERRUPTION) HOWEVER CAUSED AND ON ANY THEORY OF LIABILITY, WHETHER IN
- * CONTRACT, STRICT LIABILITY, OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE)
- * ARISING IN ANY WAY OUT OF THE USE OF THIS SOFTWARE, EVEN IF ADVISED OF THE
- * POSSIBILITY OF SUCH DAMAGE.
- *
- */
-
-#define SREAL
-#include "atlas_misc.h"
-#include "cblas.h"
-#ifdef ATL_USEPTHREADS
-   #include "atlas_ptalias2.h"
-#endif
-#include "atlas_level2.h"
-
-void cblas_sgemv(const enum CBLAS_ORDER Order, const enum CBLAS_TRANSPOSE TA,
-                 const int M, const int N, const float alpha, const float *A,
-                 const int lda, const float *X, const int incX,
-                 const float beta, float *Y, const int incY)
-{
-   int info = 2000;
-   #define x X
-   #define y Y
-
-#ifndef NoCblasErrorChecks
-   if (TA != CblasNoTrans && TA != CblasTrans && TA != CblasConjTrans)
-      info = cblas_errprn(2, info,
-                          "TransA must be %d, %d or %d, but is set to %d",
-                          CblasNoTrans, CblasTrans, CblasConjTrans, TA);
-
-   if (M < 0) info = cblas_errprn(3, info,
-                        "M cannot be less than zero; is set to %d.", M);
-   if (N < 0) info = cblas_errprn(4, info,
-                        "N cannot be less than zero; is set to %d.", N);
-   if (!incX) info = cblas_errprn(9, info,
-                                  "incX cannot be zero; is set to %d.", incX);
-   if (!incY) info = cblas_errprn(12, info,
-                                  "incY cannot be zero; is set to %d.", incY);
-   if (Order == CblasColMajor)
-   {
-      if (lda < M || lda < 1)
-         info = cblas_errprn(7, info, "lda must be >= MAX(M,1): lda=%d M=%d",
-                             lda, M);
-   }
-   else if (Order == CblasRowMajor)
-   {
-      if (lda < N || lda < 1)
-         info = cblas_errprn(7, info, "lda must be >= MAX(N,1): lda=%d N=%d",
-                             lda, N);
-   }
-   else
-      info = cblas_errprn(1, info, "Order must be %d or %d, but is set to %d",
-                          CblasRowMajor, CblasColMajor, Order);
-   if (info != 2000)
-   {
-      cblas_xerbla(info, "cblas_sgemv", "");
-      return;
-   }
-#endif
-   if (TA == AtlasNoTrans)
-   {
-      if (incX < 0) x += (1-N)*incX;
-      if (incY < 0) y += (1-M)*incY;
-   }
-   else
-   {
-      if (incX < 0) x += (1-M)*incX;
-      if (incY < 0) y += (1-N)*incY;
-   }
-   if (Order == CblasColMajor)
-      ATL_sgemv(TA, M, N, alpha, A, lda, x, incX, beta, y, incY);
-   else
-   {
-      if (TA == CblasNoTrans)
-         ATL_sgemv(CblasTrans, N, M, alpha, A, lda, x, incX, beta, y, incY);
-      else
-         ATL_sgemv(CblasNoTrans, N, M, alpha, A, lda, x, incX, beta, y, incY);
-   }
-}
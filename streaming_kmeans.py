@@ -0,0 +1,324 @@
+import numpy as np
+import scipy.sparse as sp
+import sklearn.preprocessing as preprocessing
+from sklearn.utils import check_random_state
+
+from helpers.printhelper import PrintHelper as ph
+from helpers.convergence import ConvergenceMonitor
+
+
+# The default number of vectors read from disk at a time.
+BLOCK_SIZE = 10000
+
+
+def open_vecs_memmap(filename, shape=None, dtype=np.float32):
+    """
+    Open a memory mapped .npy file holding one cluster vector per row.
+
+    :param shape: If given a new file of this shape is created and opened for
+    writing. Otherwise the existing file is opened read only.
+
+    :returns: The memory mapped array.
+    """
+    if shape is not None:
+        return np.lib.format.open_memmap(filename, mode='w+', dtype=dtype,
+                shape=shape)
+    return np.load(filename, mmap_mode='r')
+
+
+def iter_blocks(n_samples, block_size=BLOCK_SIZE):
+    """
+    Generate the slices that split n_samples rows into blocks.
+    """
+    for start in range(0, n_samples, block_size):
+        yield slice(start, min(start + block_size, n_samples))
+
+
+def read_block(X, block, spherical):
+    """
+    Read a block of rows into memory as a contiguous float32 array.
+    For spherical clustering the rows are projected onto the unit sphere.
+    """
+    block_data = np.ascontiguousarray(X[block], dtype=np.float32)
+    if spherical:
+        block_data = preprocessing.normalize(block_data, norm='l2', copy=False)
+    return block_data
+
+
+class StreamingKMeans(object):
+    """
+    Out-of-core k-means. The data is only ever touched one block of rows at a
+    time so the input can be a memory mapped file that is far larger than the
+    available memory. Both the standard (Lloyd) and the spherical variant are
+    supported. Unless given the initial centers are picked with k-means++ on a
+    random subset of the data.
+    """
+
+    def __init__(self, n_clusters, spherical=True, block_size=BLOCK_SIZE,
+            max_iter=100, tol=1e-4, init_size=None, random_state=None,
+            init=None):
+        """
+        Constructor
+
+        :param n_clusters: The number of clusters.
+        :param spherical: Cluster with the cosine similarity on the unit sphere.
+        :param block_size: The number of rows read into memory at a time.
+        :param max_iter: The maximum number of full passes over the data.
+        :param tol: Stop once the squared center shift falls below this.
+        :param init_size: The number of samples used for the k-means++ seeding.
+        Defaults to 10 samples per cluster.
+        :param init: Optional array of shape (n_clusters, n_features) with the
+        initial centers. Replaces the k-means++ seeding.
+        """
+        self.n_clusters   = n_clusters
+        self.spherical    = spherical
+        self.block_size   = block_size
+        self.max_iter     = max_iter
+        self.tol          = tol
+        self.init_size    = init_size
+        self.random_state = random_state
+        self.init         = init
+
+
+    def fit(self, X, monitor=None):
+        """
+        Cluster the rows of X.
+
+        :param X: Array like of shape (n_samples, n_features). Typically a
+        np.memmap opened with open_vecs_memmap.
+        :param monitor: Optional ConvergenceMonitor called after every pass.
+        Defaults to stopping at max_iter or once the squared center shift
+        falls below tol. Kept as monitor_.
+
+        :returns: self
+        """
+        n_samples = X.shape[0]
+        if n_samples < self.n_clusters:
+            raise ValueError('n_samples=%i should be >= n_clusters=%i' %
+                    (n_samples, self.n_clusters))
+
+        if monitor is None:
+            monitor = ConvergenceMonitor(max_iter=self.max_iter, tol=None,
+                    shift_tol=self.tol)
+
+        random_state = check_random_state(self.random_state)
+        centers = self._init_centers(X, random_state)
+        labels = np.empty(n_samples, dtype=np.int32)
+
+        should_stop = False
+        while not should_stop:
+            sums, counts, inertia = self._accumulate(X, centers, labels)
+            new_centers = self._centers_from_sums(sums, counts, centers)
+
+            center_shift = np.sum((new_centers - centers) ** 2)
+            centers = new_centers
+
+            ph.disp('----Pass %i, inertia %.4f, center shift %.6f' % (
+                monitor.n_iter, inertia, center_shift))
+
+            should_stop = monitor(inertia, center_shift, labels)
+
+        self.cluster_centers_ = centers
+        self.n_iter_ = monitor.n_iter
+        self.monitor_ = monitor
+        self.labels_, self.inertia_ = self._labels_inertia(X)
+        self.counts_ = np.bincount(self.labels_, minlength=self.n_clusters)
+
+        return self
+
+
+    def partial_fit(self, X):
+        """
+        Update the clustering with a batch of new rows. Every center moves to
+        the mean of all the samples assigned to it so far, the ones it was
+        fitted on included. An unfitted model is fitted on the batch instead.
+
+        :returns: self, with labels_ and inertia_ for the batch.
+        """
+        if not hasattr(self, 'cluster_centers_'):
+            return self.fit(X)
+
+        labels = np.empty(X.shape[0], dtype=np.int32)
+        sums, counts, _ = self._accumulate(X, self.cluster_centers_, labels)
+
+        # The old centers stand in for the sums of the samples already seen.
+        sums += self.cluster_centers_ * self.counts_[:, np.newaxis]
+        counts += self.counts_
+
+        self.cluster_centers_ = self._centers_from_sums(sums, counts,
+                self.cluster_centers_)
+        self.counts_ = counts
+        self.labels_, self.inertia_ = self._labels_inertia(X)
+
+        return self
+
+
+    def predict(self, X):
+        """
+        Get the index of the closest cluster for each row of X.
+        """
+        return self._labels_inertia(X)[0]
+
+
+    def _init_centers(self, X, random_state):
+        """
+        k-means++ seeding on a random subset of the data. The subset indices
+        are sorted so the reads from a memory map stay sequential.
+        """
+        if self.init is not None:
+            centers = np.array(self.init, dtype=np.float32)
+            if centers.shape != (self.n_clusters, X.shape[1]):
+                raise ValueError('init has shape %s, expected %s' %
+                        (str(centers.shape), str((self.n_clusters, X.shape[1]))))
+            if self.spherical:
+                centers = preprocessing.normalize(centers, norm='l2', copy=False)
+            return centers
+
+        n_samples = X.shape[0]
+        init_size = self.init_size
+        if init_size is None:
+            init_size = 10 * self.n_clusters
+        init_size = max(min(init_size, n_samples), self.n_clusters)
+
+        init_indices = np.sort(random_state.choice(n_samples, init_size,
+            replace=False))
+        init_data = read_block(X, init_indices, self.spherical)
+
+        return self._k_init(init_data, random_state)
+
+
+    def _k_init(self, X, random_state):
+        """
+        Greedy k-means++ over an in memory sample.
+        """
+        n_samples = X.shape[0]
+        n_local_trials = 2 + int(np.log(self.n_clusters))
+
+        centers = np.empty((self.n_clusters, X.shape[1]), dtype=X.dtype)
+        centers[0] = X[random_state.randint(n_samples)]
+
+        closest_dist = self._distances(X, centers[0:1])[:, 0]
+        current_pot = closest_dist.sum()
+
+        for c in range(1, self.n_clusters):
+            rand_vals = random_state.random_sample(n_local_trials) * current_pot
+            candidate_ids = np.searchsorted(np.cumsum(closest_dist, dtype=np.float64),
+                    rand_vals)
+            candidate_ids = np.minimum(candidate_ids, n_samples - 1)
+
+            candidate_dists = np.minimum(closest_dist[:, np.newaxis],
+                    self._distances(X, X[candidate_ids]))
+            candidate_pots = candidate_dists.sum(axis=0)
+            best = np.argmin(candidate_pots)
+
+            centers[c] = X[candidate_ids[best]]
+            closest_dist = candidate_dists[:, best]
+            current_pot = candidate_pots[best]
+
+        return centers
+
+
+    def _distances(self, X, centers):
+        """
+        The distance of each row of X to each center. Squared euclidean
+        distance for the standard variant and cosine distance for the
+        spherical variant.
+        """
+        dots = np.dot(X, centers.T)
+        if self.spherical:
+            return np.maximum(1.0 - dots, 0.0)
+
+        x_squared_norms = np.einsum('ij,ij->i', X, X)
+        center_squared_norms = np.einsum('ij,ij->i', centers, centers)
+        dists = x_squared_norms[:, np.newaxis] - 2.0 * dots
+        dists += center_squared_norms[np.newaxis, :]
+        return np.maximum(dists, 0.0)
+
+
+    def _assign_block(self, block_data, centers):
+        dists = self._distances(block_data, centers)
+        labels = np.argmin(dists, axis=1).astype(np.int32)
+        min_dists = dists[np.arange(len(labels)), labels]
+        return labels, min_dists
+
+
+    def _accumulate(self, X, centers, labels):
+        """
+        One pass over the data assigning each block to the closest centers and
+        accumulating the per cluster sums and counts. The assignment is
+        written to labels.
+        """
+        sums = np.zeros(centers.shape, dtype=np.float64)
+        counts = np.zeros(self.n_clusters, dtype=np.int64)
+        inertia = 0.0
+
+        for block in iter_blocks(X.shape[0], self.block_size):
+            block_data = read_block(X, block, self.spherical)
+            block_labels, min_dists = self._assign_block(block_data, centers)
+            labels[block] = block_labels
+
+            # Sum the rows of each cluster with a sparse indicator matrix.
+            indicator = sp.csr_matrix((np.ones(len(block_labels), dtype=np.float32),
+                (block_labels, np.arange(len(block_labels)))),
+                shape=(self.n_clusters, len(block_labels)))
+            sums += indicator.dot(block_data)
+            counts += np.bincount(block_labels, minlength=self.n_clusters)
+            inertia += min_dists.sum()
+
+        return sums, counts, inertia
+
+
+    def _centers_from_sums(self, sums, counts, old_centers):
+        """
+        The M step. Clusters that lost all of their samples keep their old center.
+        """
+        centers = np.array(old_centers, dtype=np.float32)
+        non_empty = counts > 0
+        centers[non_empty] = sums[non_empty] / counts[non_empty, np.newaxis]
+
+        if self.spherical:
+            centers = preprocessing.normalize(centers, norm='l2', copy=False)
+
+        return centers
+
+
+    def _labels_inertia(self, X):
+        labels = np.empty(X.shape[0], dtype=np.int32)
+        inertia = 0.0
+        for block in iter_blocks(X.shape[0], self.block_size):
+            block_data = read_block(X, block, self.spherical)
+            labels[block], min_dists = self._assign_block(block_data,
+                    self.cluster_centers_)
+            inertia += min_dists.sum()
+        return labels, inertia
+
+
+def streaming_from_predictor(predictor, spherical=True):
+    """
+    Continue a clustering fitted by any k-means implementation with a
+    StreamingKMeans, so it can take new data through partial_fit.
+
+    :param predictor: A fitted estimator with cluster_centers_ and either
+    counts_, the size of each cluster, or labels_.
+
+    :returns: The fitted StreamingKMeans.
+    """
+    centers = np.array(predictor.cluster_centers_, dtype=np.float32)
+    n_clusters = len(centers)
+
+    labels = getattr(predictor, 'labels_', None)
+    counts = getattr(predictor, 'counts_', None)
+    if counts is None and labels is not None:
+        counts = np.bincount(np.asarray(labels), minlength=n_clusters)
+    if counts is None:
+        raise ValueError('The predictor has neither the labels nor the size '
+                'of its clusters to continue from')
+
+    skm = StreamingKMeans(n_clusters, spherical=spherical)
+    skm.cluster_centers_ = centers
+    skm.labels_ = None if labels is None else np.asarray(labels)
+    skm.counts_ = np.asarray(counts)
+    skm.inertia_ = getattr(predictor, 'inertia_', None)
+    skm.n_iter_ = getattr(predictor, 'n_iter_', 0)
+
+    return skm